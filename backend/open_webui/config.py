@@ -909,6 +909,22 @@ AZURE_STORAGE_ENDPOINT = os.environ.get("AZURE_STORAGE_ENDPOINT", None)
 AZURE_STORAGE_CONTAINER_NAME = os.environ.get("AZURE_STORAGE_CONTAINER_NAME", None)
 AZURE_STORAGE_KEY = os.environ.get("AZURE_STORAGE_KEY", None)
 
+# Local copies of S3/GCS/Azure files, total size in bytes (0 disables the limit)
+STORAGE_LOCAL_CACHE_MAX_SIZE = int(
+    os.environ.get("STORAGE_LOCAL_CACHE_MAX_SIZE", str(5 * 1024 * 1024 * 1024))
+)
+# Seconds a local copy is served before its version is checked against the bucket again
+STORAGE_LOCAL_CACHE_REVALIDATE_INTERVAL = int(
+    os.environ.get("STORAGE_LOCAL_CACHE_REVALIDATE_INTERVAL", "300")
+)
+# Redirect file downloads to a presigned S3/GCS/Azure URL instead of proxying them
+STORAGE_PRESIGNED_URL_REDIRECT = (
+    os.environ.get("STORAGE_PRESIGNED_URL_REDIRECT", "false").lower() == "true"
+)
+STORAGE_PRESIGNED_URL_EXPIRY = int(
+    os.environ.get("STORAGE_PRESIGNED_URL_EXPIRY", "3600")
+)
+
 ####################################
 # File Upload DIR
 ####################################
@@ -1997,6 +2013,15 @@ PINECONE_DIMENSION = int(os.getenv("PINECONE_DIMENSION", 1536))  # or 3072, 1024
 PINECONE_METRIC = os.getenv("PINECONE_METRIC", "cosine")
 PINECONE_CLOUD = os.getenv("PINECONE_CLOUD", "aws")  # or "gcp" or "azure"
 
+# Web search results
+# "memory" (per process), "redis" (shared, uses REDIS_URL) or "" to keep them in VECTOR_DB
+WEB_SEARCH_VECTOR_DB = os.environ.get("WEB_SEARCH_VECTOR_DB", "memory")
+WEB_SEARCH_VECTOR_DB_TTL = int(os.environ.get("WEB_SEARCH_VECTOR_DB_TTL", "3600"))
+# Total number of chunks kept by the "memory" store, 0 disables the limit
+WEB_SEARCH_VECTOR_DB_MAX_ITEMS = int(
+    os.environ.get("WEB_SEARCH_VECTOR_DB_MAX_ITEMS", "50000")
+)
+
 ####################################
 # Information Retrieval (RAG)
 ####################################
@@ -2201,6 +2226,36 @@ MISTRAL_OCR_API_KEY = PersistentConfig(
     os.getenv("MISTRAL_OCR_API_KEY", ""),
 )
 
+# Extracted documents keyed by file content, extraction engine and its settings
+# "memory" (per process), "disk" (CACHE_DIR/content-extraction), "redis" (shared, uses REDIS_URL) or "" to disable
+CONTENT_EXTRACTION_CACHE = os.environ.get("CONTENT_EXTRACTION_CACHE", "disk")
+# Total size in bytes of the compressed "memory" and "disk" caches, 0 disables the limit
+CONTENT_EXTRACTION_CACHE_MAX_SIZE = int(
+    os.environ.get("CONTENT_EXTRACTION_CACHE_MAX_SIZE", str(1024 * 1024 * 1024))
+)
+# Seconds an extraction is kept after it was cached, 0 keeps it until evicted
+CONTENT_EXTRACTION_CACHE_TTL = int(
+    os.environ.get("CONTENT_EXTRACTION_CACHE_TTL", str(7 * 24 * 3600))
+)
+
+# Files an async batch load sends to OCR and extraction services at once
+CONTENT_EXTRACTION_MAX_CONCURRENT_REQUESTS = int(
+    os.environ.get("CONTENT_EXTRACTION_MAX_CONCURRENT_REQUESTS", "5")
+)
+
+# Processes extracting the pages of large PDFs with the default engine, 0 extracts them in the request thread
+PDF_EXTRACTION_WORKERS = int(os.environ.get("PDF_EXTRACTION_WORKERS", "2"))
+# PDFs with fewer pages are extracted in the request thread
+PDF_EXTRACTION_MIN_PAGES = int(os.environ.get("PDF_EXTRACTION_MIN_PAGES", "50"))
+# Pages handed to a worker at a time
+PDF_EXTRACTION_PAGES_PER_SHARD = int(
+    os.environ.get("PDF_EXTRACTION_PAGES_PER_SHARD", "20")
+)
+# Address space in bytes a worker may use while extracting a file, 0 disables the limit
+PDF_EXTRACTION_WORKER_MAX_MEMORY = int(
+    os.environ.get("PDF_EXTRACTION_WORKER_MAX_MEMORY", "0")
+)
+
 BYPASS_EMBEDDING_AND_RETRIEVAL = PersistentConfig(
     "BYPASS_EMBEDDING_AND_RETRIEVAL",
     "rag.bypass_embedding_and_retrieval",
@@ -2269,6 +2324,29 @@ RAG_ALLOWED_FILE_EXTENSIONS = PersistentConfig(
     ],
 )
 
+# Queue that extracts and embeds uploaded files after the upload has returned,
+# "memory" (per process), "redis" (shared between replicas, uses REDIS_URL) or "" to process during the upload
+FILE_PROCESSING_QUEUE = os.environ.get("FILE_PROCESSING_QUEUE", "")
+# Files processed concurrently by each worker process
+FILE_PROCESSING_QUEUE_WORKERS = int(
+    os.environ.get("FILE_PROCESSING_QUEUE_WORKERS", "2")
+)
+# Queued files beyond which uploads are rejected, 0 disables the limit
+FILE_PROCESSING_QUEUE_MAX_SIZE = int(
+    os.environ.get("FILE_PROCESSING_QUEUE_MAX_SIZE", "1000")
+)
+# Named priorities an upload may ask for with ?priority=, lower runs first
+try:
+    FILE_PROCESSING_PRIORITIES = json.loads(
+        os.environ.get("FILE_PROCESSING_PRIORITIES", '{"chat": 0, "knowledge": 10}')
+    )
+except Exception as e:
+    log.exception(f"Error loading FILE_PROCESSING_PRIORITIES: {e}")
+    FILE_PROCESSING_PRIORITIES = {"chat": 0, "knowledge": 10}
+FILE_PROCESSING_DEFAULT_PRIORITY = int(
+    os.environ.get("FILE_PROCESSING_DEFAULT_PRIORITY", "5")
+)
+
 RAG_EMBEDDING_ENGINE = PersistentConfig(
     "RAG_EMBEDDING_ENGINE",
     "rag.embedding_engine",
@@ -2314,6 +2392,24 @@ RAG_EMBEDDING_PREFIX_FIELD_NAME = os.environ.get(
     "RAG_EMBEDDING_PREFIX_FIELD_NAME", None
 )
 
+# Milliseconds concurrent embedding calls wait for others to share a batch, 0 disables batching
+RAG_EMBEDDING_BATCHER_MAX_WAIT_MS = float(
+    os.environ.get("RAG_EMBEDDING_BATCHER_MAX_WAIT_MS", "5")
+)
+# Batches sent to the embedding engine at the same time
+RAG_EMBEDDING_BATCHER_MAX_CONCURRENT_BATCHES = int(
+    os.environ.get("RAG_EMBEDDING_BATCHER_MAX_CONCURRENT_BATCHES", "4")
+)
+
+# Concurrent inference calls per local embedding or reranking model
+RAG_LOCAL_INFERENCE_MAX_CONCURRENCY = int(
+    os.environ.get("RAG_LOCAL_INFERENCE_MAX_CONCURRENCY", "1")
+)
+# Inference calls waiting per local model before new ones are rejected, 0 for unbounded
+RAG_LOCAL_INFERENCE_QUEUE_SIZE = int(
+    os.environ.get("RAG_LOCAL_INFERENCE_QUEUE_SIZE", "64")
+)
+
 RAG_RERANKING_ENGINE = PersistentConfig(
     "RAG_RERANKING_ENGINE",
     "rag.reranking_engine",
@@ -2541,6 +2637,47 @@ WEB_SEARCH_TRUST_ENV = PersistentConfig(
     os.getenv("WEB_SEARCH_TRUST_ENV", "False").lower() == "true",
 )
 
+# Page cache for the safe_web loader
+# "memory" (per process), "disk" (CACHE_DIR/web-page), "redis" (shared, uses REDIS_URL) or "" to disable
+WEB_LOADER_CACHE = os.environ.get("WEB_LOADER_CACHE", "memory")
+# Pages are kept at most this long after they were last fetched or revalidated
+WEB_LOADER_CACHE_TTL = int(os.environ.get("WEB_LOADER_CACHE_TTL", "86400"))
+# Pages younger than this are served without revalidating them with ETag/Last-Modified
+WEB_LOADER_CACHE_FRESH_TTL = int(os.environ.get("WEB_LOADER_CACHE_FRESH_TTL", "600"))
+# Total size in bytes of the "memory" and "disk" caches, 0 disables the limit
+WEB_LOADER_CACHE_MAX_SIZE = int(
+    os.environ.get("WEB_LOADER_CACHE_MAX_SIZE", str(256 * 1024 * 1024))
+)
+
+# Bytes read from a single page before it is truncated, 0 disables the limit
+WEB_LOADER_MAX_BYTES = int(os.environ.get("WEB_LOADER_MAX_BYTES", str(2 * 1024 * 1024)))
+# Seconds allowed to load a single page, and to load all pages of a search (0 disables)
+WEB_LOADER_URL_TIMEOUT = float(os.environ.get("WEB_LOADER_URL_TIMEOUT", "15"))
+WEB_LOADER_TIMEOUT = float(os.environ.get("WEB_LOADER_TIMEOUT", "30"))
+# Pages fetched concurrently from the same host
+WEB_LOADER_CONCURRENT_REQUESTS_PER_DOMAIN = int(
+    os.environ.get("WEB_LOADER_CONCURRENT_REQUESTS_PER_DOMAIN", "2")
+)
+
+# Search engine result cache, "memory" (per process), "disk" (CACHE_DIR/web-search), "redis" (shared) or "" to disable
+WEB_SEARCH_RESULT_CACHE = os.environ.get("WEB_SEARCH_RESULT_CACHE", "memory")
+WEB_SEARCH_RESULT_CACHE_TTL = int(os.environ.get("WEB_SEARCH_RESULT_CACHE_TTL", "3600"))
+# Number of queries kept by the "memory" cache, 0 disables the limit
+WEB_SEARCH_RESULT_CACHE_MAX_ENTRIES = int(
+    os.environ.get("WEB_SEARCH_RESULT_CACHE_MAX_ENTRIES", "1000")
+)
+
+# Requests per second sent to a search engine, 0 disables the limit
+WEB_SEARCH_RATE_LIMIT = float(os.environ.get("WEB_SEARCH_RATE_LIMIT", "0"))
+# Per-engine overrides as JSON, e.g. {"brave": 1, "google_pse": 5}
+try:
+    WEB_SEARCH_ENGINE_RATE_LIMITS = json.loads(
+        os.environ.get("WEB_SEARCH_ENGINE_RATE_LIMITS", "{}")
+    )
+except Exception as e:
+    log.exception(f"Error loading WEB_SEARCH_ENGINE_RATE_LIMITS: {e}")
+    WEB_SEARCH_ENGINE_RATE_LIMITS = {}
+
 
 SEARXNG_QUERY_URL = PersistentConfig(
     "SEARXNG_QUERY_URL",
@@ -81,6 +81,7 @@ if "cuda_error" in locals():
 
 log_sources = [
     "AUDIO",
+    "CHANNELS",
     "COMFYUI",
     "CONFIG",
     "DB",
@@ -457,6 +458,153 @@ AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL = (
     os.environ.get("AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL", "True").lower() == "true"
 )
 
+# Connection pool size of the shared aiohttp sessions (see utils/http_client.py)
+HTTP_CLIENT_POOL_LIMIT = os.environ.get("HTTP_CLIENT_POOL_LIMIT", "100")
+
+try:
+    HTTP_CLIENT_POOL_LIMIT = int(HTTP_CLIENT_POOL_LIMIT)
+except Exception:
+    HTTP_CLIENT_POOL_LIMIT = 100
+
+HTTP_CLIENT_POOL_LIMIT_PER_HOST = os.environ.get("HTTP_CLIENT_POOL_LIMIT_PER_HOST", "0")
+
+try:
+    HTTP_CLIENT_POOL_LIMIT_PER_HOST = int(HTTP_CLIENT_POOL_LIMIT_PER_HOST)
+except Exception:
+    HTTP_CLIENT_POOL_LIMIT_PER_HOST = 0
+
+
+####################################
+# IMAGE GENERATION
+####################################
+
+# Maximum number of concurrent upstream requests / uploads for a single generation
+IMAGE_GENERATION_MAX_CONCURRENCY = os.environ.get(
+    "IMAGE_GENERATION_MAX_CONCURRENCY", "4"
+)
+
+try:
+    IMAGE_GENERATION_MAX_CONCURRENCY = max(int(IMAGE_GENERATION_MAX_CONCURRENCY), 1)
+except Exception:
+    IMAGE_GENERATION_MAX_CONCURRENCY = 4
+
+####################################
+# KNOWLEDGE REINDEX
+####################################
+
+# Number of files embedded concurrently by the background reindex job
+KNOWLEDGE_REINDEX_MAX_WORKERS = os.environ.get("KNOWLEDGE_REINDEX_MAX_WORKERS", "4")
+
+try:
+    KNOWLEDGE_REINDEX_MAX_WORKERS = max(int(KNOWLEDGE_REINDEX_MAX_WORKERS), 1)
+except Exception:
+    KNOWLEDGE_REINDEX_MAX_WORKERS = 4
+
+####################################
+# TOOLS
+####################################
+
+# Maximum number of tool calls from a single model turn that run concurrently
+TOOL_CALL_MAX_CONCURRENCY = os.environ.get("TOOL_CALL_MAX_CONCURRENCY", "4")
+
+try:
+    TOOL_CALL_MAX_CONCURRENCY = max(int(TOOL_CALL_MAX_CONCURRENCY), 1)
+except Exception:
+    TOOL_CALL_MAX_CONCURRENCY = 4
+
+# Default timeout in seconds for a single tool call, tools may set their own
+TOOL_CALL_TIMEOUT = os.environ.get("TOOL_CALL_TIMEOUT", "")
+
+if TOOL_CALL_TIMEOUT == "":
+    TOOL_CALL_TIMEOUT = None
+else:
+    try:
+        TOOL_CALL_TIMEOUT = int(TOOL_CALL_TIMEOUT)
+    except Exception:
+        TOOL_CALL_TIMEOUT = 300
+
+# Seconds a compiled tool is used before its version is checked against the database
+TOOL_REGISTRY_CACHE_TTL = os.environ.get("TOOL_REGISTRY_CACHE_TTL", "10")
+
+try:
+    TOOL_REGISTRY_CACHE_TTL = max(int(TOOL_REGISTRY_CACHE_TTL), 0)
+except Exception:
+    TOOL_REGISTRY_CACHE_TTL = 10
+
+
+####################################
+# CODE INTERPRETER
+####################################
+
+# Started Jupyter kernels kept ready for executions, 0 starts one per execution
+CODE_INTERPRETER_JUPYTER_POOL_SIZE = os.environ.get(
+    "CODE_INTERPRETER_JUPYTER_POOL_SIZE", "2"
+)
+
+try:
+    CODE_INTERPRETER_JUPYTER_POOL_SIZE = max(int(CODE_INTERPRETER_JUPYTER_POOL_SIZE), 0)
+except Exception:
+    CODE_INTERPRETER_JUPYTER_POOL_SIZE = 2
+
+# Maximum number of kernels alive on the Jupyter server at once
+CODE_INTERPRETER_JUPYTER_MAX_KERNELS = os.environ.get(
+    "CODE_INTERPRETER_JUPYTER_MAX_KERNELS", "20"
+)
+
+try:
+    CODE_INTERPRETER_JUPYTER_MAX_KERNELS = max(
+        int(CODE_INTERPRETER_JUPYTER_MAX_KERNELS), 1
+    )
+except Exception:
+    CODE_INTERPRETER_JUPYTER_MAX_KERNELS = 20
+
+# Keep one kernel per chat so variables persist across turns
+CODE_INTERPRETER_JUPYTER_KERNEL_PER_CHAT = (
+    os.environ.get("CODE_INTERPRETER_JUPYTER_KERNEL_PER_CHAT", "False").lower()
+    == "true"
+)
+
+# Seconds a chat kernel may stay unused before it is shut down
+CODE_INTERPRETER_JUPYTER_KERNEL_IDLE_TIMEOUT = os.environ.get(
+    "CODE_INTERPRETER_JUPYTER_KERNEL_IDLE_TIMEOUT", "600"
+)
+
+try:
+    CODE_INTERPRETER_JUPYTER_KERNEL_IDLE_TIMEOUT = int(
+        CODE_INTERPRETER_JUPYTER_KERNEL_IDLE_TIMEOUT
+    )
+except Exception:
+    CODE_INTERPRETER_JUPYTER_KERNEL_IDLE_TIMEOUT = 600
+
+
+####################################
+# SPEECH CACHE
+####################################
+
+# Maximum size of the synthesised speech cache in megabytes, 0 disables the limit
+SPEECH_CACHE_MAX_SIZE_MB = os.environ.get("SPEECH_CACHE_MAX_SIZE_MB", "1024")
+
+try:
+    SPEECH_CACHE_MAX_SIZE_MB = int(SPEECH_CACHE_MAX_SIZE_MB)
+except Exception:
+    SPEECH_CACHE_MAX_SIZE_MB = 1024
+
+# Seconds since last access after which a cached clip is dropped, 0 disables expiry
+SPEECH_CACHE_TTL = os.environ.get("SPEECH_CACHE_TTL", str(60 * 60 * 24 * 30))
+
+try:
+    SPEECH_CACHE_TTL = int(SPEECH_CACHE_TTL)
+except Exception:
+    SPEECH_CACHE_TTL = 60 * 60 * 24 * 30
+
+# Number of sentences synthesised concurrently by the sentence-level speech endpoint
+SPEECH_SENTENCE_CONCURRENCY = os.environ.get("SPEECH_SENTENCE_CONCURRENCY", "4")
+
+try:
+    SPEECH_SENTENCE_CONCURRENCY = max(int(SPEECH_SENTENCE_CONCURRENCY), 1)
+except Exception:
+    SPEECH_SENTENCE_CONCURRENCY = 4
+
 
 ####################################
 # SENTENCE TRANSFORMERS
@@ -502,6 +650,16 @@ else:
     except Exception:
         SENTENCE_TRANSFORMERS_CROSS_ENCODER_MODEL_KWARGS = None
 
+# Int8 quantization of the local models on ONNX Runtime, by CPU instruction set:
+# arm64, avx2, avx512 or avx512_vnni. Empty keeps the configured backend.
+# ColBERT rerankers are quantized with torch on CPU when the latter is set.
+SENTENCE_TRANSFORMERS_QUANTIZATION = os.environ.get(
+    "SENTENCE_TRANSFORMERS_QUANTIZATION", ""
+)
+SENTENCE_TRANSFORMERS_CROSS_ENCODER_QUANTIZATION = os.environ.get(
+    "SENTENCE_TRANSFORMERS_CROSS_ENCODER_QUANTIZATION", ""
+)
+
 ####################################
 # OFFLINE_MODE
 ####################################
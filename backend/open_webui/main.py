@@ -395,6 +395,7 @@ from open_webui.env import (  # 导入环境变量
     SRC_LOG_LEVELS,  # 源日志级别
     VERSION,  # 版本
     INSTANCE_ID,  # 实例ID
+    UVICORN_WORKERS,  # Uvicorn工作进程数
     WEBUI_BUILD_HASH,  # WebUI构建哈希
     WEBUI_SECRET_KEY,  # WebUI秘密密钥
     WEBUI_SESSION_COOKIE_SAME_SITE,  # WebUI会话Cookie相同站点
@@ -437,6 +438,10 @@ from open_webui.utils.plugin import install_tool_and_function_dependencies  # 
 from open_webui.utils.oauth import OAuthManager  # 导入OAuth管理器
 from open_webui.utils.security_headers import SecurityHeadersMiddleware  # 导入安全头中间件
 from open_webui.utils.redis import get_redis_connection  # 导入Redis连接
+from open_webui.utils.http_client import close_http_sessions  # 导入共享HTTP会话关闭函数
+from open_webui.utils.reindex import KNOWLEDGE_REINDEX_JOB  # 导入知识库后台重建索引任务
+from open_webui.utils.code_interpreter import close_kernel_pools  # 导入Jupyter内核池关闭函数
+from open_webui.utils.file_processing import FILE_PROCESSING_JOBS  # 导入上传文件后台处理队列
 
 from open_webui.tasks import (  # 导入任务相关功能
     redis_task_command_listener,  # Redis任务命令监听器
@@ -524,11 +529,25 @@ async def lifespan(app: FastAPI):
 
     asyncio.create_task(periodic_usage_pool_cleanup())
 
+    # 单进程部署时自动恢复因重启中断的知识库重建索引任务
+    if UVICORN_WORKERS == 1:
+        KNOWLEDGE_REINDEX_JOB.resume(app)
+
+    # 启动上传文件的后台处理工作者
+    if FILE_PROCESSING_JOBS is not None:
+        FILE_PROCESSING_JOBS.start(app)
+
     yield
 
     if hasattr(app.state, "redis_task_command_listener"):
         app.state.redis_task_command_listener.cancel()
 
+    if FILE_PROCESSING_JOBS is not None:
+        await FILE_PROCESSING_JOBS.stop()
+
+    await close_http_sessions()
+    await close_kernel_pools()
+
 
 app = FastAPI(
     title="Open WebUI",
@@ -0,0 +1,89 @@
+"""Add channel_access table
+
+Revision ID: d31026856c01
+Revises: 9f0c9cd09105
+Create Date: 2025-06-02 03:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.sql import table, column
+
+import json
+
+revision = "d31026856c01"
+down_revision = "9f0c9cd09105"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "channel_access",
+        sa.Column("channel_id", sa.Text(), nullable=False, primary_key=True),
+        sa.Column(
+            "permission", sa.Text(), nullable=False, primary_key=True
+        ),  # "read" or "write"
+        sa.Column(
+            "principal_type", sa.Text(), nullable=False, primary_key=True
+        ),  # "user", "group" or "public"
+        sa.Column("principal_id", sa.Text(), nullable=False, primary_key=True),
+    )
+
+    op.create_index(
+        "channel_access_principal_idx",
+        "channel_access",
+        ["principal_type", "principal_id", "permission"],
+    )
+
+    # Backfill the index from the access_control of existing channels
+    channel = table(
+        "channel",
+        column("id", sa.Text()),
+        column("access_control", sa.JSON()),
+    )
+    channel_access = table(
+        "channel_access",
+        column("channel_id", sa.Text()),
+        column("permission", sa.Text()),
+        column("principal_type", sa.Text()),
+        column("principal_id", sa.Text()),
+    )
+
+    conn = op.get_bind()
+    rows = {}
+    for channel_id, access_control in conn.execute(
+        sa.select(channel.c.id, channel.c.access_control)
+    ):
+        if isinstance(access_control, str):
+            access_control = json.loads(access_control)
+
+        if access_control is None:
+            rows[(channel_id, "read", "public", "*")] = True
+            continue
+
+        for permission in ["read", "write"]:
+            permission_access = access_control.get(permission) or {}
+            for principal_type, key in [("user", "user_ids"), ("group", "group_ids")]:
+                for principal_id in permission_access.get(key) or []:
+                    rows[(channel_id, permission, principal_type, principal_id)] = True
+
+    if rows:
+        op.bulk_insert(
+            channel_access,
+            [
+                {
+                    "channel_id": channel_id,
+                    "permission": permission,
+                    "principal_type": principal_type,
+                    "principal_id": principal_id,
+                }
+                for channel_id, permission, principal_type, principal_id in rows
+            ],
+        )
+
+
+def downgrade():
+    op.drop_index("channel_access_principal_idx", table_name="channel_access")
+    op.drop_table("channel_access")
@@ -0,0 +1,32 @@
+"""Add composite indexes for keyset pagination
+
+Revision ID: e4a1c2d9b7f3
+Revises: d31026856c01
+Create Date: 2025-06-03 02:00:00.000000
+
+"""
+
+from alembic import op
+
+revision = "e4a1c2d9b7f3"
+down_revision = "d31026856c01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "message_channel_parent_created_idx",
+        "message",
+        ["channel_id", "parent_id", "created_at", "id"],
+    )
+    op.create_index(
+        "chat_user_updated_idx",
+        "chat",
+        ["user_id", "updated_at", "id"],
+    )
+
+
+def downgrade():
+    op.drop_index("chat_user_updated_idx", table_name="chat")
+    op.drop_index("message_channel_parent_created_idx", table_name="message")
@@ -0,0 +1,65 @@
+"""Add group_member table
+
+Revision ID: f7b3d9a2c5e1
+Revises: e4a1c2d9b7f3
+Create Date: 2025-06-04 02:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.sql import table, column
+
+import json
+import time
+
+revision = "f7b3d9a2c5e1"
+down_revision = "e4a1c2d9b7f3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "group_member",
+        sa.Column("group_id", sa.Text(), nullable=False, primary_key=True),
+        sa.Column("user_id", sa.Text(), nullable=False, primary_key=True),
+        sa.Column("created_at", sa.BigInteger(), nullable=True),
+    )
+
+    op.create_index(
+        "group_member_user_idx",
+        "group_member",
+        ["user_id", "group_id"],
+    )
+
+    # Backfill memberships from the user_ids JSON column of existing groups
+    group = table(
+        "group",
+        column("id", sa.Text()),
+        column("user_ids", sa.JSON()),
+    )
+    group_member = table(
+        "group_member",
+        column("group_id", sa.Text()),
+        column("user_id", sa.Text()),
+        column("created_at", sa.BigInteger()),
+    )
+
+    conn = op.get_bind()
+    now = int(time.time())
+    rows = []
+    for group_id, user_ids in conn.execute(sa.select(group.c.id, group.c.user_ids)):
+        if isinstance(user_ids, str):
+            user_ids = json.loads(user_ids)
+
+        for user_id in dict.fromkeys(user_ids or []):
+            rows.append({"group_id": group_id, "user_id": user_id, "created_at": now})
+
+    if rows:
+        op.bulk_insert(group_member, rows)
+
+
+def downgrade():
+    op.drop_index("group_member_user_idx", table_name="group_member")
+    op.drop_table("group_member")
@@ -4,10 +4,10 @@ import uuid
 from typing import Optional
 
 from open_webui.internal.db import Base, get_db
-from open_webui.utils.access_control import has_access
+from open_webui.models.groups import Groups
 
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import BigInteger, Boolean, Column, String, Text, JSON
+from sqlalchemy import BigInteger, Boolean, Column, Index, String, Text, JSON
 from sqlalchemy import or_, func, select, and_, text
 from sqlalchemy.sql import exists
 
@@ -34,6 +34,57 @@ class Channel(Base):
     updated_at = Column(BigInteger)
 
 
+class ChannelAccess(Base):
+    """
+    Flattened copy of `Channel.access_control`, one row per (permission,
+    principal). Lets channel listing resolve visible channels with an indexed
+    lookup instead of evaluating `has_access` against every channel.
+    """
+
+    __tablename__ = "channel_access"
+
+    channel_id = Column(Text, primary_key=True)
+    permission = Column(Text, primary_key=True)  # "read" | "write"
+    principal_type = Column(Text, primary_key=True)  # "user" | "group" | "public"
+    principal_id = Column(Text, primary_key=True)
+
+    __table_args__ = (
+        Index(
+            "channel_access_principal_idx",
+            "principal_type",
+            "principal_id",
+            "permission",
+        ),
+    )
+
+
+def get_channel_access_rows(channel_id: str, access_control: Optional[dict]) -> list:
+    """Expand an access_control dict into ChannelAccess rows."""
+    if access_control is None:
+        # No access control means the channel is readable by everyone
+        return [
+            {
+                "channel_id": channel_id,
+                "permission": "read",
+                "principal_type": "public",
+                "principal_id": "*",
+            }
+        ]
+
+    rows = {}
+    for permission in ["read", "write"]:
+        permission_access = access_control.get(permission) or {}
+        for principal_type, key in [("user", "user_ids"), ("group", "group_ids")]:
+            for principal_id in permission_access.get(key) or []:
+                rows[(permission, principal_type, principal_id)] = {
+                    "channel_id": channel_id,
+                    "permission": permission,
+                    "principal_type": principal_type,
+                    "principal_id": principal_id,
+                }
+    return list(rows.values())
+
+
 class ChannelModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -66,6 +117,12 @@ class ChannelForm(BaseModel):
 
 
 class ChannelTable:
+    def _set_channel_access(self, db, channel_id: str, access_control: Optional[dict]):
+        db.query(ChannelAccess).filter(ChannelAccess.channel_id == channel_id).delete()
+        rows = get_channel_access_rows(channel_id, access_control)
+        if rows:
+            db.bulk_insert_mappings(ChannelAccess, rows)
+
     def insert_new_channel(
         self, type: Optional[str], form_data: ChannelForm, user_id: str
     ) -> Optional[ChannelModel]:
@@ -85,6 +142,7 @@ class ChannelTable:
             new_channel = Channel(**channel.model_dump())
 
             db.add(new_channel)
+            self._set_channel_access(db, channel.id, channel.access_control)
             db.commit()
             return channel
 
@@ -96,13 +154,39 @@ class ChannelTable:
     def get_channels_by_user_id(
         self, user_id: str, permission: str = "read"
     ) -> list[ChannelModel]:
-        channels = self.get_channels()
-        return [
-            channel
-            for channel in channels
-            if channel.user_id == user_id
-            or has_access(user_id, permission, channel.access_control)
+        group_ids = Groups.get_group_ids_by_member_id(user_id)
+
+        principal_filters = [
+            and_(
+                ChannelAccess.principal_type == "user",
+                ChannelAccess.principal_id == user_id,
+            ),
+            ChannelAccess.principal_type == "public",
         ]
+        if group_ids:
+            principal_filters.append(
+                and_(
+                    ChannelAccess.principal_type == "group",
+                    ChannelAccess.principal_id.in_(group_ids),
+                )
+            )
+
+        with get_db() as db:
+            accessible_channel_ids = select(ChannelAccess.channel_id).where(
+                ChannelAccess.permission == permission,
+                or_(*principal_filters),
+            )
+            channels = (
+                db.query(Channel)
+                .filter(
+                    or_(
+                        Channel.user_id == user_id,
+                        Channel.id.in_(accessible_channel_ids),
+                    )
+                )
+                .all()
+            )
+            return [ChannelModel.model_validate(channel) for channel in channels]
 
     def get_channel_by_id(self, id: str) -> Optional[ChannelModel]:
         with get_db() as db:
@@ -123,12 +207,14 @@ class ChannelTable:
             channel.access_control = form_data.access_control
             channel.updated_at = int(time.time_ns())
 
+            self._set_channel_access(db, id, form_data.access_control)
             db.commit()
             return ChannelModel.model_validate(channel) if channel else None
 
     def delete_channel_by_id(self, id: str):
         with get_db() as db:
             db.query(Channel).filter(Channel.id == id).delete()
+            db.query(ChannelAccess).filter(ChannelAccess.channel_id == id).delete()
             db.commit()
             return True
 
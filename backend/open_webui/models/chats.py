@@ -9,7 +9,7 @@ from open_webui.models.tags import TagModel, Tag, Tags
 from open_webui.env import SRC_LOG_LEVELS
 
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import BigInteger, Boolean, Column, String, Text, JSON
+from sqlalchemy import BigInteger, Boolean, Column, Index, String, Text, JSON
 from sqlalchemy import or_, func, select, and_, text
 from sqlalchemy.sql import exists
 
@@ -39,6 +39,11 @@ class Chat(Base):
     meta = Column(JSON, server_default="{}")
     folder_id = Column(Text, nullable=True)
 
+    __table_args__ = (
+        # Serves the per-user chat list ordered by most recent activity
+        Index("chat_user_updated_idx", "user_id", "updated_at", "id"),
+    )
+
 
 class ChatModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -104,6 +109,11 @@ class ChatTitleIdResponse(BaseModel):
     created_at: int
 
 
+class ChatTitleIdListResponse(BaseModel):
+    items: list[ChatTitleIdResponse]
+    next_cursor: Optional[str] = None
+
+
 class ChatTable:
     def insert_new_chat(self, user_id: str, form_data: ChatForm) -> Optional[ChatModel]:
         with get_db() as db:
@@ -420,29 +430,47 @@ class ChatTable:
         filter: Optional[dict] = None,
         skip: int = 0,
         limit: int = 50,
+        before: Optional[tuple[int, str]] = None,
     ) -> list[ChatModel]:
+        """
+        `before` switches to keyset pagination on (updated_at, id), newest
+        first; it cannot be combined with a custom `order_by`.
+        """
         with get_db() as db:
             query = db.query(Chat).filter_by(user_id=user_id)
             if not include_archived:
                 query = query.filter_by(archived=False)
 
-            if filter:
-                query_key = filter.get("query")
-                if query_key:
-                    query = query.filter(Chat.title.ilike(f"%{query_key}%"))
+            filter = filter or {}
 
-                order_by = filter.get("order_by")
-                direction = filter.get("direction")
+            if before:
+                if filter.get("order_by"):
+                    raise ValueError("Cursor pagination only supports default ordering")
 
-                if order_by and direction and getattr(Chat, order_by):
-                    if direction.lower() == "asc":
-                        query = query.order_by(getattr(Chat, order_by).asc())
-                    elif direction.lower() == "desc":
-                        query = query.order_by(getattr(Chat, order_by).desc())
-                    else:
-                        raise ValueError("Invalid direction for ordering")
+                updated_at, id = before
+                query = query.filter(
+                    or_(
+                        Chat.updated_at < updated_at,
+                        and_(Chat.updated_at == updated_at, Chat.id < id),
+                    )
+                )
+
+            query_key = filter.get("query")
+            if query_key:
+                query = query.filter(Chat.title.ilike(f"%{query_key}%"))
+
+            order_by = filter.get("order_by")
+            direction = filter.get("direction")
+
+            if order_by and direction and getattr(Chat, order_by):
+                if direction.lower() == "asc":
+                    query = query.order_by(getattr(Chat, order_by).asc())
+                elif direction.lower() == "desc":
+                    query = query.order_by(getattr(Chat, order_by).desc())
+                else:
+                    raise ValueError("Invalid direction for ordering")
             else:
-                query = query.order_by(Chat.updated_at.desc())
+                query = query.order_by(Chat.updated_at.desc(), Chat.id.desc())
 
             if skip:
                 query = query.offset(skip)
@@ -458,7 +486,13 @@ class ChatTable:
         include_archived: bool = False,
         skip: Optional[int] = None,
         limit: Optional[int] = None,
+        before: Optional[tuple[int, str]] = None,
     ) -> list[ChatTitleIdResponse]:
+        """
+        `before` is the (updated_at, id) of the last chat of the previous page,
+        for keyset pagination: deep pages cost the same as the first one and
+        chats updated while paging do not shift later pages.
+        """
         with get_db() as db:
             query = db.query(Chat).filter_by(user_id=user_id).filter_by(folder_id=None)
             query = query.filter(or_(Chat.pinned == False, Chat.pinned == None))
@@ -466,9 +500,18 @@ class ChatTable:
             if not include_archived:
                 query = query.filter_by(archived=False)
 
-            query = query.order_by(Chat.updated_at.desc()).with_entities(
-                Chat.id, Chat.title, Chat.updated_at, Chat.created_at
-            )
+            if before:
+                updated_at, id = before
+                query = query.filter(
+                    or_(
+                        Chat.updated_at < updated_at,
+                        and_(Chat.updated_at == updated_at, Chat.id < id),
+                    )
+                )
+
+            query = query.order_by(
+                Chat.updated_at.desc(), Chat.id.desc()
+            ).with_entities(Chat.id, Chat.title, Chat.updated_at, Chat.created_at)
 
             if skip:
                 query = query.offset(skip)
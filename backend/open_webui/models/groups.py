@@ -11,7 +11,7 @@ from open_webui.models.files import FileMetadataResponse
 
 
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import BigInteger, Column, String, Text, JSON, func
+from sqlalchemy import BigInteger, Column, Index, Text, JSON
 
 
 log = logging.getLogger(__name__)
@@ -41,6 +41,23 @@ class Group(Base):
     updated_at = Column(BigInteger)
 
 
+class GroupMember(Base):
+    """
+    Normalised group membership, one row per (group, user).
+
+    Mirrors `Group.user_ids`, which stays the API representation, so member
+    lookups are index scans instead of string matching over the JSON column.
+    """
+
+    __tablename__ = "group_member"
+
+    group_id = Column(Text, primary_key=True)
+    user_id = Column(Text, primary_key=True)
+    created_at = Column(BigInteger)
+
+    __table_args__ = (Index("group_member_user_idx", "user_id", "group_id"),)
+
+
 class GroupModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     id: str
@@ -88,6 +105,26 @@ class GroupUpdateForm(GroupForm):
 
 
 class GroupTable:
+    def _set_group_members(self, db, group_id: str, user_ids: Optional[list[str]]):
+        db.query(GroupMember).filter_by(group_id=group_id).delete()
+
+        now = int(time.time())
+        db.add_all(
+            [
+                GroupMember(group_id=group_id, user_id=user_id, created_at=now)
+                for user_id in dict.fromkeys(user_ids or [])
+            ]
+        )
+
+    def _update_group_user_ids(self, db, group_id: str, user_ids: list[str]):
+        db.query(Group).filter_by(id=group_id).update(
+            {
+                "user_ids": user_ids,
+                "updated_at": int(time.time()),
+            }
+        )
+        self._set_group_members(db, group_id, user_ids)
+
     def insert_new_group(
         self, user_id: str, form_data: GroupForm
     ) -> Optional[GroupModel]:
@@ -105,6 +142,7 @@ class GroupTable:
             try:
                 result = Group(**group.model_dump())
                 db.add(result)
+                self._set_group_members(db, result.id, group.user_ids)
                 db.commit()
                 db.refresh(result)
                 if result:
@@ -127,16 +165,44 @@ class GroupTable:
             return [
                 GroupModel.model_validate(group)
                 for group in db.query(Group)
-                .filter(
-                    func.json_array_length(Group.user_ids) > 0
-                )  # Ensure array exists
-                .filter(
-                    Group.user_ids.cast(String).like(f'%"{user_id}"%')
-                )  # String-based check
+                .join(GroupMember, GroupMember.group_id == Group.id)
+                .filter(GroupMember.user_id == user_id)
                 .order_by(Group.updated_at.desc())
                 .all()
             ]
 
+    def get_group_ids_by_member_id(self, user_id: str) -> list[str]:
+        with get_db() as db:
+            return [
+                group_id
+                for (group_id,) in db.query(GroupMember.group_id)
+                .filter(GroupMember.user_id == user_id)
+                .all()
+            ]
+
+    def get_group_permissions_by_member_id(self, user_id: str) -> list[dict]:
+        with get_db() as db:
+            return [
+                permissions or {}
+                for (permissions,) in db.query(Group.permissions)
+                .join(GroupMember, GroupMember.group_id == Group.id)
+                .filter(GroupMember.user_id == user_id)
+                .all()
+            ]
+
+    def get_user_ids_by_group_ids(self, group_ids: list[str]) -> set[str]:
+        if not group_ids:
+            return set()
+
+        with get_db() as db:
+            return {
+                user_id
+                for (user_id,) in db.query(GroupMember.user_id)
+                .filter(GroupMember.group_id.in_(group_ids))
+                .distinct()
+                .all()
+            }
+
     def get_group_by_id(self, id: str) -> Optional[GroupModel]:
         try:
             with get_db() as db:
@@ -163,6 +229,8 @@ class GroupTable:
                         "updated_at": int(time.time()),
                     }
                 )
+                if form_data.user_ids is not None:
+                    self._set_group_members(db, id, form_data.user_ids)
                 db.commit()
                 return self.get_group_by_id(id=id)
         except Exception as e:
@@ -173,6 +241,7 @@ class GroupTable:
         try:
             with get_db() as db:
                 db.query(Group).filter_by(id=id).delete()
+                db.query(GroupMember).filter_by(group_id=id).delete()
                 db.commit()
                 return True
         except Exception:
@@ -182,6 +251,7 @@ class GroupTable:
         with get_db() as db:
             try:
                 db.query(Group).delete()
+                db.query(GroupMember).delete()
                 db.commit()
 
                 return True
@@ -201,7 +271,9 @@ class GroupTable:
                             "updated_at": int(time.time()),
                         }
                     )
-                    db.commit()
+
+                db.query(GroupMember).filter_by(user_id=user_id).delete()
+                db.commit()
 
                 return True
             except Exception:
@@ -221,23 +293,13 @@ class GroupTable:
                 for group in existing_groups:
                     if group.id not in group_ids:
                         group.user_ids.remove(user_id)
-                        db.query(Group).filter_by(id=group.id).update(
-                            {
-                                "user_ids": group.user_ids,
-                                "updated_at": int(time.time()),
-                            }
-                        )
+                        self._update_group_user_ids(db, group.id, group.user_ids)
 
                 # Add user to new groups
                 for group in groups:
-                    if user_id not in group.user_ids:
-                        group.user_ids.append(user_id)
-                        db.query(Group).filter_by(id=group.id).update(
-                            {
-                                "user_ids": group.user_ids,
-                                "updated_at": int(time.time()),
-                            }
-                        )
+                    user_ids = group.user_ids or []
+                    if user_id not in user_ids:
+                        self._update_group_user_ids(db, group.id, [*user_ids, user_id])
 
                 db.commit()
                 return True
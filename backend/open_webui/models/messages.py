@@ -8,7 +8,7 @@ from open_webui.models.tags import TagModel, Tag, Tags
 
 
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import BigInteger, Boolean, Column, String, Text, JSON
+from sqlalchemy import BigInteger, Boolean, Column, Index, String, Text, JSON
 from sqlalchemy import or_, func, select, and_, text
 from sqlalchemy.sql import exists
 
@@ -52,6 +52,17 @@ class Message(Base):
     created_at = Column(BigInteger)  # time_ns
     updated_at = Column(BigInteger)  # time_ns
 
+    __table_args__ = (
+        # Serves both offset and keyset pagination of channel and thread messages
+        Index(
+            "message_channel_parent_created_idx",
+            "channel_id",
+            "parent_id",
+            "created_at",
+            "id",
+        ),
+    )
+
 
 class MessageModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -150,6 +161,27 @@ class MessageTable:
             )
             return [MessageModel.model_validate(message) for message in all_messages]
 
+    def get_reply_stats_by_message_ids(self, ids: list[str]) -> dict[str, dict]:
+        """Reply count and latest reply time for many messages in one query."""
+        if not ids:
+            return {}
+
+        with get_db() as db:
+            rows = (
+                db.query(
+                    Message.parent_id,
+                    func.count(Message.id),
+                    func.max(Message.created_at),
+                )
+                .filter(Message.parent_id.in_(ids))
+                .group_by(Message.parent_id)
+                .all()
+            )
+            return {
+                parent_id: {"reply_count": count, "latest_reply_at": latest}
+                for parent_id, count, latest in rows
+            }
+
     def get_reply_user_ids_by_message_id(self, id: str) -> list[str]:
         with get_db() as db:
             return [
@@ -158,13 +190,31 @@ class MessageTable:
             ]
 
     def get_messages_by_channel_id(
-        self, channel_id: str, skip: int = 0, limit: int = 50
+        self,
+        channel_id: str,
+        skip: int = 0,
+        limit: int = 50,
+        before: Optional[tuple[int, str]] = None,
     ) -> list[MessageModel]:
+        """
+        `before` is the (created_at, id) of the last message of the previous
+        page, for keyset pagination: the cost does not grow with the page
+        depth and pages stay stable while new messages are posted.
+        """
         with get_db() as db:
+            query = db.query(Message).filter_by(channel_id=channel_id, parent_id=None)
+
+            if before:
+                created_at, id = before
+                query = query.filter(
+                    or_(
+                        Message.created_at < created_at,
+                        and_(Message.created_at == created_at, Message.id < id),
+                    )
+                )
+
             all_messages = (
-                db.query(Message)
-                .filter_by(channel_id=channel_id, parent_id=None)
-                .order_by(Message.created_at.desc())
+                query.order_by(Message.created_at.desc(), Message.id.desc())
                 .offset(skip)
                 .limit(limit)
                 .all()
@@ -243,6 +293,65 @@ class MessageTable:
 
             return [Reactions(**reaction) for reaction in reactions.values()]
 
+    def get_reactions_by_message_ids(
+        self, ids: list[str]
+    ) -> dict[str, list[Reactions]]:
+        """Grouped reactions for many messages in one query."""
+        if not ids:
+            return {}
+
+        with get_db() as db:
+            all_reactions = (
+                db.query(MessageReaction)
+                .filter(MessageReaction.message_id.in_(ids))
+                .order_by(MessageReaction.created_at)
+                .all()
+            )
+
+            reactions_by_message_id = {}
+            for reaction in all_reactions:
+                reactions = reactions_by_message_id.setdefault(reaction.message_id, {})
+                if reaction.name not in reactions:
+                    reactions[reaction.name] = {
+                        "name": reaction.name,
+                        "user_ids": [],
+                        "count": 0,
+                    }
+                reactions[reaction.name]["user_ids"].append(reaction.user_id)
+                reactions[reaction.name]["count"] += 1
+
+            return {
+                message_id: [Reactions(**reaction) for reaction in reactions.values()]
+                for message_id, reactions in reactions_by_message_id.items()
+            }
+
+    def get_message_responses(
+        self, messages: list[MessageModel]
+    ) -> list[MessageResponse]:
+        """
+        Attach reply counts and reactions to a page of messages using a fixed
+        number of queries, regardless of the page size.
+        """
+        ids = [message.id for message in messages]
+        reply_stats = self.get_reply_stats_by_message_ids(ids)
+        reactions = self.get_reactions_by_message_ids(ids)
+
+        return [
+            MessageResponse(
+                **{
+                    **MessageModel.model_validate(message).model_dump(),
+                    "latest_reply_at": reply_stats.get(message.id, {}).get(
+                        "latest_reply_at"
+                    ),
+                    "reply_count": reply_stats.get(message.id, {}).get(
+                        "reply_count", 0
+                    ),
+                    "reactions": reactions.get(message.id, []),
+                }
+            )
+            for message in messages
+        ]
+
     def remove_reaction_by_id_and_user_id_and_name(
         self, id: str, user_id: str, name: str
     ) -> bool:
@@ -1,4 +1,6 @@
+import threading
 import time
+from collections import OrderedDict
 from typing import Optional
 
 from open_webui.internal.db import Base, JSONField, get_db
@@ -102,7 +104,67 @@ class UserUpdateForm(BaseModel):
     password: Optional[str] = None
 
 
+# Bounded LRU of UserNameResponse projections used to hydrate message authors.
+# Entries are invalidated on local updates; the TTL bounds staleness for
+# updates made by other workers.
+USER_NAME_CACHE_SIZE = 2048
+USER_NAME_CACHE_TTL = 60
+
+
 class UsersTable:
+    def __init__(self):
+        self._user_name_cache: OrderedDict[str, tuple[float, UserNameResponse]] = (
+            OrderedDict()
+        )
+        self._user_name_cache_lock = threading.Lock()
+
+    def _invalidate_user_name(self, id: str):
+        with self._user_name_cache_lock:
+            self._user_name_cache.pop(id, None)
+
+    def get_user_names_by_ids(self, user_ids: list[str]) -> dict[str, UserNameResponse]:
+        """
+        Return {user_id: UserNameResponse} for the given ids, serving from the
+        LRU cache and loading all misses with a single query.
+        """
+        now = time.time()
+        result = {}
+        missing = []
+
+        with self._user_name_cache_lock:
+            for user_id in dict.fromkeys(user_ids):
+                cached = self._user_name_cache.get(user_id)
+                if cached and now - cached[0] < USER_NAME_CACHE_TTL:
+                    self._user_name_cache.move_to_end(user_id)
+                    result[user_id] = cached[1]
+                else:
+                    missing.append(user_id)
+
+        if missing:
+            with get_db() as db:
+                rows = (
+                    db.query(User.id, User.name, User.role, User.profile_image_url)
+                    .filter(User.id.in_(missing))
+                    .all()
+                )
+
+            with self._user_name_cache_lock:
+                for id, name, role, profile_image_url in rows:
+                    user_name = UserNameResponse(
+                        id=id,
+                        name=name,
+                        role=role,
+                        profile_image_url=profile_image_url,
+                    )
+                    result[id] = user_name
+                    self._user_name_cache[id] = (now, user_name)
+                    self._user_name_cache.move_to_end(id)
+
+                while len(self._user_name_cache) > USER_NAME_CACHE_SIZE:
+                    self._user_name_cache.popitem(last=False)
+
+        return result
+
     def insert_new_user(
         self,
         id: str,
@@ -275,6 +337,7 @@ class UsersTable:
             with get_db() as db:
                 db.query(User).filter_by(id=id).update({"role": role})
                 db.commit()
+                self._invalidate_user_name(id)
                 user = db.query(User).filter_by(id=id).first()
                 return UserModel.model_validate(user)
         except Exception:
@@ -289,6 +352,7 @@ class UsersTable:
                     {"profile_image_url": profile_image_url}
                 )
                 db.commit()
+                self._invalidate_user_name(id)
 
                 user = db.query(User).filter_by(id=id).first()
                 return UserModel.model_validate(user)
@@ -326,6 +390,7 @@ class UsersTable:
             with get_db() as db:
                 db.query(User).filter_by(id=id).update(updated)
                 db.commit()
+                self._invalidate_user_name(id)
 
                 user = db.query(User).filter_by(id=id).first()
                 return UserModel.model_validate(user)
@@ -363,6 +428,7 @@ class UsersTable:
                     # Delete User
                     db.query(User).filter_by(id=id).delete()
                     db.commit()
+                    self._invalidate_user_name(id)
 
                 return True
             else:
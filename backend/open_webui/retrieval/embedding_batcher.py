@@ -0,0 +1,226 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Optional
+
+from open_webui.config import (
+    RAG_EMBEDDING_BATCHER_MAX_WAIT_MS,
+    RAG_EMBEDDING_BATCHER_MAX_CONCURRENT_BATCHES,
+)
+from open_webui.env import SRC_LOG_LEVELS
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
+
+
+EmbedFunction = Callable[[list[str], Optional[str], Any], list[list[float]]]
+
+
+class EmbeddingRequest:
+    def __init__(
+        self,
+        group: Hashable,
+        embed: EmbedFunction,
+        batch_size: int,
+        texts: list[str],
+        prefix: Optional[str],
+        user: Any,
+    ):
+        self.group = group
+        self.embed = embed
+        self.batch_size = batch_size
+        self.texts = texts
+        self.prefix = prefix
+        self.user = user
+        self.future: Future = Future()
+        self.queued_at = time.monotonic()
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent embedding calls of the whole process into batches.
+
+    A call waits up to `max_wait` seconds for others of the same group (the
+    engine settings, and the user if it is forwarded to the engine) and
+    prefix, and is packed with them into batches of at most the engine's
+    batch size. Each batch is a single call to the engine, its embeddings are
+    handed back to the callers it came from. At most `max_concurrent_batches`
+    batches are in flight.
+    """
+
+    IDLE_TIMEOUT = 60
+
+    def __init__(self, max_wait: float = 0.005, max_concurrent_batches: int = 4):
+        self.max_wait = max_wait
+
+        self._queue: "queue.Queue[EmbeddingRequest]" = queue.Queue()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(max_concurrent_batches, 1),
+            thread_name_prefix="embedding-batch",
+        )
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stats_lock = threading.Lock()
+
+        self._stats = {
+            "requests": 0,
+            "texts": 0,
+            "batches": 0,
+            "max_batch_size": 0,
+            "max_queue_depth": 0,
+            "wait_time": 0.0,
+        }
+
+    def embed(
+        self,
+        group: Hashable,
+        embed: EmbedFunction,
+        batch_size: int,
+        query,
+        prefix: Optional[str] = None,
+        user: Any = None,
+    ):
+        """Embed a text or a list of texts, blocking until the batch ran."""
+        texts = query if isinstance(query, list) else [query]
+        if not texts:
+            return []
+
+        # Large calls are split up front, so their parts can be packed freely
+        requests = [
+            EmbeddingRequest(
+                group, embed, batch_size, texts[i : i + batch_size], prefix, user
+            )
+            for i in range(0, len(texts), batch_size)
+        ]
+        for request in requests:
+            self._queue.put(request)
+        self._ensure_running()
+
+        embeddings = []
+        for request in requests:
+            embeddings.extend(request.future.result())
+        return embeddings if isinstance(query, list) else embeddings[0]
+
+    def _ensure_running(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="embedding-batcher", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            try:
+                first = self._queue.get(timeout=self.IDLE_TIMEOUT)
+            except queue.Empty:
+                with self._lock:
+                    # Requests queued after this check start a new thread
+                    if self._queue.empty():
+                        self._thread = None
+                        return
+                continue
+
+            self._stats["max_queue_depth"] = max(
+                self._stats["max_queue_depth"], self._queue.qsize() + 1
+            )
+
+            # Collect requests until the wait is over or the first group is full
+            pending = [first]
+            size = len(first.texts)
+            deadline = time.monotonic() + self.max_wait
+            while size < first.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                pending.append(request)
+                if request.group == first.group and request.prefix == first.prefix:
+                    size += len(request.texts)
+
+            for batch in self._pack(pending):
+                self._executor.submit(self._run_batch, batch)
+
+    def _pack(self, requests: list[EmbeddingRequest]) -> list[list[EmbeddingRequest]]:
+        groups: dict[Hashable, list[list[EmbeddingRequest]]] = {}
+        for request in requests:
+            key = (request.group, request.prefix)
+            batches = groups.setdefault(key, [[]])
+            if (
+                batches[-1]
+                and sum(len(r.texts) for r in batches[-1]) + len(request.texts)
+                > request.batch_size
+            ):
+                batches.append([])
+            batches[-1].append(request)
+        return [batch for batches in groups.values() for batch in batches]
+
+    def _run_batch(self, batch: list[EmbeddingRequest]):
+        first = batch[0]
+        texts = [text for request in batch for text in request.texts]
+
+        now = time.monotonic()
+        with self._stats_lock:
+            self._stats["requests"] += len(batch)
+            self._stats["texts"] += len(texts)
+            self._stats["batches"] += 1
+            self._stats["max_batch_size"] = max(
+                self._stats["max_batch_size"], len(texts)
+            )
+            self._stats["wait_time"] += sum(
+                now - request.queued_at for request in batch
+            )
+
+        try:
+            embeddings = first.embed(texts, first.prefix, first.user)
+            if embeddings is None or len(embeddings) != len(texts):
+                raise ValueError(
+                    f"Expected {len(texts)} embeddings, got {len(embeddings or [])}"
+                )
+        except Exception as e:
+            log.exception(f"Embedding batch of {len(texts)} texts failed: {e}")
+            for request in batch:
+                request.future.set_exception(e)
+            return
+
+        offset = 0
+        for request in batch:
+            request.future.set_result(embeddings[offset : offset + len(request.texts)])
+            offset += len(request.texts)
+
+    def get_stats(self) -> dict:
+        stats = self._stats
+        return {
+            "queue_depth": self._queue.qsize(),
+            "max_queue_depth": stats["max_queue_depth"],
+            "requests": stats["requests"],
+            "texts": stats["texts"],
+            "batches": stats["batches"],
+            "max_batch_size": stats["max_batch_size"],
+            "avg_batch_size": (
+                stats["texts"] / stats["batches"] if stats["batches"] else 0.0
+            ),
+            "avg_requests_per_batch": (
+                stats["requests"] / stats["batches"] if stats["batches"] else 0.0
+            ),
+            "avg_wait_ms": (
+                stats["wait_time"] * 1000 / stats["requests"]
+                if stats["requests"]
+                else 0.0
+            ),
+        }
+
+
+EMBEDDING_BATCHER = (
+    EmbeddingBatcher(
+        max_wait=RAG_EMBEDDING_BATCHER_MAX_WAIT_MS / 1000,
+        max_concurrent_batches=RAG_EMBEDDING_BATCHER_MAX_CONCURRENT_BATCHES,
+    )
+    if RAG_EMBEDDING_BATCHER_MAX_WAIT_MS > 0
+    else None
+)
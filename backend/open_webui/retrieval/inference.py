@@ -0,0 +1,132 @@
+import logging
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from open_webui.config import (
+    RAG_LOCAL_INFERENCE_MAX_CONCURRENCY,
+    RAG_LOCAL_INFERENCE_QUEUE_SIZE,
+)
+from open_webui.env import SRC_LOG_LEVELS
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
+
+T = TypeVar("T")
+
+
+class InferenceQueueFullError(RuntimeError):
+    pass
+
+
+class ModelExecutor:
+    def __init__(self, name: str, max_concurrency: int, queue_size: int):
+        self.name = name
+        self.max_concurrency = max(max_concurrency, 1)
+        self.queue_size = queue_size
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix=f"inference-{name}",
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._stats = {"calls": 0, "rejected": 0, "max_pending": 0}
+
+    def submit(self, fn: Callable[..., T], *args, **kwargs) -> "Future[T]":
+        with self._lock:
+            if (
+                self.queue_size > 0
+                and self._pending >= self.max_concurrency + self.queue_size
+            ):
+                self._stats["rejected"] += 1
+                raise InferenceQueueFullError(
+                    f"Too many pending inference calls for {self.name}, try again later"
+                )
+            self._pending += 1
+            self._stats["calls"] += 1
+            self._stats["max_pending"] = max(self._stats["max_pending"], self._pending)
+
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._done()
+            raise
+        future.add_done_callback(lambda _: self._done())
+        return future
+
+    def _done(self):
+        with self._lock:
+            self._pending -= 1
+
+    def get_stats(self) -> dict:
+        return {
+            "name": self.name,
+            "max_concurrency": self.max_concurrency,
+            "queue_size": self.queue_size,
+            "running": min(self._pending, self.max_concurrency),
+            "queued": max(self._pending - self.max_concurrency, 0),
+            **self._stats,
+        }
+
+
+class InferenceExecutor:
+    """
+    Runs local model inference (SentenceTransformer, CrossEncoder, ColBERT)
+    on dedicated threads, away from the event loop and the request threadpool.
+
+    Each model gets its own pool of `max_concurrency` threads; torch releases
+    the GIL while it computes, so calls of different models run in parallel.
+    Calls beyond the running ones wait in a queue of at most `queue_size`
+    (0 for unbounded), further calls fail with InferenceQueueFullError.
+    """
+
+    def __init__(self, max_concurrency: int = 1, queue_size: int = 64):
+        self.max_concurrency = max_concurrency
+        self.queue_size = queue_size
+
+        self._lock = threading.Lock()
+        # Keyed by the model object, so models replaced by a config update
+        # drop their executors with them
+        self._executors: "weakref.WeakKeyDictionary[Any, ModelExecutor]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._local = threading.local()
+
+    def _get_executor(self, model: Any) -> ModelExecutor:
+        with self._lock:
+            executor = self._executors.get(model)
+            if executor is None:
+                executor = ModelExecutor(
+                    type(model).__name__, self.max_concurrency, self.queue_size
+                )
+                self._executors[model] = executor
+            return executor
+
+    def run(self, model: Any, fn: Callable[..., T], *args, **kwargs) -> T:
+        """Call `fn` on the executor of `model`, blocking until it returned."""
+        if getattr(self._local, "running", False):
+            # Already on an inference thread, waiting on another would deadlock
+            return fn(*args, **kwargs)
+        return (
+            self._get_executor(model).submit(self._call, fn, *args, **kwargs).result()
+        )
+
+    def _call(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        self._local.running = True
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._local.running = False
+
+    def get_stats(self) -> list[dict]:
+        with self._lock:
+            executors = list(self._executors.values())
+        return [executor.get_stats() for executor in executors]
+
+
+INFERENCE_EXECUTOR = InferenceExecutor(
+    max_concurrency=RAG_LOCAL_INFERENCE_MAX_CONCURRENCY,
+    queue_size=RAG_LOCAL_INFERENCE_QUEUE_SIZE,
+)
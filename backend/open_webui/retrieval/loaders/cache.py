@@ -0,0 +1,92 @@
+import hashlib
+import json
+import logging
+import zlib
+from typing import Optional
+
+from langchain_core.documents import Document
+
+from open_webui.config import (
+    CONTENT_EXTRACTION_CACHE,
+    CONTENT_EXTRACTION_CACHE_MAX_SIZE,
+    CONTENT_EXTRACTION_CACHE_TTL,
+)
+from open_webui.env import SRC_LOG_LEVELS
+from open_webui.utils.cache import Cache, get_cache
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
+
+
+def get_extraction_cache_key(file_hash: str, engine: str, params: dict) -> str:
+    key = json.dumps([file_hash, engine, params], sort_keys=True, default=str)
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def encode_documents(docs: list[Document]) -> bytes:
+    return zlib.compress(
+        json.dumps(
+            [[doc.page_content, doc.metadata] for doc in docs], default=str
+        ).encode()
+    )
+
+
+def decode_documents(data: bytes) -> list[Document]:
+    return [
+        Document(page_content=page_content, metadata=metadata)
+        for page_content, metadata in json.loads(zlib.decompress(data))
+    ]
+
+
+class ExtractionCache:
+    """
+    Documents extracted from a file, keyed by the sha256 of its content and
+    the extraction engine and settings that produced them.
+
+    Entries are stored as compressed JSON. Hits and misses are counted per
+    process.
+    """
+
+    def __init__(self, cache: Cache):
+        self.cache = cache
+
+        self._stats = {"hits": 0, "misses": 0}
+
+    def get(self, key: str) -> Optional[list[Document]]:
+        try:
+            data = self.cache.get(key)
+        except Exception as e:
+            log.warning(f"Failed to read content extraction cache: {e}")
+            data = None
+
+        if data is None:
+            self._stats["misses"] += 1
+            return None
+        self._stats["hits"] += 1
+        return decode_documents(data)
+
+    def set(self, key: str, docs: list[Document]) -> None:
+        try:
+            self.cache.set(key, encode_documents(docs))
+        except Exception as e:
+            log.warning(f"Failed to write content extraction cache: {e}")
+
+    def get_stats(self) -> dict:
+        total = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_ratio": self._stats["hits"] / total if total else 0.0,
+        }
+
+
+def get_extraction_cache(store: str) -> Optional[ExtractionCache]:
+    cache = get_cache(
+        store,
+        "content-extraction",
+        ttl=CONTENT_EXTRACTION_CACHE_TTL,
+        max_size=CONTENT_EXTRACTION_CACHE_MAX_SIZE,
+    )
+    return ExtractionCache(cache) if cache is not None else None
+
+
+EXTRACTION_CACHE = get_extraction_cache(CONTENT_EXTRACTION_CACHE)
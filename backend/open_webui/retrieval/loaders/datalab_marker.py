@@ -1,5 +1,7 @@
 import os
 import time
+import asyncio
+import aiohttp
 import requests
 import logging
 import json
@@ -11,6 +13,10 @@ log = logging.getLogger(__name__)
 
 
 class DatalabMarkerLoader:
+    API_URL = "https://www.datalab.to/api/v1/marker"
+    POLL_INTERVAL = 2
+    MAX_POLLS = 300  # Up to 10 minutes
+
     def __init__(
         self,
         file_path: str,
@@ -80,13 +86,8 @@ class DatalabMarkerLoader:
                 status.HTTP_502_BAD_GATEWAY, detail=f"Invalid JSON: {e}"
             )
 
-    def load(self) -> List[Document]:
-        url = "https://www.datalab.to/api/v1/marker"
-        filename = os.path.basename(self.file_path)
-        mime_type = self._get_mime_type(filename)
-        headers = {"X-Api-Key": self.api_key}
-
-        form_data = {
+    def _get_form_data(self) -> dict:
+        return {
             "langs": self.langs,
             "use_llm": str(self.use_llm).lower(),
             "skip_cache": str(self.skip_cache).lower(),
@@ -97,6 +98,61 @@ class DatalabMarkerLoader:
             "output_format": self.output_format,
         }
 
+    def _get_check_url(self, result: dict) -> str:
+        if not result.get("success"):
+            raise HTTPException(
+                status.HTTP_400_BAD_REQUEST,
+                detail=f"Datalab Marker request failed: {result.get('error', 'Unknown error')}",
+            )
+
+        check_url = result.get("request_check_url")
+        if not check_url:
+            raise HTTPException(
+                status.HTTP_502_BAD_GATEWAY, detail="No request_check_url returned."
+            )
+        return check_url
+
+    def _is_complete(self, poll_result: dict) -> bool:
+        status_val = poll_result.get("status")
+        success_val = poll_result.get("success")
+
+        if status_val == "complete":
+            summary = {
+                k: poll_result.get(k)
+                for k in (
+                    "status",
+                    "output_format",
+                    "success",
+                    "error",
+                    "page_count",
+                    "total_cost",
+                )
+            }
+            log.info(
+                f"Marker processing completed successfully: {json.dumps(summary, indent=2)}"
+            )
+            return True
+
+        if status_val == "failed" or success_val is False:
+            log.error(
+                f"Marker poll failed full response: {json.dumps(poll_result, indent=2)}"
+            )
+            error_msg = (
+                poll_result.get("error")
+                or "Marker returned failure without error message"
+            )
+            raise HTTPException(
+                status.HTTP_400_BAD_REQUEST,
+                detail=f"Marker processing failed: {error_msg}",
+            )
+        return False
+
+    def load(self) -> List[Document]:
+        filename = os.path.basename(self.file_path)
+        mime_type = self._get_mime_type(filename)
+        headers = {"X-Api-Key": self.api_key}
+        form_data = self._get_form_data()
+
         log.info(
             f"Datalab Marker POST request parameters: {{'filename': '{filename}', 'mime_type': '{mime_type}', **{form_data}}}"
         )
@@ -105,7 +161,7 @@ class DatalabMarkerLoader:
             with open(self.file_path, "rb") as f:
                 files = {"file": (filename, f, mime_type)}
                 response = requests.post(
-                    url, data=form_data, files=files, headers=headers
+                    self.API_URL, data=form_data, files=files, headers=headers
                 )
                 response.raise_for_status()
                 result = response.json()
@@ -125,21 +181,10 @@ class DatalabMarkerLoader:
         except Exception as e:
             raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
-        if not result.get("success"):
-            raise HTTPException(
-                status.HTTP_400_BAD_REQUEST,
-                detail=f"Datalab Marker request failed: {result.get('error', 'Unknown error')}",
-            )
+        check_url = self._get_check_url(result)
 
-        check_url = result.get("request_check_url")
-        request_id = result.get("request_id")
-        if not check_url:
-            raise HTTPException(
-                status.HTTP_502_BAD_GATEWAY, detail="No request_check_url returned."
-            )
-
-        for _ in range(300):  # Up to 10 minutes
-            time.sleep(2)
+        for _ in range(self.MAX_POLLS):
+            time.sleep(self.POLL_INTERVAL)
             try:
                 poll_response = requests.get(check_url, headers=headers)
                 poll_response.raise_for_status()
@@ -151,43 +196,84 @@ class DatalabMarkerLoader:
                     status.HTTP_502_BAD_GATEWAY, detail=f"Polling failed: {e}"
                 )
 
-            status_val = poll_result.get("status")
-            success_val = poll_result.get("success")
-
-            if status_val == "complete":
-                summary = {
-                    k: poll_result.get(k)
-                    for k in (
-                        "status",
-                        "output_format",
-                        "success",
-                        "error",
-                        "page_count",
-                        "total_cost",
-                    )
-                }
-                log.info(
-                    f"Marker processing completed successfully: {json.dumps(summary, indent=2)}"
-                )
+            if self._is_complete(poll_result):
                 break
+        else:
+            raise HTTPException(
+                status.HTTP_504_GATEWAY_TIMEOUT, detail="Marker processing timed out"
+            )
 
-            if status_val == "failed" or success_val is False:
-                log.error(
-                    f"Marker poll failed full response: {json.dumps(poll_result, indent=2)}"
-                )
-                error_msg = (
-                    poll_result.get("error")
-                    or "Marker returned failure without error message"
+        return self._get_documents(filename, result.get("request_id"), poll_result)
+
+    async def load_async(self) -> List[Document]:
+        """
+        Same as `load`, but submits and polls without blocking a thread.
+
+        Waiting between polls is an asyncio.sleep, so many files can be in
+        flight on one event loop.
+        """
+        filename = os.path.basename(self.file_path)
+        mime_type = self._get_mime_type(filename)
+        headers = {"X-Api-Key": self.api_key}
+
+        form = aiohttp.FormData()
+        for key, value in self._get_form_data().items():
+            if value is not None:
+                form.add_field(key, value)
+
+        async with aiohttp.ClientSession(headers=headers) as session:
+            try:
+                with open(self.file_path, "rb") as f:
+                    form.add_field("file", f, filename=filename, content_type=mime_type)
+                    async with session.post(self.API_URL, data=form) as response:
+                        response.raise_for_status()
+                        result = await response.json(content_type=None)
+            except FileNotFoundError:
+                raise HTTPException(
+                    status.HTTP_404_NOT_FOUND,
+                    detail=f"File not found: {self.file_path}",
                 )
+            except aiohttp.ClientResponseError as e:
                 raise HTTPException(
                     status.HTTP_400_BAD_REQUEST,
-                    detail=f"Marker processing failed: {error_msg}",
+                    detail=f"Datalab Marker request failed: {e}",
                 )
-        else:
-            raise HTTPException(
-                status.HTTP_504_GATEWAY_TIMEOUT, detail="Marker processing timed out"
-            )
+            except ValueError as e:
+                raise HTTPException(
+                    status.HTTP_502_BAD_GATEWAY, detail=f"Invalid JSON response: {e}"
+                )
+            except Exception as e:
+                raise HTTPException(
+                    status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+                )
+
+            check_url = self._get_check_url(result)
+
+            for _ in range(self.MAX_POLLS):
+                await asyncio.sleep(self.POLL_INTERVAL)
+                try:
+                    async with session.get(check_url) as poll_response:
+                        poll_response.raise_for_status()
+                        poll_result = await poll_response.json(content_type=None)
+                except (aiohttp.ClientResponseError, ValueError) as e:
+                    log.error(f"Polling error: {e}")
+                    raise HTTPException(
+                        status.HTTP_502_BAD_GATEWAY, detail=f"Polling failed: {e}"
+                    )
+
+                if self._is_complete(poll_result):
+                    break
+            else:
+                raise HTTPException(
+                    status.HTTP_504_GATEWAY_TIMEOUT,
+                    detail="Marker processing timed out",
+                )
+
+        return self._get_documents(filename, result.get("request_id"), poll_result)
 
+    def _get_documents(
+        self, filename: str, request_id: Optional[str], poll_result: dict
+    ) -> List[Document]:
         if not poll_result.get("success", False):
             error_msg = poll_result.get("error") or "Unknown processing error"
             raise HTTPException(
@@ -1,8 +1,10 @@
+import asyncio
 import requests
 import logging
 import ftfy
 import sys
 import json
+from typing import Optional, Union
 
 from langchain_community.document_loaders import (
     AzureAIDocumentIntelligenceLoader,
@@ -22,13 +24,26 @@ from langchain_community.document_loaders import (
 )
 from langchain_core.documents import Document
 
+from open_webui.retrieval.loaders.cache import (
+    EXTRACTION_CACHE,
+    get_extraction_cache_key,
+)
 from open_webui.retrieval.loaders.external_document import ExternalDocumentLoader
 
 from open_webui.retrieval.loaders.mistral import MistralLoader
+from open_webui.retrieval.loaders.pdf import ShardedPDFLoader, get_pdf_page_count
 from open_webui.retrieval.loaders.datalab_marker import DatalabMarkerLoader
 
 
+from open_webui.config import (
+    CONTENT_EXTRACTION_MAX_CONCURRENT_REQUESTS,
+    PDF_EXTRACTION_WORKERS,
+    PDF_EXTRACTION_MIN_PAGES,
+    PDF_EXTRACTION_PAGES_PER_SHARD,
+    PDF_EXTRACTION_WORKER_MAX_MEMORY,
+)
 from open_webui.env import SRC_LOG_LEVELS, GLOBAL_LOG_LEVEL
+from open_webui.utils.misc import calculate_sha256
 
 logging.basicConfig(stream=sys.stdout, level=GLOBAL_LOG_LEVEL)
 log = logging.getLogger(__name__)
@@ -214,15 +229,103 @@ class Loader:
     def load(
         self, filename: str, file_content_type: str, file_path: str
     ) -> list[Document]:
+        cache_key, docs = self._load_from_cache(filename, file_content_type, file_path)
+        if docs is not None:
+            return docs
+
         loader = self._get_loader(filename, file_content_type, file_path)
-        docs = loader.load()
+        return self._finish(loader, loader.load(), cache_key)
 
-        return [
-            Document(
-                page_content=ftfy.fix_text(doc.page_content), metadata=doc.metadata
-            )
-            for doc in docs
-        ]
+    async def aload(
+        self, filename: str, file_content_type: str, file_path: str
+    ) -> list[Document]:
+        """
+        Async variant of `load`.
+
+        OCR loaders with a `load_async` (Mistral, Datalab Marker) upload and
+        poll on the event loop; every other loader runs in a thread.
+        """
+        cache_key, docs = await asyncio.to_thread(
+            self._load_from_cache, filename, file_content_type, file_path
+        )
+        if docs is not None:
+            return docs
+
+        loader = await asyncio.to_thread(
+            self._get_loader, filename, file_content_type, file_path
+        )
+        if hasattr(loader, "load_async"):
+            docs = await loader.load_async()
+        else:
+            docs = await asyncio.to_thread(loader.load)
+        return await asyncio.to_thread(self._finish, loader, docs, cache_key)
+
+    async def aload_batch(
+        self,
+        files: list[tuple[str, str, str]],
+        max_concurrent: int = CONTENT_EXTRACTION_MAX_CONCURRENT_REQUESTS,
+    ) -> list[Union[list[Document], Exception]]:
+        """
+        Load many `(filename, file_content_type, file_path)` files concurrently.
+
+        At most `max_concurrent` files are in flight at once. Results are in
+        the order of `files`, a file that failed gets its exception instead.
+        """
+        semaphore = asyncio.Semaphore(max(max_concurrent, 1))
+
+        async def load_file(file: tuple[str, str, str]) -> list[Document]:
+            async with semaphore:
+                return await self.aload(*file)
+
+        return await asyncio.gather(
+            *[load_file(file) for file in files], return_exceptions=True
+        )
+
+    def _load_from_cache(
+        self, filename: str, file_content_type: str, file_path: str
+    ) -> tuple[Optional[str], Optional[list[Document]]]:
+        if EXTRACTION_CACHE is None:
+            return None, None
+
+        cache_key = self._get_cache_key(filename, file_content_type, file_path)
+        docs = EXTRACTION_CACHE.get(cache_key)
+        if docs is not None:
+            log.info(f"Using cached extraction of {filename}")
+        return cache_key, docs
+
+    def _finish(
+        self, loader, docs: list[Document], cache_key: Optional[str]
+    ) -> list[Document]:
+        # Sharded PDF pages were already fixed by the extraction workers
+        if not isinstance(loader, ShardedPDFLoader):
+            docs = [
+                Document(
+                    page_content=ftfy.fix_text(doc.page_content),
+                    metadata=doc.metadata,
+                )
+                for doc in docs
+            ]
+
+        # Mistral reports failures as documents with an "error", don't keep them
+        if cache_key is not None and not any("error" in doc.metadata for doc in docs):
+            EXTRACTION_CACHE.set(cache_key, docs)
+        return docs
+
+    def _get_cache_key(
+        self, filename: str, file_content_type: str, file_path: str
+    ) -> str:
+        # The loader depends on the file type and on which credentials are set,
+        # but the credentials themselves should not invalidate extractions
+        params = {
+            key: bool(value) if key.endswith("_KEY") else value
+            for key, value in self.kwargs.items()
+        }
+        params["file_ext"] = filename.split(".")[-1].lower()
+        params["file_content_type"] = file_content_type
+
+        return get_extraction_cache_key(
+            calculate_sha256(file_path, 1024 * 1024), self.engine, params
+        )
 
     def _is_text_file(self, file_ext: str, file_content_type: str) -> bool:
         return file_ext in known_source_ext or (
@@ -355,7 +458,19 @@ class Loader:
                 api_key=self.kwargs.get("MISTRAL_OCR_API_KEY"), file_path=file_path
             )
         else:
-            if file_ext == "pdf":
+            if (
+                file_ext == "pdf"
+                and PDF_EXTRACTION_WORKERS > 0
+                and get_pdf_page_count(file_path) >= PDF_EXTRACTION_MIN_PAGES
+            ):
+                loader = ShardedPDFLoader(
+                    file_path,
+                    extract_images=self.kwargs.get("PDF_EXTRACT_IMAGES"),
+                    workers=PDF_EXTRACTION_WORKERS,
+                    pages_per_shard=PDF_EXTRACTION_PAGES_PER_SHARD,
+                    max_memory=PDF_EXTRACTION_WORKER_MAX_MEMORY,
+                )
+            elif file_ext == "pdf":
                 loader = PyPDFLoader(
                     file_path, extract_images=self.kwargs.get("PDF_EXTRACT_IMAGES")
                 )
@@ -0,0 +1,171 @@
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator, Optional
+
+import ftfy
+import pypdf
+from langchain_core.documents import Document
+
+# Imported by the extraction workers, which are spawned as fresh interpreters:
+# keep the imports of this module light and free of open_webui.config.
+
+log = logging.getLogger(__name__)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _init_worker(max_memory: int):
+    if max_memory > 0:
+        try:
+            import resource
+
+            resource.setrlimit(resource.RLIMIT_AS, (max_memory, max_memory))
+        except (ImportError, ValueError, OSError) as e:
+            log.warning(f"Could not limit PDF extraction worker memory: {e}")
+
+
+def _extract_pages(
+    file_path: str, start: int, end: int, extract_images: bool
+) -> list[tuple[int, str, str]]:
+    """Text of pages `start` to `end` (exclusive), with their page labels."""
+    reader = pypdf.PdfReader(file_path)
+
+    images_parser = None
+    if extract_images:
+        from langchain_community.document_loaders.parsers.pdf import PyPDFParser
+
+        images_parser = PyPDFParser(extract_images=True)
+
+    # Computed over the whole document on each access, so only once per shard
+    labels = reader.page_labels
+
+    pages = []
+    for page_number in range(start, end):
+        page = reader.pages[page_number]
+        text = page.extract_text(extraction_mode="plain")
+        if images_parser is not None:
+            text = "\n\n".join(
+                filter(None, [text, images_parser.extract_images_from_page(page)])
+            )
+        pages.append((page_number, ftfy.fix_text(text.strip()), labels[page_number]))
+    return pages
+
+
+def get_pdf_metadata(reader: pypdf.PdfReader) -> dict:
+    """Document information, with the keys PyPDFLoader uses."""
+    metadata = {"producer": "PyPDF", "creator": "PyPDF", "creationdate": ""}
+    info = reader.metadata
+    if info is not None:
+        for key, value in info.items():
+            metadata[key.lstrip("/").lower()] = str(value)
+        for key, date in (
+            ("creationdate", info.creation_date),
+            ("moddate", info.modification_date),
+        ):
+            if date is not None:
+                metadata[key] = date.isoformat()
+    return metadata
+
+
+def get_pdf_page_count(file_path: str) -> int:
+    try:
+        return len(pypdf.PdfReader(file_path).pages)
+    except Exception:
+        # Left to the regular loader, which reports the error
+        return 0
+
+
+def get_pdf_extraction_pool(workers: int, max_memory: int = 0) -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Spawned rather than forked, the server process is large and threaded
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(max_memory,),
+            )
+        return _pool
+
+
+def reset_pdf_extraction_pool(pool: ProcessPoolExecutor):
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+class ShardedPDFLoader:
+    """
+    Extracts a PDF in shards of pages on a shared pool of worker processes.
+
+    Pages are yielded by `lazy_load` as their shard completes, with the same
+    metadata as PyPDFLoader. Text is already fixed with ftfy by the workers.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        extract_images: bool = False,
+        workers: int = 2,
+        pages_per_shard: int = 20,
+        max_memory: int = 0,
+    ):
+        self.file_path = file_path
+        self.extract_images = extract_images
+        self.workers = workers
+        self.pages_per_shard = max(pages_per_shard, 1)
+        self.max_memory = max_memory
+
+    def lazy_load(self) -> Iterator[Document]:
+        reader = pypdf.PdfReader(self.file_path)
+        total_pages = len(reader.pages)
+        metadata = {
+            **get_pdf_metadata(reader),
+            "source": self.file_path,
+            "total_pages": total_pages,
+        }
+
+        pool = get_pdf_extraction_pool(self.workers, self.max_memory)
+        futures = [
+            pool.submit(
+                _extract_pages,
+                self.file_path,
+                start,
+                min(start + self.pages_per_shard, total_pages),
+                bool(self.extract_images),
+            )
+            for start in range(0, total_pages, self.pages_per_shard)
+        ]
+
+        try:
+            for future in as_completed(futures):
+                for page_number, text, page_label in future.result():
+                    yield Document(
+                        page_content=text,
+                        metadata={
+                            **metadata,
+                            "page": page_number,
+                            "page_label": page_label,
+                        },
+                    )
+        except MemoryError:
+            raise MemoryError(
+                f"Extracting {self.file_path} exceeded the PDF extraction memory limit"
+            )
+        except BrokenProcessPool:
+            # A worker died, the next file gets a new pool
+            reset_pdf_extraction_pool(pool)
+            raise
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def load(self) -> list[Document]:
+        return sorted(self.lazy_load(), key=lambda doc: doc.metadata["page"])
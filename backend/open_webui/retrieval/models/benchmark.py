@@ -0,0 +1,212 @@
+"""
+Compare the int8 ONNX models against the PyTorch ones on a corpus.
+
+    python -m open_webui.retrieval.models.benchmark corpus.txt \\
+        --embedding-model sentence-transformers/all-MiniLM-L6-v2 \\
+        --reranking-model cross-encoder/ms-marco-MiniLM-L-6-v2 \\
+        --quantization avx2
+
+The corpus has one passage per line. Queries are read from --queries, one per
+line, or taken from the first words of sampled passages. Throughput is
+measured per backend. Recall@k is the share of the PyTorch top k passages the
+quantized model also ranks in its top k.
+"""
+
+import argparse
+import os
+import random
+import time
+from typing import Optional
+
+import numpy as np
+
+from open_webui.retrieval.models.quantized import (
+    QUANTIZATION_CONFIGS,
+    get_quantized_file_name,
+    load_quantized_model,
+)
+
+
+def get_model_size(model_path: str, quantization: Optional[str]) -> int:
+    if quantization:
+        return os.path.getsize(
+            os.path.join(model_path, get_quantized_file_name(quantization))
+        )
+    # Repositories may ship the weights in both formats
+    for extension in (".safetensors", ".bin"):
+        size = sum(
+            os.path.getsize(os.path.join(model_path, file))
+            for file in os.listdir(model_path)
+            if file.endswith(extension)
+        )
+        if size:
+            return size
+    return 0
+
+
+def load_models(model_class, model_path: str, quantization: str) -> dict:
+    models = {"torch": model_class(model_path, backend="torch", device="cpu")}
+    models[f"onnx-qint8-{quantization}"] = load_quantized_model(
+        model_class, model_path, quantization, device="cpu"
+    )
+    return models
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def recall_at_k(reference: np.ndarray, candidate: np.ndarray, k: int) -> float:
+    """Mean overlap of the top k indices of each row of the two score matrices."""
+    reference_top = np.argsort(-reference, axis=1)[:, :k]
+    candidate_top = np.argsort(-candidate, axis=1)[:, :k]
+    return float(
+        np.mean(
+            [
+                len(set(r) & set(c)) / len(r)
+                for r, c in zip(reference_top, candidate_top)
+            ]
+        )
+    )
+
+
+def benchmark_embedding(model_path, quantization, passages, queries, batch_size, k):
+    from sentence_transformers import SentenceTransformer
+
+    models = load_models(SentenceTransformer, model_path, quantization)
+
+    results = {}
+    scores = {}
+    for name, model in models.items():
+        # Warm up, the first calls of ONNX Runtime are slower
+        model.encode(passages[:batch_size], batch_size=batch_size)
+
+        passage_embeddings, elapsed = timed(
+            model.encode,
+            passages,
+            batch_size=batch_size,
+            normalize_embeddings=True,
+        )
+        query_embeddings = model.encode(
+            queries, batch_size=batch_size, normalize_embeddings=True
+        )
+        scores[name] = query_embeddings @ passage_embeddings.T
+        results[name] = {
+            "passages/s": len(passages) / elapsed,
+            "size (MB)": get_model_size(
+                model_path, None if name == "torch" else quantization
+            )
+            / 1e6,
+        }
+
+    for name in results:
+        results[name][f"recall@{k}"] = recall_at_k(scores["torch"], scores[name], k)
+    return results
+
+
+def benchmark_reranking(model_path, quantization, passages, queries, batch_size, k):
+    from sentence_transformers import CrossEncoder
+
+    models = load_models(CrossEncoder, model_path, quantization)
+
+    # Each query is reranked against a sample of candidates, like after retrieval
+    candidates = [random.sample(passages, min(len(passages), 4 * k)) for _ in queries]
+    pairs = [
+        (query, passage)
+        for query, query_candidates in zip(queries, candidates)
+        for passage in query_candidates
+    ]
+
+    results = {}
+    scores = {}
+    for name, model in models.items():
+        model.predict(pairs[:batch_size], batch_size=batch_size)
+
+        pair_scores, elapsed = timed(model.predict, pairs, batch_size=batch_size)
+        scores[name] = np.asarray(pair_scores).reshape(len(queries), -1)
+        results[name] = {
+            "pairs/s": len(pairs) / elapsed,
+            "size (MB)": get_model_size(
+                model_path, None if name == "torch" else quantization
+            )
+            / 1e6,
+        }
+
+    for name in results:
+        results[name][f"recall@{k}"] = recall_at_k(scores["torch"], scores[name], k)
+    return results
+
+
+def print_results(title: str, results: dict):
+    print(f"\n{title}")
+    for name, metrics in results.items():
+        print(
+            f"  {name:<24}"
+            + "  ".join(f"{metric}: {value:,.3f}" for metric, value in metrics.items())
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("corpus", help="Text file with one passage per line")
+    parser.add_argument("--queries", help="Text file with one query per line")
+    parser.add_argument("--embedding-model")
+    parser.add_argument("--reranking-model")
+    parser.add_argument("--quantization", default="avx2", choices=QUANTIZATION_CONFIGS)
+    parser.add_argument("--num-passages", type=int, default=2000)
+    parser.add_argument("--num-queries", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if not args.embedding_model and not args.reranking_model:
+        parser.error("Pass --embedding-model, --reranking-model or both")
+
+    from open_webui.retrieval.utils import get_model_path
+
+    random.seed(args.seed)
+    with open(args.corpus) as f:
+        passages = [line.strip() for line in f if line.strip()][: args.num_passages]
+
+    if args.queries:
+        with open(args.queries) as f:
+            queries = [line.strip() for line in f if line.strip()]
+    else:
+        queries = [
+            " ".join(passage.split()[:12])
+            for passage in random.sample(passages, min(len(passages), args.num_queries))
+        ]
+    queries = queries[: args.num_queries]
+
+    if args.embedding_model:
+        print_results(
+            f"Embedding: {args.embedding_model}, {len(passages)} passages",
+            benchmark_embedding(
+                get_model_path(args.embedding_model, update_model=True),
+                args.quantization,
+                passages,
+                queries,
+                args.batch_size,
+                args.k,
+            ),
+        )
+
+    if args.reranking_model:
+        print_results(
+            f"Reranking: {args.reranking_model}, {len(queries)} queries",
+            benchmark_reranking(
+                get_model_path(args.reranking_model, update_model=True),
+                args.quantization,
+                passages,
+                queries,
+                args.batch_size,
+                args.k,
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -35,6 +35,12 @@ class ColBERT(BaseReranker):
             name,
             colbert_config=ColBERTConfig(model_name=name),
         ).to(self.device)
+
+        if kwargs.get("quantize") and self.device == "cpu":
+            # ColBERT has no ONNX export, its linear layers are quantized to int8 instead
+            torch.ao.quantization.quantize_dynamic(
+                self.ckpt, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
         pass
 
     def calculate_similarity_scores(self, query_embeddings, document_embeddings):
@@ -0,0 +1,71 @@
+import logging
+import os
+from typing import Optional
+
+from filelock import FileLock
+
+from open_webui.env import SRC_LOG_LEVELS
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
+
+# Dynamic int8 quantization configurations of sentence-transformers, by CPU
+QUANTIZATION_CONFIGS = ["arm64", "avx2", "avx512", "avx512_vnni"]
+
+
+def get_quantized_file_name(quantization: str) -> str:
+    # The file name sentence-transformers exports to, and that model repos ship
+    return f"onnx/model_qint8_{quantization}.onnx"
+
+
+def load_quantized_model(model_class, model_path: str, quantization: str, **kwargs):
+    """
+    Load a SentenceTransformer or CrossEncoder from its int8 ONNX model.
+
+    The quantized model is exported next to the model's own files on first
+    use, unless the model repository already ships it, and reused after.
+    """
+    if quantization not in QUANTIZATION_CONFIGS:
+        raise ValueError(
+            f"Unsupported quantization: {quantization}, expected one of {QUANTIZATION_CONFIGS}"
+        )
+    if not os.path.isdir(model_path):
+        raise ValueError(f"Model {model_path} is not available locally")
+
+    file_name = get_quantized_file_name(quantization)
+    model_kwargs = {**(kwargs.pop("model_kwargs", None) or {}), "file_name": file_name}
+
+    os.makedirs(os.path.join(model_path, "onnx"), exist_ok=True)
+    # Workers starting together export once
+    with FileLock(os.path.join(model_path, f"{file_name}.lock")):
+        if not os.path.exists(os.path.join(model_path, file_name)):
+            from sentence_transformers import export_dynamic_quantized_onnx_model
+
+            log.info(f"Exporting {model_path} to {file_name}")
+            # Exported to ONNX in memory first, if the repository has no ONNX model
+            model = model_class(model_path, backend="onnx", **kwargs)
+            export_dynamic_quantized_onnx_model(model, quantization, model_path)
+
+    return model_class(model_path, backend="onnx", model_kwargs=model_kwargs, **kwargs)
+
+
+def load_local_model(
+    model_class,
+    model_path: str,
+    backend: str = "torch",
+    quantization: Optional[str] = None,
+    **kwargs,
+):
+    """
+    Load a local SentenceTransformer or CrossEncoder with the configured
+    backend, or int8 quantized on ONNX Runtime if `quantization` is set.
+    """
+    if quantization:
+        try:
+            return load_quantized_model(model_class, model_path, quantization, **kwargs)
+        except Exception as e:
+            log.warning(
+                f"Cannot load {model_path} quantized, falling back to the {backend} backend: {e}"
+            )
+
+    return model_class(model_path, backend=backend, **kwargs)
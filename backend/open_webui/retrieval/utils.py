@@ -13,9 +13,11 @@ from langchain_community.retrievers import BM25Retriever
 from langchain_core.documents import Document
 
 from open_webui.config import VECTOR_DB
-from open_webui.retrieval.vector.factory import VECTOR_DB_CLIENT
+from open_webui.retrieval.vector.factory import get_vector_db_client
 
 from open_webui.models.users import UserModel
+from open_webui.retrieval.embedding_batcher import EMBEDDING_BATCHER
+from open_webui.retrieval.inference import INFERENCE_EXECUTOR
 from open_webui.models.files import Files
 
 from open_webui.retrieval.vector.main import GetResult
@@ -53,7 +55,7 @@ class VectorSearchRetriever(BaseRetriever):
         *,
         run_manager: CallbackManagerForRetrieverRun,
     ) -> list[Document]:
-        result = VECTOR_DB_CLIENT.search(
+        result = get_vector_db_client(self.collection_name).search(
             collection_name=self.collection_name,
             vectors=[self.embedding_function(query, RAG_EMBEDDING_QUERY_PREFIX)],
             limit=self.top_k,
@@ -79,7 +81,7 @@ def query_doc(
 ):
     try:
         log.debug(f"query_doc:doc {collection_name}")
-        result = VECTOR_DB_CLIENT.search(
+        result = get_vector_db_client(collection_name).search(
             collection_name=collection_name,
             vectors=[query_embedding],
             limit=k,
@@ -97,7 +99,9 @@ def query_doc(
 def get_doc(collection_name: str, user: UserModel = None):
     try:
         log.debug(f"get_doc:doc {collection_name}")
-        result = VECTOR_DB_CLIENT.get(collection_name=collection_name)
+        result = get_vector_db_client(collection_name).get(
+            collection_name=collection_name
+        )
 
         if result:
             log.info(f"query_doc:result {result.ids} {result.metadatas}")
@@ -338,9 +342,9 @@ def query_collection_with_hybrid_search(
             log.debug(
                 f"query_collection_with_hybrid_search:VECTOR_DB_CLIENT.get:collection {collection_name}"
             )
-            collection_results[collection_name] = VECTOR_DB_CLIENT.get(
-                collection_name=collection_name
-            )
+            collection_results[collection_name] = get_vector_db_client(
+                collection_name
+            ).get(collection_name=collection_name)
         except Exception as e:
             log.exception(f"Failed to fetch collection {collection_name}: {e}")
             collection_results[collection_name] = None
@@ -403,10 +407,29 @@ def get_embedding_function(
     embedding_batch_size,
     azure_api_version=None,
 ):
+    if EMBEDDING_BATCHER is not None and embedding_engine in [
+        "",
+        "ollama",
+        "openai",
+        "azure_openai",
+    ]:
+        return get_batched_embedding_function(
+            embedding_engine,
+            embedding_model,
+            embedding_function,
+            url,
+            key,
+            embedding_batch_size,
+            azure_api_version,
+        )
+
     if embedding_engine == "":
-        return lambda query, prefix=None, user=None: embedding_function.encode(
-            query, **({"prompt": prefix} if prefix else {})
-        ).tolist()
+        return lambda query, prefix=None, user=None: INFERENCE_EXECUTOR.run(
+            embedding_function,
+            lambda: embedding_function.encode(
+                query, **({"prompt": prefix} if prefix else {})
+            ).tolist(),
+        )
     elif embedding_engine in ["ollama", "openai", "azure_openai"]:
         func = lambda query, prefix=None, user=None: generate_embeddings(
             engine=embedding_engine,
@@ -441,6 +464,64 @@ def get_embedding_function(
         raise ValueError(f"Unknown embedding engine: {embedding_engine}")
 
 
+def get_batched_embedding_function(
+    embedding_engine,
+    embedding_model,
+    embedding_function,
+    url,
+    key,
+    embedding_batch_size,
+    azure_api_version=None,
+):
+    """
+    Embedding function whose calls are coalesced with concurrent calls of the
+    same settings by the process-wide EMBEDDING_BATCHER.
+    """
+    if embedding_engine == "":
+        # The local model batches internally, pack at least its default batch size
+        batch_size = max(embedding_batch_size, 32)
+        embed = lambda texts, prefix, user: INFERENCE_EXECUTOR.run(
+            embedding_function,
+            lambda: embedding_function.encode(
+                texts, **({"prompt": prefix} if prefix else {})
+            ).tolist(),
+        )
+    else:
+        batch_size = embedding_batch_size
+        embed = lambda texts, prefix, user: generate_embeddings(
+            engine=embedding_engine,
+            model=embedding_model,
+            text=texts,
+            prefix=prefix,
+            url=url,
+            key=key,
+            user=user,
+            azure_api_version=azure_api_version,
+        )
+
+    settings = (
+        embedding_engine,
+        embedding_model,
+        id(embedding_function),
+        url,
+        key,
+        azure_api_version,
+    )
+
+    def batched(query, prefix=None, user=None):
+        # Users are only told apart when they are forwarded to a remote engine
+        forwarded_user = (
+            user.id
+            if user and embedding_engine != "" and ENABLE_FORWARD_USER_INFO_HEADERS
+            else None
+        )
+        return EMBEDDING_BATCHER.embed(
+            (settings, forwarded_user), embed, batch_size, query, prefix, user
+        )
+
+    return batched
+
+
 def get_sources_from_files(
     request,
     files,
@@ -854,6 +935,8 @@ from typing import Optional, Sequence
 from langchain_core.callbacks import Callbacks
 from langchain_core.documents import BaseDocumentCompressor, Document
 
+from open_webui.retrieval.models.external import ExternalReranker
+
 
 class RerankCompressor(BaseDocumentCompressor):
     embedding_function: Any
@@ -874,9 +957,13 @@ class RerankCompressor(BaseDocumentCompressor):
         reranking = self.reranking_function is not None
 
         if reranking:
-            scores = self.reranking_function.predict(
-                [(query, doc.page_content) for doc in documents]
-            )
+            pairs = [(query, doc.page_content) for doc in documents]
+            if isinstance(self.reranking_function, ExternalReranker):
+                scores = self.reranking_function.predict(pairs)
+            else:
+                scores = INFERENCE_EXECUTOR.run(
+                    self.reranking_function, self.reranking_function.predict, pairs
+                )
         else:
             from sentence_transformers import util
 
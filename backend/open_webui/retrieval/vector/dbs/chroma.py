@@ -135,6 +135,27 @@ class ChromaClient(VectorDBBase):
             )
         return None
 
+    def get_items(
+        self, collection_name: str, filter: Optional[dict] = None
+    ) -> Optional[list[VectorItem]]:
+        # Get the items with their embeddings, which collection.get leaves out by default.
+        if not self.has_collection(collection_name):
+            return None
+        collection = self.client.get_collection(name=collection_name)
+        result = collection.get(
+            where=filter or None,
+            include=["embeddings", "documents", "metadatas"],
+        )
+        return [
+            {
+                "id": id,
+                "text": result["documents"][idx],
+                "vector": list(result["embeddings"][idx]),
+                "metadata": result["metadatas"][idx],
+            }
+            for idx, id in enumerate(result["ids"])
+        ]
+
     def insert(self, collection_name: str, items: list[VectorItem]):
         # Insert the items into the collection, if the collection does not exist, it will be created.
         collection = self.client.get_or_create_collection(
@@ -0,0 +1,258 @@
+import json
+import logging
+import threading
+import time
+from abc import abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from open_webui.retrieval.vector.main import (
+    VectorDBBase,
+    VectorItem,
+    SearchResult,
+    GetResult,
+)
+from open_webui.env import SRC_LOG_LEVELS
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
+
+
+def _matches(metadata: dict, filter: Optional[Dict]) -> bool:
+    return not filter or all(
+        str((metadata or {}).get(key)) == str(value) for key, value in filter.items()
+    )
+
+
+class EphemeralClient(VectorDBBase):
+    """
+    Short-lived vector store for throwaway collections such as web search results.
+
+    Collections expire `ttl` seconds after their last write. Subclasses only
+    provide storage of whole collections; search is a brute-force cosine
+    similarity, which is fast enough for the few hundred chunks a search
+    produces. Scores use the same 0 (worst) -> 1 (best) scale as Chroma.
+    """
+
+    def __init__(self, ttl: int = 3600):
+        self.ttl = ttl
+
+    @abstractmethod
+    def _load(self, collection_name: str) -> Optional[dict]:
+        """Return the collection, or None if it does not exist or expired."""
+        pass
+
+    @abstractmethod
+    def _store(self, collection_name: str, collection: dict) -> None:
+        """Store the whole collection and restart its expiry."""
+        pass
+
+    @abstractmethod
+    def _remove(self, collection_name: str) -> None:
+        """Remove the collection, if it exists."""
+        pass
+
+    def has_collection(self, collection_name: str) -> bool:
+        return self._load(collection_name) is not None
+
+    def delete_collection(self, collection_name: str) -> None:
+        self._remove(collection_name)
+
+    def insert(self, collection_name: str, items: List[VectorItem]) -> None:
+        self.upsert(collection_name, items)
+
+    def upsert(self, collection_name: str, items: List[VectorItem]) -> None:
+        collection = self._load(collection_name) or {
+            "ids": [],
+            "documents": [],
+            "metadatas": [],
+            "vectors": [],
+        }
+
+        positions = {id: idx for idx, id in enumerate(collection["ids"])}
+        for item in items:
+            idx = positions.get(item["id"])
+            if idx is None:
+                positions[item["id"]] = len(collection["ids"])
+                collection["ids"].append(item["id"])
+                collection["documents"].append(item["text"])
+                collection["metadatas"].append(item["metadata"])
+                collection["vectors"].append(list(item["vector"]))
+            else:
+                collection["documents"][idx] = item["text"]
+                collection["metadatas"][idx] = item["metadata"]
+                collection["vectors"][idx] = list(item["vector"])
+
+        self._store(collection_name, collection)
+
+    def search(
+        self, collection_name: str, vectors: List[List[float | int]], limit: int
+    ) -> Optional[SearchResult]:
+        collection = self._load(collection_name)
+        if not collection or not collection["ids"]:
+            return None
+
+        matrix = np.asarray(collection["vectors"], dtype=np.float32)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-12
+
+        ids, distances, documents, metadatas = [], [], [], []
+        for vector in vectors:
+            query = np.asarray(vector, dtype=np.float32)
+            query /= np.linalg.norm(query) + 1e-12
+
+            scores = (matrix @ query + 1) / 2
+            top = np.argsort(-scores)[:limit]
+
+            ids.append([collection["ids"][i] for i in top])
+            distances.append([float(scores[i]) for i in top])
+            documents.append([collection["documents"][i] for i in top])
+            metadatas.append([collection["metadatas"][i] for i in top])
+
+        return SearchResult(
+            ids=ids, distances=distances, documents=documents, metadatas=metadatas
+        )
+
+    def query(
+        self, collection_name: str, filter: Dict, limit: Optional[int] = None
+    ) -> Optional[GetResult]:
+        collection = self._load(collection_name)
+        if not collection:
+            return None
+
+        matches = [
+            idx
+            for idx, metadata in enumerate(collection["metadatas"])
+            if _matches(metadata, filter)
+        ][:limit]
+
+        return GetResult(
+            ids=[[collection["ids"][i] for i in matches]],
+            documents=[[collection["documents"][i] for i in matches]],
+            metadatas=[[collection["metadatas"][i] for i in matches]],
+        )
+
+    def get(self, collection_name: str) -> Optional[GetResult]:
+        collection = self._load(collection_name)
+        if not collection:
+            return None
+
+        return GetResult(
+            ids=[collection["ids"]],
+            documents=[collection["documents"]],
+            metadatas=[collection["metadatas"]],
+        )
+
+    def delete(
+        self,
+        collection_name: str,
+        ids: Optional[List[str]] = None,
+        filter: Optional[Dict] = None,
+    ) -> None:
+        collection = self._load(collection_name)
+        if not collection:
+            return
+
+        keep = [
+            idx
+            for idx, (id, metadata) in enumerate(
+                zip(collection["ids"], collection["metadatas"])
+            )
+            if not (
+                (ids is None or id in ids)
+                and (filter is None or _matches(metadata, filter))
+            )
+        ]
+
+        self._store(
+            collection_name,
+            {key: [values[i] for i in keep] for key, values in collection.items()},
+        )
+
+
+class MemoryClient(EphemeralClient):
+    """Per-process store, bounded by TTL and by the total number of stored chunks."""
+
+    def __init__(self, ttl: int = 3600, max_items: int = 0):
+        super().__init__(ttl)
+        self.max_items = max_items
+
+        self._lock = threading.Lock()
+        self._collections: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+        self._size = 0
+
+    def _evict(self):
+        now = time.time()
+        for name, (expires_at, _) in list(self._collections.items()):
+            if expires_at <= now:
+                self._pop(name)
+
+        # The most recently written collection is kept even when it alone is
+        # over the limit, it is about to be searched
+        while (
+            self.max_items > 0
+            and self._size > self.max_items
+            and len(self._collections) > 1
+        ):
+            self._pop(next(iter(self._collections)))
+
+    def _pop(self, collection_name: str):
+        entry = self._collections.pop(collection_name, None)
+        if entry is not None:
+            self._size -= len(entry[1]["ids"])
+
+    def _load(self, collection_name: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._collections.get(collection_name)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                self._pop(collection_name)
+                return None
+
+            self._collections.move_to_end(collection_name)
+            return {key: list(values) for key, values in entry[1].items()}
+
+    def _store(self, collection_name: str, collection: dict) -> None:
+        with self._lock:
+            self._pop(collection_name)
+            self._collections[collection_name] = (time.time() + self.ttl, collection)
+            self._size += len(collection["ids"])
+            self._evict()
+
+    def _remove(self, collection_name: str) -> None:
+        with self._lock:
+            self._pop(collection_name)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._collections.clear()
+            self._size = 0
+
+
+class RedisClient(EphemeralClient):
+    """Store shared between workers, expiry is delegated to Redis key TTLs."""
+
+    KEY_PREFIX = "open-webui:ephemeral-vector:"
+
+    def __init__(self, redis, ttl: int = 3600):
+        super().__init__(ttl)
+        self.redis = redis
+
+    def _key(self, collection_name: str) -> str:
+        return f"{self.KEY_PREFIX}{collection_name}"
+
+    def _load(self, collection_name: str) -> Optional[dict]:
+        data = self.redis.get(self._key(collection_name))
+        return json.loads(data) if data else None
+
+    def _store(self, collection_name: str, collection: dict) -> None:
+        self.redis.set(self._key(collection_name), json.dumps(collection), ex=self.ttl)
+
+    def _remove(self, collection_name: str) -> None:
+        self.redis.delete(self._key(collection_name))
+
+    def reset(self) -> None:
+        for key in self.redis.scan_iter(f"{self.KEY_PREFIX}*"):
+            self.redis.delete(key)
@@ -271,6 +271,41 @@ class MilvusClient(VectorDBBase):
             )
             return None
 
+    def get_items(
+        self, collection_name: str, filter: Optional[dict] = None
+    ) -> Optional[list[VectorItem]]:
+        collection_name = collection_name.replace("-", "_")
+        if not self.has_collection(collection_name):
+            return None
+        filter_string = " && ".join(
+            [
+                f'metadata["{key}"] == {json.dumps(value)}'
+                for key, value in (filter or {}).items()
+            ]
+        )
+        max_limit = 16383  # The maximum number of records per request
+
+        items = []
+        while True:
+            results = self.client.query(
+                collection_name=f"{self.collection_prefix}_{collection_name}",
+                filter=filter_string,
+                output_fields=["id", "vector", "data", "metadata"],
+                limit=max_limit,
+                offset=len(items),
+            )
+            items.extend(
+                {
+                    "id": result["id"],
+                    "text": result.get("data", {}).get("text"),
+                    "vector": result["vector"],
+                    "metadata": result.get("metadata"),
+                }
+                for result in results
+            )
+            if len(results) < max_limit:
+                return items
+
     def get(self, collection_name: str) -> Optional[GetResult]:
         # Get all the items in the collection. This can be very resource-intensive for large collections.
         collection_name = collection_name.replace("-", "_")
@@ -3,6 +3,7 @@ import logging
 import json
 from sqlalchemy import (
     func,
+    insert,
     literal,
     cast,
     column,
@@ -576,3 +577,64 @@ class PgvectorClient(VectorDBBase):
     def delete_collection(self, collection_name: str) -> None:
         self.delete(collection_name)
         log.info(f"Collection '{collection_name}' deleted.")
+
+    def copy(
+        self,
+        collection_name: str,
+        new_collection_name: str,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        # Copied with a single INSERT ... SELECT, the vectors never leave the
+        # database. Encrypted columns are copied as they are, under the same key.
+        try:
+            metadata = (
+                pgcrypto_decrypt(DocumentChunk.vmetadata, PGVECTOR_PGCRYPTO_KEY, JSONB)
+                if PGVECTOR_PGCRYPTO
+                else DocumentChunk.vmetadata
+            )
+            where_clauses = [DocumentChunk.collection_name == collection_name]
+            for key, value in (filter or {}).items():
+                where_clauses.append(metadata[key].astext == str(value))
+
+            stmt = insert(DocumentChunk).from_select(
+                ["id", "vector", "collection_name", "text", "vmetadata"],
+                select(
+                    cast(func.gen_random_uuid(), Text),
+                    DocumentChunk.vector,
+                    literal(new_collection_name, Text),
+                    DocumentChunk.text,
+                    DocumentChunk.vmetadata,
+                ).where(*where_clauses),
+            )
+            result = self.session.execute(stmt)
+            self.session.commit()
+            log.info(
+                f"Copied {result.rowcount} items from '{collection_name}' to '{new_collection_name}'."
+            )
+            return result.rowcount > 0
+        except Exception as e:
+            self.session.rollback()
+            log.exception(f"Error during copy: {e}")
+            raise
+
+    def rename_collection(self, collection_name: str, new_collection_name: str) -> bool:
+        # Both statements run in one transaction, so readers see either the old
+        # or the new chunks but never an empty collection.
+        try:
+            self.session.query(DocumentChunk).filter(
+                DocumentChunk.collection_name == new_collection_name
+            ).delete(synchronize_session=False)
+            self.session.query(DocumentChunk).filter(
+                DocumentChunk.collection_name == collection_name
+            ).update(
+                {"collection_name": new_collection_name}, synchronize_session=False
+            )
+            self.session.commit()
+            log.info(
+                f"Collection '{collection_name}' renamed to '{new_collection_name}'."
+            )
+            return True
+        except Exception as e:
+            self.session.rollback()
+            log.exception(f"Error during rename: {e}")
+            raise
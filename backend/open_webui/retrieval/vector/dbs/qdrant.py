@@ -169,6 +169,35 @@ class QdrantClient(VectorDBBase):
         )
         return self._result_to_get_result(points.points)
 
+    def get_items(
+        self, collection_name: str, filter: Optional[dict] = None
+    ) -> Optional[list[VectorItem]]:
+        if not self.has_collection(collection_name):
+            return None
+
+        points = self.client.query_points(
+            collection_name=f"{self.collection_prefix}_{collection_name}",
+            query_filter=models.Filter(
+                must=[
+                    models.FieldCondition(
+                        key=f"metadata.{key}", match=models.MatchValue(value=value)
+                    )
+                    for key, value in (filter or {}).items()
+                ]
+            ),
+            limit=NO_LIMIT,  # otherwise qdrant would set limit to 10!
+            with_vectors=True,
+        )
+        return [
+            {
+                "id": point.id,
+                "text": point.payload["text"],
+                "vector": point.vector,
+                "metadata": point.payload["metadata"],
+            }
+            for point in points.points
+        ]
+
     def insert(self, collection_name: str, items: list[VectorItem]):
         # Insert the items into the collection, if the collection does not exist, it will be created.
         self._create_collection_if_not_exists(collection_name, len(items[0]["vector"]))
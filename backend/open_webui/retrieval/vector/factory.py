@@ -1,6 +1,16 @@
+from typing import Optional
+
 from open_webui.retrieval.vector.main import VectorDBBase
 from open_webui.retrieval.vector.type import VectorType
-from open_webui.config import VECTOR_DB, ENABLE_QDRANT_MULTITENANCY_MODE
+from open_webui.config import (
+    VECTOR_DB,
+    ENABLE_QDRANT_MULTITENANCY_MODE,
+    WEB_SEARCH_VECTOR_DB,
+    WEB_SEARCH_VECTOR_DB_TTL,
+    WEB_SEARCH_VECTOR_DB_MAX_ITEMS,
+)
+
+WEB_SEARCH_COLLECTION_PREFIX = "web-search-"
 
 
 class Vector:
@@ -51,5 +61,40 @@ class Vector:
             case _:
                 raise ValueError(f"Unsupported vector type: {vector_type}")
 
+    @staticmethod
+    def get_web_search_vector(store: str) -> Optional[VectorDBBase]:
+        """
+        get the ephemeral store for web search results, None to use the main vector db
+        """
+        match store:
+            case "memory":
+                from open_webui.retrieval.vector.dbs.ephemeral import MemoryClient
+
+                return MemoryClient(
+                    ttl=WEB_SEARCH_VECTOR_DB_TTL,
+                    max_items=WEB_SEARCH_VECTOR_DB_MAX_ITEMS,
+                )
+            case "redis":
+                from open_webui.retrieval.vector.dbs.ephemeral import RedisClient
+                from open_webui.utils.redis import get_redis_client
+
+                return RedisClient(get_redis_client(), ttl=WEB_SEARCH_VECTOR_DB_TTL)
+            case "":
+                return None
+            case _:
+                raise ValueError(f"Unsupported web search vector store: {store}")
+
 
 VECTOR_DB_CLIENT = Vector.get_vector(VECTOR_DB)
+WEB_SEARCH_VECTOR_DB_CLIENT = Vector.get_web_search_vector(WEB_SEARCH_VECTOR_DB)
+
+
+def get_vector_db_client(collection_name: str) -> VectorDBBase:
+    """
+    get the vector db holding `collection_name`, web search results live in their own store
+    """
+    if WEB_SEARCH_VECTOR_DB_CLIENT is not None and collection_name.startswith(
+        WEB_SEARCH_COLLECTION_PREFIX
+    ):
+        return WEB_SEARCH_VECTOR_DB_CLIENT
+    return VECTOR_DB_CLIENT
@@ -1,3 +1,4 @@
+import uuid
 from pydantic import BaseModel
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Union
@@ -80,6 +81,49 @@ class VectorDBBase(ABC):
         """Delete vectors by ID or filter from a collection."""
         pass
 
+    def rename_collection(self, collection_name: str, new_collection_name: str) -> bool:
+        """
+        Replace `new_collection_name` with the contents of `collection_name`.
+
+        Only backends that swap collections atomically override this, a crash
+        midway must leave either collection in place. The default returns
+        False so callers fall back to copying or rebuilding the collection.
+        """
+        return False
+
+    def get_items(
+        self, collection_name: str, filter: Optional[Dict] = None
+    ) -> Optional[List[VectorItem]]:
+        """
+        Retrieve stored items, vectors included, optionally filtered by metadata.
+
+        Returns None for backends that cannot read vectors back.
+        """
+        return None
+
+    def copy(
+        self,
+        collection_name: str,
+        new_collection_name: str,
+        filter: Optional[Dict] = None,
+    ) -> bool:
+        """
+        Copy the items matching `filter` into `new_collection_name`.
+
+        Copies get new ids so both collections can change independently.
+        Returns False when nothing could be copied, callers then embed the
+        documents again.
+        """
+        items = self.get_items(collection_name, filter)
+        if not items:
+            return False
+
+        self.insert(
+            new_collection_name,
+            [{**item, "id": str(uuid.uuid4())} for item in items],
+        )
+        return True
+
     @abstractmethod
     def reset(self) -> None:
         """Reset the vector database by removing all collections or those matching a condition."""
@@ -2,7 +2,11 @@ import logging
 from typing import Optional
 
 import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.main import (
+    SearchResult,
+    afetch_json,
+    get_filtered_results,
+)
 from open_webui.env import SRC_LOG_LEVELS
 
 log = logging.getLogger(__name__)
@@ -18,6 +22,24 @@ def search_brave(
         api_key (str): A Brave Search API key
         query (str): The query to search for
     """
+    url, headers, params = _get_request(api_key, query, count)
+
+    response = requests.get(url, headers=headers, params=params)
+    response.raise_for_status()
+
+    return _get_results(response.json(), count, filter_list)
+
+
+async def asearch_brave(
+    api_key: str, query: str, count: int, filter_list: Optional[list[str]] = None
+) -> list[SearchResult]:
+    """Async version of search_brave, using the pooled HTTP session."""
+    url, headers, params = _get_request(api_key, query, count)
+    json_response = await afetch_json("GET", url, headers=headers, params=params)
+    return _get_results(json_response, count, filter_list)
+
+
+def _get_request(api_key: str, query: str, count: int) -> tuple[str, dict, dict]:
     url = "https://api.search.brave.com/res/v1/web/search"
     headers = {
         "Accept": "application/json",
@@ -25,11 +47,12 @@ def search_brave(
         "X-Subscription-Token": api_key,
     }
     params = {"q": query, "count": count}
+    return url, headers, params
 
-    response = requests.get(url, headers=headers, params=params)
-    response.raise_for_status()
 
-    json_response = response.json()
+def _get_results(
+    json_response: dict, count: int, filter_list: Optional[list[str]]
+) -> list[SearchResult]:
     results = json_response.get("web", {}).get("results", [])
     if filter_list:
         results = get_filtered_results(results, filter_list)
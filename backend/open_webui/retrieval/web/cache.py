@@ -0,0 +1,130 @@
+import hashlib
+import json
+import logging
+import time
+import urllib.parse
+from typing import Optional
+
+from open_webui.config import (
+    WEB_LOADER_CACHE,
+    WEB_LOADER_CACHE_TTL,
+    WEB_LOADER_CACHE_FRESH_TTL,
+    WEB_LOADER_CACHE_MAX_SIZE,
+)
+from open_webui.env import SRC_LOG_LEVELS
+from open_webui.utils.cache import Cache, get_cache
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
+
+
+TRACKING_QUERY_PARAMS = {"fbclid", "gclid", "msclkid", "mc_cid", "mc_eid", "ref_src"}
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a URL, so trivially different links share a cache entry."""
+    parsed = urllib.parse.urlsplit(url.strip())
+    scheme = parsed.scheme.lower()
+    netloc = (parsed.hostname or "").lower()
+    if parsed.port and (scheme, parsed.port) not in (("http", 80), ("https", 443)):
+        netloc = f"{netloc}:{parsed.port}"
+    if parsed.username or parsed.password:
+        netloc = f"{parsed.username or ''}:{parsed.password or ''}@{netloc}"
+
+    query = sorted(
+        (key, value)
+        for key, value in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_")
+        and key.lower() not in TRACKING_QUERY_PARAMS
+    )
+
+    return urllib.parse.urlunsplit(
+        (scheme, netloc, parsed.path or "/", urllib.parse.urlencode(query), "")
+    )
+
+
+def get_cache_key(url: str) -> str:
+    return hashlib.sha256(normalize_url(url).encode()).hexdigest()
+
+
+class WebPageCache:
+    """
+    Extracted text and metadata of fetched web pages, keyed by normalised URL.
+
+    An entry younger than `fresh_ttl` is served as is. Older entries are
+    revalidated with the ETag/Last-Modified validators stored alongside them,
+    and dropped `ttl` seconds after they were last fetched or revalidated.
+    """
+
+    def __init__(self, cache: Cache, fresh_ttl: int = 600):
+        self.cache = cache
+        self.fresh_ttl = fresh_ttl
+
+    def get(self, url: str) -> Optional[dict]:
+        try:
+            data = self.cache.get(get_cache_key(url))
+        except Exception as e:
+            log.warning(f"Failed to read web page cache for {url}: {e}")
+            return None
+        return json.loads(data) if data is not None else None
+
+    def set(
+        self,
+        url: str,
+        text: str,
+        metadata: dict,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        now = time.time()
+        self._save(
+            url,
+            {
+                "text": text,
+                # The source is filled in with the URL that was asked for
+                "metadata": {k: v for k, v in metadata.items() if k != "source"},
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": now,
+                "validated_at": now,
+            },
+        )
+
+    def touch(self, url: str, entry: dict) -> None:
+        """Mark an entry as revalidated, i.e. the server answered 304 Not Modified."""
+        self._save(url, {**entry, "validated_at": time.time()})
+
+    def _save(self, url: str, entry: dict) -> None:
+        try:
+            self.cache.set(get_cache_key(url), json.dumps(entry).encode())
+        except Exception as e:
+            log.warning(f"Failed to write web page cache for {url}: {e}")
+
+    def is_fresh(self, entry: dict) -> bool:
+        return time.time() - entry["validated_at"] <= self.fresh_ttl
+
+    @staticmethod
+    def get_validators(entry: Optional[dict]) -> dict:
+        """Conditional request headers to revalidate `entry` with."""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+
+def get_web_page_cache(store: str) -> Optional[WebPageCache]:
+    cache = get_cache(
+        store,
+        "web-page",
+        ttl=WEB_LOADER_CACHE_TTL,
+        max_size=WEB_LOADER_CACHE_MAX_SIZE,
+    )
+    if cache is None:
+        return None
+    return WebPageCache(cache, fresh_ttl=WEB_LOADER_CACHE_FRESH_TTL)
+
+
+WEB_PAGE_CACHE = get_web_page_cache(WEB_LOADER_CACHE)
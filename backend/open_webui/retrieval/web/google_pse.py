@@ -2,7 +2,11 @@ import logging
 from typing import Optional
 
 import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.main import (
+    SearchResult,
+    afetch_json,
+    get_filtered_results,
+)
 from open_webui.env import SRC_LOG_LEVELS
 
 log = logging.getLogger(__name__)
@@ -29,20 +33,13 @@ def search_google_pse(
     Returns:
         list[SearchResult]: A list of SearchResult objects.
     """
-    url = "https://www.googleapis.com/customsearch/v1"
-    headers = {"Content-Type": "application/json"}
     all_results = []
     start_index = 1  # Google PSE start parameter is 1-based
 
     while count > 0:
-        num_results_this_page = min(count, 10)  # Google PSE max results per page is 10
-        params = {
-            "cx": search_engine_id,
-            "q": query,
-            "key": api_key,
-            "num": num_results_this_page,
-            "start": start_index,
-        }
+        url, headers, params = _get_request(
+            api_key, search_engine_id, query, count, start_index
+        )
         response = requests.request("GET", url, headers=headers, params=params)
         response.raise_for_status()
         json_response = response.json()
@@ -56,6 +53,54 @@ def search_google_pse(
         else:
             break  # No more results from Google PSE, break the loop
 
+    return _get_results(all_results, filter_list)
+
+
+async def asearch_google_pse(
+    api_key: str,
+    search_engine_id: str,
+    query: str,
+    count: int,
+    filter_list: Optional[list[str]] = None,
+) -> list[SearchResult]:
+    """Async version of search_google_pse, using the pooled HTTP session."""
+    all_results = []
+    start_index = 1
+
+    while count > 0:
+        url, headers, params = _get_request(
+            api_key, search_engine_id, query, count, start_index
+        )
+        json_response = await afetch_json("GET", url, headers=headers, params=params)
+        results = json_response.get("items", [])
+        if not results:
+            break
+        all_results.extend(results)
+        count -= len(results)
+        start_index += 10
+
+    return _get_results(all_results, filter_list)
+
+
+def _get_request(
+    api_key: str, search_engine_id: str, query: str, count: int, start_index: int
+) -> tuple[str, dict, dict]:
+    url = "https://www.googleapis.com/customsearch/v1"
+    headers = {"Content-Type": "application/json"}
+    num_results_this_page = min(count, 10)  # Google PSE max results per page is 10
+    params = {
+        "cx": search_engine_id,
+        "q": query,
+        "key": api_key,
+        "num": num_results_this_page,
+        "start": start_index,
+    }
+    return url, headers, params
+
+
+def _get_results(
+    all_results: list[dict], filter_list: Optional[list[str]]
+) -> list[SearchResult]:
     if filter_list:
         all_results = get_filtered_results(all_results, filter_list)
 
@@ -1,7 +1,7 @@
 import logging
 
 import requests
-from open_webui.retrieval.web.main import SearchResult
+from open_webui.retrieval.web.main import SearchResult, afetch_json
 from open_webui.env import SRC_LOG_LEVELS
 from yarl import URL
 
@@ -19,6 +19,20 @@ def search_jina(api_key: str, query: str, count: int) -> list[SearchResult]:
     Returns:
         list[SearchResult]: A list of search results
     """
+    url, headers, payload = _get_request(api_key, query, count)
+    response = requests.post(url, headers=headers, json=payload)
+    response.raise_for_status()
+    return _get_results(response.json())
+
+
+async def asearch_jina(api_key: str, query: str, count: int) -> list[SearchResult]:
+    """Async version of search_jina, using the pooled HTTP session."""
+    url, headers, payload = _get_request(api_key, query, count)
+    data = await afetch_json("POST", url, headers=headers, json=payload)
+    return _get_results(data)
+
+
+def _get_request(api_key: str, query: str, count: int) -> tuple[str, dict, dict]:
     jina_search_endpoint = "https://s.jina.ai/"
 
     headers = {
@@ -31,10 +45,10 @@ def search_jina(api_key: str, query: str, count: int) -> list[SearchResult]:
     payload = {"q": query, "count": count if count <= 10 else 10}
 
     url = str(URL(jina_search_endpoint))
-    response = requests.post(url, headers=headers, json=payload)
-    response.raise_for_status()
-    data = response.json()
+    return url, headers, payload
+
 
+def _get_results(data: dict) -> list[SearchResult]:
     results = []
     for result in data["data"]:
         results.append(
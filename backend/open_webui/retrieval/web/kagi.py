@@ -2,7 +2,11 @@ import logging
 from typing import Optional
 
 import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.main import (
+    SearchResult,
+    afetch_json,
+    get_filtered_results,
+)
 from open_webui.env import SRC_LOG_LEVELS
 
 log = logging.getLogger(__name__)
@@ -21,15 +25,34 @@ def search_kagi(
         query (str): The query to search for
         count (int): The number of results to return
     """
+    url, headers, params = _get_request(api_key, query, count)
+
+    response = requests.get(url, headers=headers, params=params)
+    response.raise_for_status()
+    return _get_results(response.json(), filter_list)
+
+
+async def asearch_kagi(
+    api_key: str, query: str, count: int, filter_list: Optional[list[str]] = None
+) -> list[SearchResult]:
+    """Async version of search_kagi, using the pooled HTTP session."""
+    url, headers, params = _get_request(api_key, query, count)
+    json_response = await afetch_json("GET", url, headers=headers, params=params)
+    return _get_results(json_response, filter_list)
+
+
+def _get_request(api_key: str, query: str, count: int) -> tuple[str, dict, dict]:
     url = "https://kagi.com/api/v0/search"
     headers = {
         "Authorization": f"Bot {api_key}",
     }
     params = {"q": query, "limit": count}
+    return url, headers, params
 
-    response = requests.get(url, headers=headers, params=params)
-    response.raise_for_status()
-    json_response = response.json()
+
+def _get_results(
+    json_response: dict, filter_list: Optional[list[str]]
+) -> list[SearchResult]:
     search_results = json_response.get("data", [])
 
     results = [
@@ -5,6 +5,8 @@ from urllib.parse import urlparse
 
 from pydantic import BaseModel
 
+from open_webui.utils.http_client import get_http_session
+
 
 def get_filtered_results(results, filter_list):
     if not filter_list:
@@ -24,3 +26,14 @@ class SearchResult(BaseModel):
     link: str
     title: Optional[str]
     snippet: Optional[str]
+
+
+async def afetch_json(
+    method: str, url: str, raise_for_status: bool = True, **kwargs
+) -> dict:
+    """Send a request with the pooled web search HTTP session and return the JSON body."""
+    session = get_http_session("web_search")
+    async with session.request(method, url, **kwargs) as response:
+        if raise_for_status:
+            response.raise_for_status()
+        return await response.json(content_type=None)
@@ -0,0 +1,127 @@
+import asyncio
+import hashlib
+import json
+import logging
+from collections import defaultdict
+from typing import Awaitable, Callable, Optional
+
+from open_webui.config import (
+    WEB_SEARCH_RESULT_CACHE,
+    WEB_SEARCH_RESULT_CACHE_TTL,
+    WEB_SEARCH_RESULT_CACHE_MAX_ENTRIES,
+)
+from open_webui.env import SRC_LOG_LEVELS
+from open_webui.retrieval.web.main import SearchResult
+from open_webui.utils.cache import Cache, get_cache
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.split()).lower()
+
+
+def get_search_cache_key(
+    engine: str, query: str, count: int, filter_list: Optional[list[str]]
+) -> str:
+    key = json.dumps([engine, normalize_query(query), count, sorted(filter_list or [])])
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+class SearchResultCache:
+    """
+    Search engine results keyed by (engine, normalised query, count, filter list).
+
+    Concurrent identical searches share a single upstream call, whether or
+    not its results end up cached. Hits, misses and shared calls are
+    counted per engine and per process.
+    """
+
+    def __init__(self, cache: Cache):
+        self.cache = cache
+
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._stats = defaultdict(lambda: {"hits": 0, "misses": 0, "shared": 0})
+
+    def get(self, key: str) -> Optional[list[SearchResult]]:
+        try:
+            data = self.cache.get(key)
+        except Exception as e:
+            log.warning(f"Failed to read search result cache: {e}")
+            return None
+        return (
+            [SearchResult(**r) for r in json.loads(data)] if data is not None else None
+        )
+
+    def set(self, key: str, results: list[SearchResult]) -> None:
+        try:
+            self.cache.set(key, json.dumps([r.model_dump() for r in results]).encode())
+        except Exception as e:
+            log.warning(f"Failed to write search result cache: {e}")
+
+    async def get_or_search(
+        self,
+        engine: str,
+        query: str,
+        count: int,
+        filter_list: Optional[list[str]],
+        search: Callable[[], Awaitable[list[SearchResult]]],
+    ) -> list[SearchResult]:
+        key = get_search_cache_key(engine, query, count, filter_list)
+        stats = self._stats[engine]
+
+        # The Redis cache blocks, keep it off the event loop
+        results = await asyncio.to_thread(self.get, key)
+        if results is not None:
+            stats["hits"] += 1
+            return results
+
+        task = self._inflight.get(key)
+        if task is not None:
+            stats["shared"] += 1
+        else:
+            stats["misses"] += 1
+
+            async def search_and_cache() -> list[SearchResult]:
+                try:
+                    results = await search()
+                    # Empty results and errors are often transient, retry them next time
+                    if results:
+                        await asyncio.to_thread(self.set, key, results)
+                    return results
+                finally:
+                    self._inflight.pop(key, None)
+
+            task = asyncio.ensure_future(search_and_cache())
+            self._inflight[key] = task
+
+        # A waiter that gives up must not cancel the call the others share
+        return await asyncio.shield(task)
+
+    def get_stats(self) -> dict:
+        # Shared calls count as hits, neither of them reached the search engine
+        return {
+            engine: {
+                **stats,
+                "hit_ratio": (
+                    (stats["hits"] + stats["shared"]) / total
+                    if (total := stats["hits"] + stats["misses"] + stats["shared"])
+                    else 0.0
+                ),
+            }
+            for engine, stats in self._stats.items()
+        }
+
+
+def get_search_result_cache(store: str) -> Optional[SearchResultCache]:
+    cache = get_cache(
+        store,
+        "web-search",
+        ttl=WEB_SEARCH_RESULT_CACHE_TTL,
+        max_entries=WEB_SEARCH_RESULT_CACHE_MAX_ENTRIES,
+    )
+    return SearchResultCache(cache) if cache is not None else None
+
+
+SEARCH_RESULT_CACHE = get_search_result_cache(WEB_SEARCH_RESULT_CACHE)
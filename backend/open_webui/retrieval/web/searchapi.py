@@ -3,7 +3,11 @@ from typing import Optional
 from urllib.parse import urlencode
 
 import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.main import (
+    SearchResult,
+    afetch_json,
+    get_filtered_results,
+)
 from open_webui.env import SRC_LOG_LEVELS
 
 log = logging.getLogger(__name__)
@@ -23,16 +27,38 @@ def search_searchapi(
       api_key (str): A searchapi.io API key
       query (str): The query to search for
     """
+    url = _get_url(api_key, engine, query)
+    response = requests.request("GET", url)
+
+    return _get_results(response.json(), count, filter_list)
+
+
+async def asearch_searchapi(
+    api_key: str,
+    engine: str,
+    query: str,
+    count: int,
+    filter_list: Optional[list[str]] = None,
+) -> list[SearchResult]:
+    """Async version of search_searchapi, using the pooled HTTP session."""
+    url = _get_url(api_key, engine, query)
+    json_response = await afetch_json("GET", url, raise_for_status=False)
+    return _get_results(json_response, count, filter_list)
+
+
+def _get_url(api_key: str, engine: str, query: str) -> str:
     url = "https://www.searchapi.io/api/v1/search"
 
     engine = engine or "google"
 
     payload = {"engine": engine, "q": query, "api_key": api_key}
 
-    url = f"{url}?{urlencode(payload)}"
-    response = requests.request("GET", url)
+    return f"{url}?{urlencode(payload)}"
+
 
-    json_response = response.json()
+def _get_results(
+    json_response: dict, count: int, filter_list: Optional[list[str]]
+) -> list[SearchResult]:
     log.info(f"results from searchapi search: {json_response}")
 
     results = sorted(
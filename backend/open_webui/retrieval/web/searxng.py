@@ -2,7 +2,11 @@ import logging
 from typing import Optional
 
 import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.main import (
+    SearchResult,
+    afetch_json,
+    get_filtered_results,
+)
 from open_webui.env import SRC_LOG_LEVELS
 
 log = logging.getLogger(__name__)
@@ -39,6 +43,34 @@ def search_searxng(
         requests.exceptions.RequestException: If a request error occurs during the search process.
     """
 
+    query_url, headers, params = _get_request(query_url, query, **kwargs)
+
+    log.debug(f"searching {query_url}")
+
+    response = requests.get(query_url, headers=headers, params=params)
+
+    response.raise_for_status()  # Raise an exception for HTTP errors.
+
+    return _get_results(response.json(), count, filter_list)
+
+
+async def asearch_searxng(
+    query_url: str,
+    query: str,
+    count: int,
+    filter_list: Optional[list[str]] = None,
+    **kwargs,
+) -> list[SearchResult]:
+    """Async version of search_searxng, using the pooled HTTP session."""
+    query_url, headers, params = _get_request(query_url, query, **kwargs)
+
+    log.debug(f"searching {query_url}")
+
+    json_response = await afetch_json("GET", query_url, headers=headers, params=params)
+    return _get_results(json_response, count, filter_list)
+
+
+def _get_request(query_url: str, query: str, **kwargs) -> tuple[str, dict, dict]:
     # Default values for optional parameters are provided as empty strings or None when not specified.
     language = kwargs.get("language", "en-US")
     safesearch = kwargs.get("safesearch", "1")
@@ -62,23 +94,19 @@ def search_searxng(
         # Strip all query parameters from the URL
         query_url = query_url.split("?")[0]
 
-    log.debug(f"searching {query_url}")
-
-    response = requests.get(
-        query_url,
-        headers={
-            "User-Agent": "Open WebUI (https://github.com/open-webui/open-webui) RAG Bot",
-            "Accept": "text/html",
-            "Accept-Encoding": "gzip, deflate",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Connection": "keep-alive",
-        },
-        params=params,
-    )
+    headers = {
+        "User-Agent": "Open WebUI (https://github.com/open-webui/open-webui) RAG Bot",
+        "Accept": "text/html",
+        "Accept-Encoding": "gzip, deflate",
+        "Accept-Language": "en-US,en;q=0.5",
+        "Connection": "keep-alive",
+    }
+    return query_url, headers, params
 
-    response.raise_for_status()  # Raise an exception for HTTP errors.
 
-    json_response = response.json()
+def _get_results(
+    json_response: dict, count: int, filter_list: Optional[list[str]]
+) -> list[SearchResult]:
     results = json_response.get("results", [])
     sorted_results = sorted(results, key=lambda x: x.get("score", 0), reverse=True)
     if filter_list:
@@ -3,7 +3,11 @@ import logging
 from typing import Optional
 
 import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.main import (
+    SearchResult,
+    afetch_json,
+    get_filtered_results,
+)
 from open_webui.env import SRC_LOG_LEVELS
 
 log = logging.getLogger(__name__)
@@ -19,15 +23,32 @@ def search_serper(
         api_key (str): A serper.dev API key
         query (str): The query to search for
     """
-    url = "https://google.serper.dev/search"
+    url, headers, payload = _get_request(api_key, query)
+
+    response = requests.request("POST", url, headers=headers, data=json.dumps(payload))
+    response.raise_for_status()
+
+    return _get_results(response.json(), count, filter_list)
+
+
+async def asearch_serper(
+    api_key: str, query: str, count: int, filter_list: Optional[list[str]] = None
+) -> list[SearchResult]:
+    """Async version of search_serper, using the pooled HTTP session."""
+    url, headers, payload = _get_request(api_key, query)
+    json_response = await afetch_json("POST", url, headers=headers, json=payload)
+    return _get_results(json_response, count, filter_list)
+
 
-    payload = json.dumps({"q": query})
+def _get_request(api_key: str, query: str) -> tuple[str, dict, dict]:
+    url = "https://google.serper.dev/search"
     headers = {"X-API-KEY": api_key, "Content-Type": "application/json"}
+    return url, headers, {"q": query}
 
-    response = requests.request("POST", url, headers=headers, data=payload)
-    response.raise_for_status()
 
-    json_response = response.json()
+def _get_results(
+    json_response: dict, count: int, filter_list: Optional[list[str]]
+) -> list[SearchResult]:
     results = sorted(
         json_response.get("organic", []), key=lambda x: x.get("position", 0)
     )
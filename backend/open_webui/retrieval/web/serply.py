@@ -3,7 +3,11 @@ from typing import Optional
 from urllib.parse import urlencode
 
 import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.main import (
+    SearchResult,
+    afetch_json,
+    get_filtered_results,
+)
 from open_webui.env import SRC_LOG_LEVELS
 
 log = logging.getLogger(__name__)
@@ -30,6 +34,38 @@ def search_serply(
     """
     log.info("Searching with Serply")
 
+    url, headers = _get_request(api_key, query, hl, limit, device_type, proxy_location)
+
+    response = requests.request("GET", url, headers=headers)
+    response.raise_for_status()
+
+    return _get_results(response.json(), count, filter_list)
+
+
+async def asearch_serply(
+    api_key: str,
+    query: str,
+    count: int,
+    hl: str = "us",
+    limit: int = 10,
+    device_type: str = "desktop",
+    proxy_location: str = "US",
+    filter_list: Optional[list[str]] = None,
+) -> list[SearchResult]:
+    """Async version of search_serply, using the pooled HTTP session."""
+    url, headers = _get_request(api_key, query, hl, limit, device_type, proxy_location)
+    json_response = await afetch_json("GET", url, headers=headers)
+    return _get_results(json_response, count, filter_list)
+
+
+def _get_request(
+    api_key: str,
+    query: str,
+    hl: str,
+    limit: int,
+    device_type: str,
+    proxy_location: str,
+) -> tuple[str, dict]:
     url = "https://api.serply.io/v1/search/"
 
     query_payload = {
@@ -47,11 +83,12 @@ def search_serply(
         "User-Agent": "open-webui",
         "X-Proxy-Location": proxy_location,
     }
+    return url, headers
 
-    response = requests.request("GET", url, headers=headers)
-    response.raise_for_status()
 
-    json_response = response.json()
+def _get_results(
+    json_response: dict, count: int, filter_list: Optional[list[str]]
+) -> list[SearchResult]:
     log.info(f"results from serply search: {json_response}")
 
     results = sorted(
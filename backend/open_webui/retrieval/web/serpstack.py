@@ -2,7 +2,11 @@ import logging
 from typing import Optional
 
 import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.main import (
+    SearchResult,
+    afetch_json,
+    get_filtered_results,
+)
 from open_webui.env import SRC_LOG_LEVELS
 
 log = logging.getLogger(__name__)
@@ -23,6 +27,30 @@ def search_serpstack(
         query (str): The query to search for
         https_enabled (bool): Whether to use HTTPS or HTTP for the API request
     """
+    url, headers, params = _get_request(api_key, query, https_enabled)
+
+    response = requests.request("POST", url, headers=headers, params=params)
+    response.raise_for_status()
+
+    return _get_results(response.json(), count, filter_list)
+
+
+async def asearch_serpstack(
+    api_key: str,
+    query: str,
+    count: int,
+    filter_list: Optional[list[str]] = None,
+    https_enabled: bool = True,
+) -> list[SearchResult]:
+    """Async version of search_serpstack, using the pooled HTTP session."""
+    url, headers, params = _get_request(api_key, query, https_enabled)
+    json_response = await afetch_json("POST", url, headers=headers, params=params)
+    return _get_results(json_response, count, filter_list)
+
+
+def _get_request(
+    api_key: str, query: str, https_enabled: bool
+) -> tuple[str, dict, dict]:
     url = f"{'https' if https_enabled else 'http'}://api.serpstack.com/search"
 
     headers = {"Content-Type": "application/json"}
@@ -30,11 +58,12 @@ def search_serpstack(
         "access_key": api_key,
         "query": query,
     }
+    return url, headers, params
 
-    response = requests.request("POST", url, headers=headers, params=params)
-    response.raise_for_status()
 
-    json_response = response.json()
+def _get_results(
+    json_response: dict, count: int, filter_list: Optional[list[str]]
+) -> list[SearchResult]:
     results = sorted(
         json_response.get("organic_results", []), key=lambda x: x.get("position", 0)
     )
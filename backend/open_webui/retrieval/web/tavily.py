@@ -2,7 +2,11 @@ import logging
 from typing import Optional
 
 import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.main import (
+    SearchResult,
+    afetch_json,
+    get_filtered_results,
+)
 from open_webui.env import SRC_LOG_LEVELS
 
 log = logging.getLogger(__name__)
@@ -26,17 +30,38 @@ def search_tavily(
     Returns:
         list[SearchResult]: A list of search results
     """
+    url, headers, data = _get_request(api_key, query, count)
+    response = requests.post(url, headers=headers, json=data)
+    response.raise_for_status()
+
+    return _get_results(response.json(), filter_list)
+
+
+async def asearch_tavily(
+    api_key: str,
+    query: str,
+    count: int,
+    filter_list: Optional[list[str]] = None,
+) -> list[SearchResult]:
+    """Async version of search_tavily, using the pooled HTTP session."""
+    url, headers, data = _get_request(api_key, query, count)
+    json_response = await afetch_json("POST", url, headers=headers, json=data)
+    return _get_results(json_response, filter_list)
+
+
+def _get_request(api_key: str, query: str, count: int) -> tuple[str, dict, dict]:
     url = "https://api.tavily.com/search"
     headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {api_key}",
     }
     data = {"query": query, "max_results": count}
-    response = requests.post(url, headers=headers, json=data)
-    response.raise_for_status()
+    return url, headers, data
 
-    json_response = response.json()
 
+def _get_results(
+    json_response: dict, filter_list: Optional[list[str]]
+) -> list[SearchResult]:
     results = json_response.get("results", [])
     if filter_list:
         results = get_filtered_results(results, filter_list)
@@ -12,6 +12,7 @@ from typing import (
     Dict,
     Iterator,
     List,
+    Mapping,
     Optional,
     Sequence,
     Union,
@@ -26,6 +27,7 @@ from langchain_community.document_loaders.base import BaseLoader
 from langchain_core.documents import Document
 from open_webui.retrieval.loaders.tavily import TavilyLoader
 from open_webui.retrieval.loaders.external_web import ExternalWebLoader
+from open_webui.retrieval.web.cache import WEB_PAGE_CACHE, WebPageCache
 from open_webui.constants import ERROR_MESSAGES
 from open_webui.config import (
     ENABLE_RAG_LOCAL_WEB_FETCH,
@@ -38,6 +40,12 @@ from open_webui.config import (
     TAVILY_EXTRACT_DEPTH,
     EXTERNAL_WEB_LOADER_URL,
     EXTERNAL_WEB_LOADER_API_KEY,
+    WEB_SEARCH_RATE_LIMIT,
+    WEB_SEARCH_ENGINE_RATE_LIMITS,
+    WEB_LOADER_MAX_BYTES,
+    WEB_LOADER_URL_TIMEOUT,
+    WEB_LOADER_TIMEOUT,
+    WEB_LOADER_CONCURRENT_REQUESTS_PER_DOMAIN,
 )
 from open_webui.env import SRC_LOG_LEVELS, AIOHTTP_CLIENT_SESSION_SSL
 
@@ -102,6 +110,22 @@ def extract_metadata(soup, url):
     return metadata
 
 
+# Content types worth extracting text from, anything else is dropped unread
+TEXT_CONTENT_TYPES = (
+    "text/",
+    "application/xhtml+xml",
+    "application/xml",
+    "application/rss+xml",
+    "application/atom+xml",
+    "application/json",
+)
+
+
+def is_text_content_type(content_type: Optional[str]) -> bool:
+    # A missing content type is common enough on small sites to give it a try
+    return not content_type or content_type.lower().startswith(TEXT_CONTENT_TYPES)
+
+
 def verify_ssl_cert(url: str) -> bool:
     """Verify SSL certificate for the given URL."""
     if not url.startswith("https://"):
@@ -140,6 +164,33 @@ class RateLimitMixin:
         self.last_request_time = datetime.now()
 
 
+class SearchEngineRateLimiter(RateLimitMixin):
+    """Spaces out the requests sent to a single search engine across all callers."""
+
+    def __init__(self, requests_per_second: Optional[float] = None):
+        self.requests_per_second = requests_per_second
+        self.last_request_time = None
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        # Serialised so concurrent searches do not all see the same last request
+        async with self._lock:
+            await self._wait_for_rate_limit()
+
+
+_search_rate_limiters: Dict[str, SearchEngineRateLimiter] = {}
+
+
+def get_search_rate_limiter(engine: str) -> SearchEngineRateLimiter:
+    limiter = _search_rate_limiters.get(engine)
+    if limiter is None:
+        limiter = SearchEngineRateLimiter(
+            WEB_SEARCH_ENGINE_RATE_LIMITS.get(engine, WEB_SEARCH_RATE_LIMIT) or None
+        )
+        _search_rate_limiters[engine] = limiter
+    return limiter
+
+
 class URLProcessingMixin:
     def _verify_ssl_cert(self, url: str) -> bool:
         """Verify SSL certificate for a URL."""
@@ -439,17 +490,41 @@ class SafePlaywrightURLLoader(PlaywrightURLLoader, RateLimitMixin, URLProcessing
             else:
                 browser = p.chromium.launch(headless=self.headless, proxy=self.proxy)
 
+            deadline = (
+                datetime.now() + timedelta(seconds=WEB_LOADER_TIMEOUT)
+                if WEB_LOADER_TIMEOUT
+                else None
+            )
             for url in self.urls:
+                if deadline is not None and datetime.now() >= deadline:
+                    log.warning(
+                        f"Web loader time budget of {WEB_LOADER_TIMEOUT}s exceeded, "
+                        "skipping remaining urls"
+                    )
+                    break
+                # The sync API cannot be cancelled, bound Playwright's own waits
+                timeout = self._get_page_timeout(
+                    (deadline - datetime.now()).total_seconds() if deadline else None
+                )
                 try:
                     self._safe_process_url_sync(url)
                     page = browser.new_page()
-                    response = page.goto(url, timeout=self.playwright_timeout)
-                    if response is None:
-                        raise ValueError(f"page.goto() returned None for url {url}")
-
-                    text = self.evaluator.evaluate(page, browser, response)
+                    try:
+                        if timeout is not None:
+                            page.set_default_timeout(timeout)
+                        response = page.goto(url, timeout=timeout)
+                        if response is None:
+                            raise ValueError(f"page.goto() returned None for url {url}")
+                        self._check_content_type(url, response.headers)
+
+                        text = self.evaluator.evaluate(page, browser, response)
+                    finally:
+                        page.close()
                     metadata = {"source": url}
-                    yield Document(page_content=text, metadata=metadata)
+                    yield Document(
+                        page_content=text[: WEB_LOADER_MAX_BYTES or None],
+                        metadata=metadata,
+                    )
                 except Exception as e:
                     if self.continue_on_failure:
                         log.exception(f"Error loading {url}: {e}")
@@ -457,6 +532,42 @@ class SafePlaywrightURLLoader(PlaywrightURLLoader, RateLimitMixin, URLProcessing
                     raise e
             browser.close()
 
+    def _get_page_timeout(self, remaining: Optional[float]) -> Optional[float]:
+        """Milliseconds a page may take, within WEB_LOADER_URL_TIMEOUT and `remaining` seconds."""
+        timeouts = [
+            timeout
+            for timeout in (
+                self.playwright_timeout,
+                WEB_LOADER_URL_TIMEOUT * 1000 if WEB_LOADER_URL_TIMEOUT else None,
+                remaining * 1000 if remaining is not None else None,
+            )
+            if timeout is not None
+        ]
+        return min(timeouts) if timeouts else None
+
+    def _check_content_type(self, url: str, headers: Dict[str, str]):
+        content_type = headers.get("content-type", "").split(";")[0].strip()
+        if not is_text_content_type(content_type):
+            raise ValueError(f"Unsupported content type {content_type} for {url}")
+
+    async def _aload_page(self, browser, url: str) -> Document:
+        await self._safe_process_url(url)
+        page = await browser.new_page()
+        try:
+            response = await page.goto(url, timeout=self.playwright_timeout)
+            if response is None:
+                raise ValueError(f"page.goto() returned None for url {url}")
+            self._check_content_type(url, response.headers)
+
+            text = await self.evaluator.evaluate_async(page, browser, response)
+        finally:
+            await page.close()
+
+        metadata = {"source": url}
+        return Document(
+            page_content=text[: WEB_LOADER_MAX_BYTES or None], metadata=metadata
+        )
+
     async def alazy_load(self) -> AsyncIterator[Document]:
         """Safely load URLs asynchronously with support for remote browser."""
         from playwright.async_api import async_playwright
@@ -470,17 +581,23 @@ class SafePlaywrightURLLoader(PlaywrightURLLoader, RateLimitMixin, URLProcessing
                     headless=self.headless, proxy=self.proxy
                 )
 
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + WEB_LOADER_TIMEOUT if WEB_LOADER_TIMEOUT else None
             for url in self.urls:
+                timeout = WEB_LOADER_URL_TIMEOUT or None
+                if deadline is not None:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        log.warning(
+                            f"Web loader time budget of {WEB_LOADER_TIMEOUT}s exceeded, "
+                            "skipping remaining urls"
+                        )
+                        break
+                    timeout = min(timeout or remaining, remaining)
                 try:
-                    await self._safe_process_url(url)
-                    page = await browser.new_page()
-                    response = await page.goto(url, timeout=self.playwright_timeout)
-                    if response is None:
-                        raise ValueError(f"page.goto() returned None for url {url}")
-
-                    text = await self.evaluator.evaluate_async(page, browser, response)
-                    metadata = {"source": url}
-                    yield Document(page_content=text, metadata=metadata)
+                    async with asyncio.timeout(timeout):
+                        document = await self._aload_page(browser, url)
+                    yield document
                 except Exception as e:
                     if self.continue_on_failure:
                         log.exception(f"Error loading {url}: {e}")
@@ -500,15 +617,30 @@ class SafeWebBaseLoader(WebBaseLoader):
         """
         super().__init__(*args, **kwargs)
         self.trust_env = trust_env
+        self._domain_semaphores: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(WEB_LOADER_CONCURRENT_REQUESTS_PER_DOMAIN)
+        )
 
     async def _fetch(
         self, url: str, retries: int = 3, cooldown: int = 2, backoff: float = 1.5
     ) -> str:
+        _, text, _ = await self._fetch_response(url, retries, cooldown, backoff)
+        return text
+
+    async def _fetch_response(
+        self,
+        url: str,
+        retries: int = 3,
+        cooldown: int = 2,
+        backoff: float = 1.5,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> tuple[int, str, Mapping[str, str]]:
+        """Fetch a url, returning the status, the body and the response headers."""
         async with aiohttp.ClientSession(trust_env=self.trust_env) as session:
             for i in range(retries):
                 try:
                     kwargs: Dict = dict(
-                        headers=self.session.headers,
+                        headers=self.session.headers | (headers or {}),
                         cookies=self.session.cookies.get_dict(),
                     )
                     if not self.session.verify:
@@ -518,9 +650,26 @@ class SafeWebBaseLoader(WebBaseLoader):
                         url,
                         **(self.requests_kwargs | kwargs),
                     ) as response:
+                        if response.status == 304:
+                            return response.status, "", response.headers.copy()
                         if self.raise_for_status:
                             response.raise_for_status()
-                        return await response.text()
+                        # Not response.content_type, aiohttp reports a missing
+                        # header as application/octet-stream
+                        content_type = (
+                            response.headers.get("Content-Type", "")
+                            .split(";")[0]
+                            .strip()
+                        )
+                        if not is_text_content_type(content_type):
+                            raise ValueError(
+                                f"Unsupported content type {content_type} for {url}"
+                            )
+                        return (
+                            response.status,
+                            await self._read_text(url, response),
+                            response.headers.copy(),
+                        )
                 except aiohttp.ClientConnectionError as e:
                     if i == retries - 1:
                         raise
@@ -532,6 +681,23 @@ class SafeWebBaseLoader(WebBaseLoader):
                         await asyncio.sleep(cooldown * backoff**i)
         raise ValueError("retry count exceeded")
 
+    async def _read_text(self, url: str, response: aiohttp.ClientResponse) -> str:
+        """Stream the body, stopping once WEB_LOADER_MAX_BYTES have been read."""
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if WEB_LOADER_MAX_BYTES and size >= WEB_LOADER_MAX_BYTES:
+                log.info(f"Truncating {url} at {WEB_LOADER_MAX_BYTES} bytes")
+                break
+
+        body = b"".join(chunks)[: WEB_LOADER_MAX_BYTES or None]
+        try:
+            return body.decode(response.charset or "utf-8", errors="replace")
+        except LookupError:
+            return body.decode("utf-8", errors="replace")
+
     def _unpack_fetch_results(
         self, results: Any, urls: List[str], parser: Union[str, None] = None
     ) -> List[Any]:
@@ -557,36 +723,107 @@ class SafeWebBaseLoader(WebBaseLoader):
         results = await self.fetch_all(urls)
         return self._unpack_fetch_results(results, urls, parser=parser)
 
+    def _get_cached_document(self, url: str, entry: dict) -> Document:
+        return Document(
+            page_content=entry["text"], metadata={"source": url, **entry["metadata"]}
+        )
+
     def lazy_load(self) -> Iterator[Document]:
         """Lazy load text from the url(s) in web_path with error handling."""
         for path in self.web_paths:
             try:
+                entry = WEB_PAGE_CACHE.get(path) if WEB_PAGE_CACHE else None
+                if entry and WEB_PAGE_CACHE.is_fresh(entry):
+                    yield self._get_cached_document(path, entry)
+                    continue
+
                 soup = self._scrape(path, bs_kwargs=self.bs_kwargs)
                 text = soup.get_text(**self.bs_get_text_kwargs)
 
                 # Build metadata
                 metadata = extract_metadata(soup, path)
 
+                if WEB_PAGE_CACHE and text:
+                    WEB_PAGE_CACHE.set(path, text, metadata)
+
                 yield Document(page_content=text, metadata=metadata)
             except Exception as e:
                 # Log the error and continue with the next URL
                 log.exception(f"Error loading {path}: {e}")
 
+    async def _aload_url(self, url: str, semaphore: asyncio.Semaphore) -> Document:
+        """Load a single url, serving it from the page cache when possible."""
+        # The disk and Redis caches block, keep them off the event loop
+        entry = (
+            await asyncio.to_thread(WEB_PAGE_CACHE.get, url) if WEB_PAGE_CACHE else None
+        )
+        if entry and WEB_PAGE_CACHE.is_fresh(entry):
+            # Fresh enough to skip both the request and the parse
+            return self._get_cached_document(url, entry)
+
+        domain = urllib.parse.urlparse(url).hostname or ""
+        async with semaphore, self._domain_semaphores[domain]:
+            try:
+                async with asyncio.timeout(WEB_LOADER_URL_TIMEOUT or None):
+                    status, html, headers = await self._fetch_response(
+                        url, headers=WebPageCache.get_validators(entry)
+                    )
+            except Exception as e:
+                if entry:
+                    log.warning(f"Error fetching {url}, serving cached copy: {e}")
+                    return self._get_cached_document(url, entry)
+                if not self.continue_on_failure:
+                    raise e
+                log.warning(
+                    f"Error fetching {url}, skipping due to continue_on_failure=True: {e}"
+                )
+                status, html, headers = 0, "", {}
+
+        if status == 304 and entry:
+            await asyncio.to_thread(WEB_PAGE_CACHE.touch, url, entry)
+            return self._get_cached_document(url, entry)
+
+        soup = self._unpack_fetch_results([html], [url])[0]
+        text = soup.get_text(**self.bs_get_text_kwargs)
+        metadata = extract_metadata(soup, url)
+
+        if WEB_PAGE_CACHE and status == 200 and text:
+            await asyncio.to_thread(
+                WEB_PAGE_CACHE.set,
+                url,
+                text,
+                metadata,
+                etag=headers.get("ETag"),
+                last_modified=headers.get("Last-Modified"),
+            )
+
+        return Document(page_content=text, metadata=metadata)
+
     async def alazy_load(self) -> AsyncIterator[Document]:
         """Async lazy load text from the url(s) in web_path."""
-        results = await self.ascrape_all(self.web_paths)
-        for path, soup in zip(self.web_paths, results):
-            text = soup.get_text(**self.bs_get_text_kwargs)
-            metadata = {"source": path}
-            if title := soup.find("title"):
-                metadata["title"] = title.get_text()
-            if description := soup.find("meta", attrs={"name": "description"}):
-                metadata["description"] = description.get(
-                    "content", "No description found."
-                )
-            if html := soup.find("html"):
-                metadata["language"] = html.get("lang", "No language found.")
-            yield Document(page_content=text, metadata=metadata)
+        semaphore = asyncio.Semaphore(self.requests_per_second)
+        tasks = [
+            asyncio.create_task(self._aload_url(path, semaphore))
+            for path in self.web_paths
+        ]
+        if not tasks:
+            return
+
+        # Return whatever finished within the time budget instead of waiting
+        # for the slowest host.
+        done, pending = await asyncio.wait(tasks, timeout=WEB_LOADER_TIMEOUT or None)
+        if pending:
+            log.warning(
+                f"Web loader time budget of {WEB_LOADER_TIMEOUT}s exceeded, "
+                f"skipping {len(pending)} of {len(tasks)} urls"
+            )
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        for task in tasks:
+            if task in done:
+                yield task.result()
 
     async def aload(self) -> list[Document]:
         """Load data into Document objects."""
@@ -1,7 +1,11 @@
+import asyncio
 import hashlib
+import io
 import json
 import logging
 import os
+import re
+import threading
 import uuid
 from functools import lru_cache
 from pathlib import Path
@@ -28,7 +32,7 @@ from fastapi import (
     APIRouter,
 )
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel
 
 
@@ -36,7 +40,6 @@ from open_webui.utils.auth import get_admin_user, get_verified_user
 from open_webui.config import (
     WHISPER_MODEL_AUTO_UPDATE,
     WHISPER_MODEL_DIR,
-    CACHE_DIR,
     WHISPER_LANGUAGE,
 )
 
@@ -48,7 +51,9 @@ from open_webui.env import (
     SRC_LOG_LEVELS,
     DEVICE_TYPE,
     ENABLE_FORWARD_USER_INFO_HEADERS,
+    SPEECH_SENTENCE_CONCURRENCY,
 )
+from open_webui.utils.speech_cache import SPEECH_CACHE
 
 
 router = APIRouter()
@@ -62,8 +67,11 @@ AZURE_MAX_FILE_SIZE = AZURE_MAX_FILE_SIZE_MB * 1024 * 1024  # Convert MB to byte
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["AUDIO"])
 
-SPEECH_CACHE_DIR = CACHE_DIR / "audio" / "speech"
-SPEECH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+# 逐句合成时使用的句子分隔规则（兼容中英文标点）
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+|(?<=[。！？；\n])")
+
+# transformers 管道不是线程安全的，同一时间只允许一个合成任务
+TRANSFORMERS_SPEECH_LOCK = threading.Lock()
 
 
 ##########################################
@@ -295,46 +303,76 @@ def load_speech_pipeline(request):
         )
 
 
-@router.post("/speech")
-async def speech(request: Request, user=Depends(get_verified_user)):
+def get_speech_cache_key(request: Request, payload: dict) -> tuple[str, dict]:
     """
-    文本转语音端点
-    
-    将文本转换为语音并返回音频文件
-    
+    计算语音缓存键
+
+    缓存键由引擎、模型、语音以及规范化后的请求负载共同决定，
+    因此同一段文本在不同语音下会分别缓存。
+
     参数:
         request: FastAPI请求对象
-        user: 已验证的用户
-        
+        payload: 语音合成请求负载
+
     返回:
-        FileResponse: 包含合成语音的音频文件
+        tuple[str, dict]: 缓存键和写入缓存索引的元数据
     """
-    body = await request.body()
-    name = hashlib.sha256(
-        body
-        + str(request.app.state.config.TTS_ENGINE).encode("utf-8")
-        + str(request.app.state.config.TTS_MODEL).encode("utf-8")
+    engine = request.app.state.config.TTS_ENGINE
+    model = request.app.state.config.TTS_MODEL
+
+    if engine == "azure":
+        voice = request.app.state.config.TTS_VOICE
+    else:
+        voice = payload.get("voice") or request.app.state.config.TTS_VOICE
+
+    metadata = {"engine": engine, "model": model, "voice": voice}
+    if engine == "azure":
+        metadata["format"] = request.app.state.config.TTS_AZURE_SPEECH_OUTPUT_FORMAT
+
+    key = hashlib.sha256(
+        json.dumps({**metadata, "payload": payload}, sort_keys=True).encode("utf-8")
     ).hexdigest()
+    return key, metadata
 
-    file_path = SPEECH_CACHE_DIR.joinpath(f"{name}.mp3")
-    file_body_path = SPEECH_CACHE_DIR.joinpath(f"{name}.json")
 
-    # 检查缓存中是否已存在文件
-    if file_path.is_file():
-        return FileResponse(file_path)
+def raise_speech_error(r, detail: Optional[str] = None):
+    raise HTTPException(
+        status_code=getattr(r, "status", 500) if r else 500,
+        detail=detail if detail else "Open WebUI: 服务器连接错误",
+    )
 
-    payload = None
+
+async def get_speech_error_detail(r, e: Exception) -> Optional[str]:
+    detail = None
     try:
-        payload = json.loads(body.decode("utf-8"))
-    except Exception as e:
-        log.exception(e)
-        raise HTTPException(status_code=400, detail="无效的JSON负载")
+        if r.status != 200:
+            res = await r.json()
+            if "error" in res:
+                detail = f"External: {res['error'].get('message', '')}"
+    except Exception:
+        detail = f"External: {e}"
+    return detail
+
+
+async def synthesize_speech(request: Request, payload: dict, user) -> bytes:
+    """
+    使用当前配置的TTS引擎合成语音
+
+    参数:
+        request: FastAPI请求对象
+        payload: 语音合成请求负载，至少包含 input 字段
+        user: 已验证的用户
+
+    返回:
+        bytes: 合成的音频数据
+    """
+    r = None
+    timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT)
 
     if request.app.state.config.TTS_ENGINE == "openai":
-        payload["model"] = request.app.state.config.TTS_MODEL
+        payload = {**payload, "model": request.app.state.config.TTS_MODEL}
 
         try:
-            timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT)
             async with aiohttp.ClientSession(
                 timeout=timeout, trust_env=True
             ) as session:
@@ -358,32 +396,11 @@ async def speech(request: Request, user=Depends(get_verified_user)):
                     ssl=AIOHTTP_CLIENT_SESSION_SSL,
                 ) as r:
                     r.raise_for_status()
-
-                    async with aiofiles.open(file_path, "wb") as f:
-                        await f.write(await r.read())
-
-                    async with aiofiles.open(file_body_path, "w") as f:
-                        await f.write(json.dumps(payload))
-
-            return FileResponse(file_path)
+                    return await r.read()
 
         except Exception as e:
             log.exception(e)
-            detail = None
-
-            try:
-                if r.status != 200:
-                    res = await r.json()
-
-                    if "error" in res:
-                        detail = f"External: {res['error'].get('message', '')}"
-            except Exception:
-                detail = f"External: {e}"
-
-            raise HTTPException(
-                status_code=getattr(r, "status", 500) if r else 500,
-                detail=detail if detail else "Open WebUI: 服务器连接错误",
-            )
+            raise_speech_error(r, await get_speech_error_detail(r, e))
 
     elif request.app.state.config.TTS_ENGINE == "elevenlabs":
         voice_id = payload.get("voice", "")
@@ -395,7 +412,6 @@ async def speech(request: Request, user=Depends(get_verified_user)):
             )
 
         try:
-            timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT)
             async with aiohttp.ClientSession(
                 timeout=timeout, trust_env=True
             ) as session:
@@ -414,39 +430,13 @@ async def speech(request: Request, user=Depends(get_verified_user)):
                     ssl=AIOHTTP_CLIENT_SESSION_SSL,
                 ) as r:
                     r.raise_for_status()
-
-                    async with aiofiles.open(file_path, "wb") as f:
-                        await f.write(await r.read())
-
-                    async with aiofiles.open(file_body_path, "w") as f:
-                        await f.write(json.dumps(payload))
-
-            return FileResponse(file_path)
+                    return await r.read()
 
         except Exception as e:
             log.exception(e)
-            detail = None
-
-            try:
-                if r.status != 200:
-                    res = await r.json()
-                    if "error" in res:
-                        detail = f"External: {res['error'].get('message', '')}"
-            except Exception:
-                detail = f"External: {e}"
-
-            raise HTTPException(
-                status_code=getattr(r, "status", 500) if r else 500,
-                detail=detail if detail else "Open WebUI: 服务器连接错误",
-            )
+            raise_speech_error(r, await get_speech_error_detail(r, e))
 
     elif request.app.state.config.TTS_ENGINE == "azure":
-        try:
-            payload = json.loads(body.decode("utf-8"))
-        except Exception as e:
-            log.exception(e)
-            raise HTTPException(status_code=400, detail="无效的JSON负载")
-
         region = request.app.state.config.TTS_AZURE_SPEECH_REGION or "eastus"
         base_url = request.app.state.config.TTS_AZURE_SPEECH_BASE_URL
         language = request.app.state.config.TTS_VOICE
@@ -457,7 +447,6 @@ async def speech(request: Request, user=Depends(get_verified_user)):
             data = f"""<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xml:lang="{locale}">
                 <voice name="{language}">{payload["input"]}</voice>
             </speak>"""
-            timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT)
             async with aiohttp.ClientSession(
                 timeout=timeout, trust_env=True
             ) as session:
@@ -473,43 +462,23 @@ async def speech(request: Request, user=Depends(get_verified_user)):
                     ssl=AIOHTTP_CLIENT_SESSION_SSL,
                 ) as r:
                     r.raise_for_status()
-
-                    async with aiofiles.open(file_path, "wb") as f:
-                        await f.write(await r.read())
-
-                    async with aiofiles.open(file_body_path, "w") as f:
-                        await f.write(json.dumps(payload))
-
-                    return FileResponse(file_path)
+                    return await r.read()
 
         except Exception as e:
             log.exception(e)
-            detail = None
+            raise_speech_error(r, await get_speech_error_detail(r, e))
 
-            try:
-                if r.status != 200:
-                    res = await r.json()
-                    if "error" in res:
-                        detail = f"External: {res['error'].get('message', '')}"
-            except Exception:
-                detail = f"External: {e}"
+    elif request.app.state.config.TTS_ENGINE == "transformers":
+        return await asyncio.to_thread(synthesize_transformers_speech, request, payload)
 
-            raise HTTPException(
-                status_code=getattr(r, "status", 500) if r else 500,
-                detail=detail if detail else "Open WebUI: 服务器连接错误",
-            )
+    raise HTTPException(status_code=400, detail="未配置TTS引擎")
 
-    elif request.app.state.config.TTS_ENGINE == "transformers":
-        payload = None
-        try:
-            payload = json.loads(body.decode("utf-8"))
-        except Exception as e:
-            log.exception(e)
-            raise HTTPException(status_code=400, detail="无效的JSON负载")
 
-        import torch
-        import soundfile as sf
+def synthesize_transformers_speech(request: Request, payload: dict) -> bytes:
+    import torch
+    import soundfile as sf
 
+    with TRANSFORMERS_SPEECH_LOCK:
         load_speech_pipeline(request)
 
         embeddings_dataset = request.app.state.speech_speaker_embeddings_dataset
@@ -531,13 +500,166 @@ async def speech(request: Request, user=Depends(get_verified_user)):
             forward_params={"speaker_embeddings": speaker_embedding},
         )
 
-        sf.write(file_path, speech["audio"], samplerate=speech["sampling_rate"])
+    buffer = io.BytesIO()
+    sf.write(buffer, speech["audio"], samplerate=speech["sampling_rate"], format="MP3")
+    return buffer.getvalue()
+
+
+async def get_or_synthesize_speech(request: Request, payload: dict, user) -> Path:
+    """
+    从缓存读取语音，未命中时合成并写入缓存
+
+    返回:
+        Path: 缓存中的音频文件路径
+    """
+    key, metadata = get_speech_cache_key(request, payload)
+
+    # 检查缓存中是否已存在文件
+    file_path = await asyncio.to_thread(SPEECH_CACHE.get, key)
+    if file_path:
+        return file_path
+
+    data = await synthesize_speech(request, payload, user)
+    return await asyncio.to_thread(SPEECH_CACHE.put, key, data, metadata)
+
+
+def parse_speech_payload(body: bytes) -> dict:
+    try:
+        payload = json.loads(body.decode("utf-8"))
+    except Exception as e:
+        log.exception(e)
+        raise HTTPException(status_code=400, detail="无效的JSON负载")
+
+    if not isinstance(payload, dict) or not payload.get("input"):
+        raise HTTPException(status_code=400, detail="无效的JSON负载")
+
+    return payload
+
+
+def is_mp3_speech(request: Request, payload: dict) -> bool:
+    """
+    判断当前TTS引擎输出是否为MP3
+
+    只有MP3帧可以直接拼接，其他格式（如WAV）拼接后无法播放
+    """
+    engine = request.app.state.config.TTS_ENGINE
+    if engine == "openai":
+        return payload.get("response_format", "mp3") == "mp3"
+    if engine == "azure":
+        return "mp3" in request.app.state.config.TTS_AZURE_SPEECH_OUTPUT_FORMAT
+    return True
+
 
-        async with aiofiles.open(file_body_path, "w") as f:
-            await f.write(json.dumps(payload))
+def split_speech_sentences(text: str) -> list[str]:
+    """
+    将文本按句末标点拆分为句子，用于逐句合成
+    """
+    sentences = [
+        sentence.strip()
+        for sentence in SENTENCE_SPLIT_PATTERN.split(text)
+        if sentence and sentence.strip()
+    ]
+    return sentences or [text]
 
+
+@router.post("/speech")
+async def speech(request: Request, user=Depends(get_verified_user)):
+    """
+    文本转语音端点
+    
+    将文本转换为语音并返回音频文件
+    
+    参数:
+        request: FastAPI请求对象
+        user: 已验证的用户
+        
+    返回:
+        FileResponse: 包含合成语音的音频文件
+    """
+    payload = parse_speech_payload(await request.body())
+    file_path = await get_or_synthesize_speech(request, payload, user)
+    return FileResponse(file_path)
+
+
+@router.post("/speech/stream")
+async def speech_stream(request: Request, user=Depends(get_verified_user)):
+    """
+    逐句文本转语音端点
+
+    将输入文本拆分为句子，每个句子单独合成并缓存。第一个句子合成完成后立即开始
+    流式返回，后续句子在后台并发合成，并按原顺序依次输出。
+    仅适用于MP3输出，其他格式整段合成后返回。
+
+    参数:
+        request: FastAPI请求对象
+        user: 已验证的用户
+
+    返回:
+        StreamingResponse: 按句子顺序拼接的音频流
+    """
+    payload = parse_speech_payload(await request.body())
+
+    if not is_mp3_speech(request, payload):
+        # 非MP3格式无法逐句拼接，整段合成后返回
+        file_path = await get_or_synthesize_speech(request, payload, user)
         return FileResponse(file_path)
 
+    sentences = split_speech_sentences(payload["input"])
+
+    semaphore = asyncio.Semaphore(SPEECH_SENTENCE_CONCURRENCY)
+
+    async def synthesize_sentence(sentence: str) -> Path:
+        async with semaphore:
+            return await get_or_synthesize_speech(
+                request, {**payload, "input": sentence}, user
+            )
+
+    tasks = [
+        asyncio.create_task(synthesize_sentence(sentence)) for sentence in sentences
+    ]
+
+    # 在返回响应前等待第一个句子，以便错误仍能以HTTP状态码返回
+    try:
+        first_path = await tasks[0]
+    except Exception:
+        for task in tasks[1:]:
+            task.cancel()
+        await asyncio.gather(*tasks[1:], return_exceptions=True)
+        raise
+
+    async def stream_audio():
+        try:
+            for idx, task in enumerate(tasks):
+                file_path = first_path if idx == 0 else await task
+                async with aiofiles.open(file_path, "rb") as f:
+                    yield await f.read()
+        except Exception as e:
+            log.exception(e)
+        finally:
+            # 客户端断开时取消并等待剩余的合成任务
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    return StreamingResponse(stream_audio(), media_type="audio/mpeg")
+
+
+@router.get("/speech/cache")
+async def get_speech_cache_stats(user=Depends(get_admin_user)):
+    """
+    获取语音缓存统计信息（条目数、占用空间、命中率等）
+    """
+    return await asyncio.to_thread(SPEECH_CACHE.get_stats)
+
+
+@router.post("/speech/cache/clear")
+async def clear_speech_cache(user=Depends(get_admin_user)):
+    """
+    清空语音缓存
+    """
+    await asyncio.to_thread(SPEECH_CACHE.clear)
+    return await asyncio.to_thread(SPEECH_CACHE.get_stats)
+
 
 def transcription_handler(request, file_path, metadata):
     """
@@ -1,7 +1,15 @@
 import json
 import logging
 from typing import Optional, List
-from fastapi import Depends, APIRouter, BackgroundTasks, Request, Query
+from fastapi import (
+    Depends,
+    APIRouter,
+    BackgroundTasks,
+    HTTPException,
+    Request,
+    Query,
+    status,
+)
 from pydantic import BaseModel
 
 from open_webui.models.users import UserNameResponse, Users
@@ -13,8 +21,10 @@ from open_webui.models.messages import (
     MessageResponse,
 )
 from open_webui.utils.auth import get_admin_user, get_verified_user
-from open_webui.env import SRC_LOG_LEVELS, ENABLE_USER_WEBHOOKS, WEBHOOK_URL, WEB_URL
-from open_webui.constants import WEBHOOK_MESSAGES
+from open_webui.utils.misc import decode_cursor, encode_cursor
+from open_webui.config import ENABLE_USER_WEBHOOKS, WEBHOOK_URL, WEBUI_URL
+from open_webui.env import SRC_LOG_LEVELS
+from open_webui.constants import ERROR_MESSAGES, WEBHOOK_MESSAGES
 
 import requests
 
@@ -36,7 +46,9 @@ log.setLevel(SRC_LOG_LEVELS["CHANNELS"])
 @router.get("/", response_model=list[ChannelModel])
 async def get_channels(user=Depends(get_verified_user)):
     """
-    获取所有频道列表
+    获取当前用户可见的频道列表
+
+    管理员可以看到所有频道，其他用户只能看到自己创建或有读取权限的频道
     
     参数:
         user: 已验证的用户
@@ -44,8 +56,10 @@ async def get_channels(user=Depends(get_verified_user)):
     返回:
         list[ChannelModel]: 频道列表
     """
-    channels = Channels.get_channels()
-    return channels
+    if user.role == "admin":
+        return Channels.get_channels()
+
+    return Channels.get_channels_by_user_id(user.id)
 
 
 @router.post("/create", response_model=Optional[ChannelModel])
@@ -141,7 +155,45 @@ class MessageUserResponse(MessageResponse):
     
     扩展了基础消息响应，添加了用户信息
     """
-    user: UserNameResponse
+    user: Optional[UserNameResponse] = None
+
+
+class MessageUserListResponse(BaseModel):
+    """
+    游标分页的消息列表响应
+
+    next_cursor 为 None 表示没有更早的消息
+    """
+    items: list[MessageUserResponse]
+    next_cursor: Optional[str] = None
+
+
+def get_message_user_responses(messages: list) -> list[MessageUserResponse]:
+    """
+    批量为消息附加作者、回复统计和反应信息
+
+    无论分页大小如何，查询次数都是固定的：回复统计和反应各一次批量查询，
+    作者信息通过 Users 的 LRU 缓存读取，未命中的用户一次性批量查询。
+
+    参数:
+        messages: 消息列表
+
+    返回:
+        list[MessageUserResponse]: 包含用户信息的消息列表
+    """
+    if not messages:
+        return []
+
+    message_responses = Messages.get_message_responses(messages)
+    users = Users.get_user_names_by_ids([message.user_id for message in messages])
+
+    return [
+        MessageUserResponse(
+            **message.model_dump(),
+            user=users.get(message.user_id),
+        )
+        for message in message_responses
+    ]
 
 
 @router.get("/{id}/messages", response_model=list[MessageUserResponse])
@@ -167,28 +219,57 @@ async def get_channel_messages(
 
     # 获取频道消息
     messages = Messages.get_messages_by_channel_id(id, skip, limit)
-    
-    # 如果没有消息，返回空列表
-    if not messages:
-        return []
 
-    # 将消息模型转换为带用户信息的响应格式
-    response_messages = []
-    for message in messages:
-        response_message = MessageUserResponse(**message.dict())
-        
-        # 获取用户信息
-        message_user = Users.get_user_by_id(message.user_id)
-        if message_user:
-            response_message.user = UserNameResponse(
-                id=message_user.id,
-                name=message_user.name,
-                profile_image_url=message_user.profile_image_url,
-            )
-        
-        response_messages.append(response_message)
-    
-    return response_messages
+    # 将消息模型批量转换为带用户信息的响应格式
+    return get_message_user_responses(messages)
+
+
+@router.get("/{id}/messages/cursor", response_model=MessageUserListResponse)
+async def get_channel_messages_by_cursor(
+    id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    user=Depends(get_verified_user),
+):
+    """
+    使用游标（keyset）分页获取频道消息列表
+
+    与 skip/limit 分页不同，按 (created_at, id) 定位，翻页深度不影响查询开销，
+    且新消息写入时不会导致分页重复或遗漏。
+
+    参数:
+        id: 频道ID
+        cursor: 上一页返回的 next_cursor，为空时返回最新一页
+        limit: 返回的最大消息数量
+        user: 已验证的用户
+
+    返回:
+        MessageUserListResponse: 消息列表及下一页游标
+
+    异常:
+        HTTPException: 如果游标无效
+    """
+    channel = Channels.get_channel_by_id(id)
+    if not channel:
+        return MessageUserListResponse(items=[])
+
+    try:
+        before = decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ERROR_MESSAGES.DEFAULT(e),
+        )
+
+    messages = Messages.get_messages_by_channel_id(id, limit=limit, before=before)
+
+    next_cursor = None
+    if limit and len(messages) == limit:
+        next_cursor = encode_cursor(messages[-1].created_at, messages[-1].id)
+
+    return MessageUserListResponse(
+        items=get_message_user_responses(messages), next_cursor=next_cursor
+    )
 
 
 async def send_notification(name, webui_url, channel, message, active_user_ids):
@@ -205,7 +286,7 @@ async def send_notification(name, webui_url, channel, message, active_user_ids):
         active_user_ids: 活跃用户ID列表
     """
     # 如果未启用用户Webhook或未配置Webhook URL，则不发送通知
-    if not ENABLE_USER_WEBHOOKS or not WEBHOOK_URL:
+    if not ENABLE_USER_WEBHOOKS.value or not WEBHOOK_URL.value:
         return
     
     try:
@@ -226,7 +307,7 @@ async def send_notification(name, webui_url, channel, message, active_user_ids):
         
         # 发送通知
         response = requests.post(
-            WEBHOOK_URL,
+            WEBHOOK_URL.value,
             json=payload,
         )
         
@@ -276,7 +357,7 @@ async def post_new_message(
         log.error(f"Error getting active users: {e}")
 
     # 确定Web UI URL，用于构建通知链接
-    webui_url = WEB_URL or request.base_url._url.rstrip("/")
+    webui_url = WEBUI_URL.value or request.base_url._url.rstrip("/")
     
     # 添加后台任务发送通知
     background_tasks.add_task(
@@ -317,18 +398,11 @@ async def get_channel_message(
         return None
 
     # 创建带用户信息的响应对象
-    response_message = MessageUserResponse(**message.dict())
-    
-    # 获取并添加用户信息
-    message_user = Users.get_user_by_id(message.user_id)
-    if message_user:
-        response_message.user = UserNameResponse(
-            id=message_user.id,
-            name=message_user.name,
-            profile_image_url=message_user.profile_image_url,
-        )
-
-    return response_message
+    users = Users.get_user_names_by_ids([message.user_id])
+    return MessageUserResponse(
+        **message.model_dump(),
+        user=users.get(message.user_id),
+    )
 
 
 @router.get(
@@ -360,27 +434,10 @@ async def get_channel_thread_messages(
         return []
 
     # 获取线程消息
-    messages = Messages.get_thread_messages_by_parent_id(message_id, skip, limit)
-    if not messages:
-        return []
-
-    # 将消息模型转换为带用户信息的响应格式
-    response_messages = []
-    for message in messages:
-        response_message = MessageUserResponse(**message.dict())
-        
-        # 获取并添加用户信息
-        message_user = Users.get_user_by_id(message.user_id)
-        if message_user:
-            response_message.user = UserNameResponse(
-                id=message_user.id,
-                name=message_user.name,
-                profile_image_url=message_user.profile_image_url,
-            )
-            
-        response_messages.append(response_message)
+    messages = Messages.get_messages_by_parent_id(id, message_id, skip, limit)
 
-    return response_messages
+    # 将消息模型批量转换为带用户信息的响应格式
+    return get_message_user_responses(messages)
 
 
 @router.post(
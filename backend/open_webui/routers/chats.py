@@ -9,6 +9,7 @@ from open_webui.models.chats import (
     ChatImportForm,
     ChatResponse,
     Chats,
+    ChatTitleIdListResponse,
     ChatTitleIdResponse,
 )
 from open_webui.models.tags import TagModel, Tags
@@ -17,12 +18,13 @@ from open_webui.models.folders import Folders
 from open_webui.config import ENABLE_ADMIN_CHAT_ACCESS, ENABLE_ADMIN_EXPORT
 from open_webui.constants import ERROR_MESSAGES
 from open_webui.env import SRC_LOG_LEVELS
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from pydantic import BaseModel
 
 
 from open_webui.utils.auth import get_admin_user, get_verified_user
 from open_webui.utils.access_control import has_permission
+from open_webui.utils.misc import decode_cursor, encode_cursor
 
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MODELS"])
@@ -74,6 +76,46 @@ async def get_session_user_chat_list(
         return Chats.get_chat_title_id_list_by_user_id(user.id)
 
 
+@router.get("/list/cursor", response_model=ChatTitleIdListResponse)
+async def get_session_user_chat_list_by_cursor(
+    user=Depends(get_verified_user),
+    cursor: Optional[str] = None,
+    limit: int = Query(60, ge=1, le=200),
+):
+    """
+    使用游标（keyset）分页获取当前用户的聊天列表
+
+    按 (updated_at, id) 倒序翻页，翻页深度不影响查询开销，
+    聊天在翻页期间被更新也不会导致后续页面重复或遗漏。
+
+    参数:
+        user: 当前已验证的用户
+        cursor: 上一页返回的 next_cursor，为空时返回第一页
+        limit: 每页数量
+
+    返回:
+        ChatTitleIdListResponse: 聊天标题和ID列表及下一页游标
+
+    异常:
+        HTTPException: 如果游标无效
+    """
+    try:
+        before = decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ERROR_MESSAGES.DEFAULT(e),
+        )
+
+    chats = Chats.get_chat_title_id_list_by_user_id(user.id, limit=limit, before=before)
+
+    next_cursor = None
+    if limit and len(chats) == limit:
+        next_cursor = encode_cursor(chats[-1].updated_at, chats[-1].id)
+
+    return ChatTitleIdListResponse(items=chats, next_cursor=next_cursor)
+
+
 ############################
 # DeleteAllChats
 ############################
@@ -166,6 +208,64 @@ async def get_user_chat_list_by_user_id(
     )
 
 
+@router.get("/list/user/{user_id}/cursor", response_model=ChatTitleIdListResponse)
+async def get_user_chat_list_by_user_id_and_cursor(
+    user_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(60, ge=1, le=200),
+    query: Optional[str] = None,
+    user=Depends(get_admin_user),
+):
+    """
+    管理员使用游标（keyset）分页获取指定用户的聊天列表
+
+    固定按 (updated_at, id) 倒序排列，需要启用ENABLE_ADMIN_CHAT_ACCESS
+
+    参数:
+        user_id: 目标用户ID
+        cursor: 上一页返回的 next_cursor，为空时返回第一页
+        limit: 每页数量
+        query: 可选的搜索关键字
+        user: 管理员用户
+
+    返回:
+        ChatTitleIdListResponse: 聊天标题和ID列表及下一页游标
+
+    异常:
+        HTTPException: 如果未启用管理员聊天访问或游标无效
+    """
+    if not ENABLE_ADMIN_CHAT_ACCESS:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=ERROR_MESSAGES.ACCESS_PROHIBITED,
+        )
+
+    try:
+        before = decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ERROR_MESSAGES.DEFAULT(e),
+        )
+
+    chats = Chats.get_chat_list_by_user_id(
+        user_id,
+        include_archived=True,
+        filter={"query": query} if query else None,
+        limit=limit,
+        before=before,
+    )
+
+    next_cursor = None
+    if limit and len(chats) == limit:
+        next_cursor = encode_cursor(chats[-1].updated_at, chats[-1].id)
+
+    return ChatTitleIdListResponse(
+        items=[ChatTitleIdResponse(**chat.model_dump()) for chat in chats],
+        next_cursor=next_cursor,
+    )
+
+
 ############################
 # CreateNewChat
 ############################
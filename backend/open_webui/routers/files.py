@@ -2,6 +2,7 @@ import logging
 import os
 import uuid
 import json
+from email.utils import formatdate, parsedate_to_datetime
 from fnmatch import fnmatch
 from pathlib import Path
 from typing import Optional
@@ -18,7 +19,13 @@ from fastapi import (
     status,
     Query,
 )
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import (
+    FileResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
+from open_webui.config import STORAGE_PRESIGNED_URL_REDIRECT
 from open_webui.constants import ERROR_MESSAGES
 from open_webui.env import SRC_LOG_LEVELS
 
@@ -33,8 +40,13 @@ from open_webui.models.knowledge import Knowledges
 
 from open_webui.routers.knowledge import get_knowledge, get_knowledge_list
 from open_webui.routers.retrieval import ProcessFileForm, process_file
-from open_webui.routers.audio import transcribe
 from open_webui.storage.provider import Storage
+from open_webui.utils.file_processing import (
+    FILE_PROCESSING_JOBS,
+    get_priority,
+    process_uploaded_file,
+    should_process_file,
+)
 from open_webui.utils.auth import get_admin_user, get_verified_user
 from pydantic import BaseModel
 
@@ -88,6 +100,7 @@ def upload_file(
     file: UploadFile = File(...),
     metadata: Optional[dict | str] = Form(None),
     process: bool = Query(True),
+    priority: Optional[str] = Query(None),
     internal: bool = False,
     user=Depends(get_verified_user),
 ):
@@ -103,6 +116,24 @@ def upload_file(
             )
     file_metadata = metadata if metadata else {}
 
+    process = process and should_process_file(request, file.content_type)
+
+    # Queued processing, the file is extracted and embedded after responding
+    background = process and FILE_PROCESSING_JOBS is not None
+    if background:
+        try:
+            priority = get_priority(priority if isinstance(priority, str) else None)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ERROR_MESSAGES.DEFAULT(f"Invalid priority: {priority}"),
+            )
+        if FILE_PROCESSING_JOBS.is_full():
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=ERROR_MESSAGES.DEFAULT("Too many files are being processed"),
+            )
+
     try:
         unsanitized_filename = file.filename
         filename = os.path.basename(unsanitized_filename)
@@ -154,27 +185,10 @@ def upload_file(
         )
         if process:
             try:
-                if file.content_type:
-                    if file.content_type.startswith("audio/") or file.content_type in {
-                        "video/webm"
-                    }:
-                        file_path = Storage.get_file(file_path)
-                        result = transcribe(request, file_path, file_metadata)
-
-                        process_file(
-                            request,
-                            ProcessFileForm(file_id=id, content=result.get("text", "")),
-                            user=user,
-                        )
-                    elif (not file.content_type.startswith(("image/", "video/"))) or (
-                        request.app.state.config.CONTENT_EXTRACTION_ENGINE == "external"
-                    ):
-                        process_file(request, ProcessFileForm(file_id=id), user=user)
+                if background:
+                    FILE_PROCESSING_JOBS.submit(id, user.id, priority)
                 else:
-                    log.info(
-                        f"File type {file.content_type} is not provided, but trying to process anyway"
-                    )
-                    process_file(request, ProcessFileForm(file_id=id), user=user)
+                    process_uploaded_file(request, id, user)
 
                 file_item = Files.get_file_by_id(id=id)
             except Exception as e:
@@ -291,6 +305,18 @@ async def delete_all_files(user=Depends(get_admin_user)):
         )
 
 
+############################
+# Get Storage Cache Stats
+############################
+
+
+@router.get("/cache/stats")
+async def get_storage_cache_stats(user=Depends(get_admin_user)):
+    # Only object storage providers keep a local file cache
+    cache = getattr(Storage, "cache", None)
+    return cache.get_stats() if cache is not None else {}
+
+
 ############################
 # Get File By Id
 ############################
@@ -392,6 +418,135 @@ async def update_file_data_content_by_id(
         )
 
 
+############################
+# File Content Responses
+############################
+
+
+def get_file_validators(file: FileModel) -> dict:
+    # The stored bytes never change after upload, the hash follows content updates
+    return {
+        "ETag": f'"{file.hash or file.id}"',
+        "Last-Modified": formatdate(file.created_at, usegmt=True),
+        "Cache-Control": "private, no-cache",
+    }
+
+
+def is_not_modified(request: Request, file: FileModel, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            return (
+                parsedate_to_datetime(if_modified_since).timestamp() >= file.created_at
+            )
+        except (TypeError, ValueError):
+            return False
+
+    return False
+
+
+def parse_range(http_range: str, size: int) -> Optional[tuple[int, int]]:
+    """
+    First and last byte of a single `bytes=` range, None for anything else.
+
+    Raises ValueError when the range lies beyond the end of the file.
+    """
+    unit, _, ranges = http_range.partition("=")
+    if unit.strip() != "bytes" or "," in ranges:
+        return None
+
+    start, _, end = ranges.strip().partition("-")
+    try:
+        if start:
+            start, end = int(start), int(end) if end else size - 1
+        elif end:
+            # Suffix range, the last `end` bytes
+            start, end = max(size - int(end), 0), size - 1
+        else:
+            return None
+    except ValueError:
+        return None
+
+    if start >= size:
+        raise ValueError(f"Range {http_range} not satisfiable")
+    if start > end:
+        return None
+    return start, min(end, size - 1)
+
+
+def get_file_content_response(
+    request: Request,
+    file: FileModel,
+    headers: dict,
+    media_type: Optional[str] = None,
+    allow_redirect: bool = False,
+) -> Response:
+    """
+    Respond with the stored file, honouring conditional and range requests.
+
+    Range requests for files without a local copy are read from the storage
+    backend directly, and downloads may be redirected to a presigned URL.
+    """
+    validators = get_file_validators(file)
+    if is_not_modified(request, file, validators["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validators)
+
+    headers = {**headers, **validators}
+    local_file_path = Storage.get_local_file(file.path)
+
+    if allow_redirect and STORAGE_PRESIGNED_URL_REDIRECT and local_file_path is None:
+        url = Storage.get_presigned_url(
+            file.path, media_type, headers.get("Content-Disposition", "inline")
+        )
+        if url:
+            return RedirectResponse(url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+
+    http_range = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    size = (file.meta or {}).get("size")
+    if (
+        http_range
+        and local_file_path is None
+        and size
+        and (if_range is None or if_range == validators["ETag"])
+    ):
+        try:
+            byte_range = parse_range(http_range, size)
+        except ValueError:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={"Content-Range": f"bytes */{size}"},
+            )
+
+        if byte_range is not None:
+            start, end = byte_range
+            return StreamingResponse(
+                Storage.iter_file_range(file.path, start, end),
+                status_code=status.HTTP_206_PARTIAL_CONTENT,
+                media_type=media_type,
+                headers={
+                    **headers,
+                    "Accept-Ranges": "bytes",
+                    "Content-Range": f"bytes {start}-{end}/{size}",
+                    "Content-Length": str(end - start + 1),
+                },
+            )
+
+    # FileResponse serves ranges of local files itself
+    file_path = Path(local_file_path or Storage.get_file(file.path))
+    if not file_path.is_file():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=ERROR_MESSAGES.NOT_FOUND,
+        )
+    return FileResponse(file_path, headers=headers, media_type=media_type)
+
+
 ############################
 # Get File Content By Id
 ############################
@@ -399,7 +554,10 @@ async def update_file_data_content_by_id(
 
 @router.get("/{id}/content")
 async def get_file_content_by_id(
-    id: str, user=Depends(get_verified_user), attachment: bool = Query(False)
+    request: Request,
+    id: str,
+    user=Depends(get_verified_user),
+    attachment: bool = Query(False),
 ):
     file = Files.get_file_by_id(id)
 
@@ -415,44 +573,32 @@ async def get_file_content_by_id(
         or has_access_to_file(id, "read", user)
     ):
         try:
-            file_path = Storage.get_file(file.path)
-            file_path = Path(file_path)
-
-            # Check if the file already exists in the cache
-            if file_path.is_file():
-                # Handle Unicode filenames
-                filename = file.meta.get("name", file.filename)
-                encoded_filename = quote(filename)  # RFC5987 encoding
-
-                content_type = file.meta.get("content_type")
-                filename = file.meta.get("name", file.filename)
-                encoded_filename = quote(filename)
-                headers = {}
-
-                if attachment:
+            # Handle Unicode filenames
+            content_type = file.meta.get("content_type")
+            filename = file.meta.get("name", file.filename)
+            encoded_filename = quote(filename)  # RFC5987 encoding
+            headers = {}
+
+            if attachment:
+                headers["Content-Disposition"] = (
+                    f"attachment; filename*=UTF-8''{encoded_filename}"
+                )
+            else:
+                if content_type == "application/pdf" or filename.lower().endswith(
+                    ".pdf"
+                ):
+                    headers["Content-Disposition"] = (
+                        f"inline; filename*=UTF-8''{encoded_filename}"
+                    )
+                    content_type = "application/pdf"
+                elif content_type != "text/plain":
                     headers["Content-Disposition"] = (
                         f"attachment; filename*=UTF-8''{encoded_filename}"
                     )
-                else:
-                    if content_type == "application/pdf" or filename.lower().endswith(
-                        ".pdf"
-                    ):
-                        headers["Content-Disposition"] = (
-                            f"inline; filename*=UTF-8''{encoded_filename}"
-                        )
-                        content_type = "application/pdf"
-                    elif content_type != "text/plain":
-                        headers["Content-Disposition"] = (
-                            f"attachment; filename*=UTF-8''{encoded_filename}"
-                        )
-
-                return FileResponse(file_path, headers=headers, media_type=content_type)
 
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=ERROR_MESSAGES.NOT_FOUND,
-                )
+            return get_file_content_response(
+                request, file, headers, content_type, allow_redirect=True
+            )
         except Exception as e:
             log.exception(e)
             log.error("Error getting file content")
@@ -468,7 +614,9 @@ async def get_file_content_by_id(
 
 
 @router.get("/{id}/content/html")
-async def get_html_file_content_by_id(id: str, user=Depends(get_verified_user)):
+async def get_html_file_content_by_id(
+    request: Request, id: str, user=Depends(get_verified_user)
+):
     file = Files.get_file_by_id(id)
 
     if not file:
@@ -490,18 +638,8 @@ async def get_html_file_content_by_id(id: str, user=Depends(get_verified_user)):
         or has_access_to_file(id, "read", user)
     ):
         try:
-            file_path = Storage.get_file(file.path)
-            file_path = Path(file_path)
-
-            # Check if the file already exists in the cache
-            if file_path.is_file():
-                log.info(f"file_path: {file_path}")
-                return FileResponse(file_path)
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=ERROR_MESSAGES.NOT_FOUND,
-                )
+            # Served from this origin, never redirected to the bucket
+            return get_file_content_response(request, file, {})
         except Exception as e:
             log.exception(e)
             log.error("Error getting file content")
@@ -517,7 +655,9 @@ async def get_html_file_content_by_id(id: str, user=Depends(get_verified_user)):
 
 
 @router.get("/{id}/content/{file_name}")
-async def get_file_content_by_id(id: str, user=Depends(get_verified_user)):
+async def get_file_content_by_id(
+    request: Request, id: str, user=Depends(get_verified_user)
+):
     file = Files.get_file_by_id(id)
 
     if not file:
@@ -541,17 +681,9 @@ async def get_file_content_by_id(id: str, user=Depends(get_verified_user)):
         }
 
         if file_path:
-            file_path = Storage.get_file(file_path)
-            file_path = Path(file_path)
-
-            # Check if the file already exists in the cache
-            if file_path.is_file():
-                return FileResponse(file_path, headers=headers)
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=ERROR_MESSAGES.NOT_FOUND,
-                )
+            return get_file_content_response(
+                request, file, headers, allow_redirect=True
+            )
         else:
             # File path doesn’t exist, return the content as .txt if possible
             file_content = file.content.get("content", "")
@@ -8,17 +8,28 @@ import re
 from pathlib import Path
 from typing import Optional
 
-import requests
 from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile
 from open_webui.config import CACHE_DIR
 from open_webui.constants import ERROR_MESSAGES
 from open_webui.env import ENABLE_FORWARD_USER_INFO_HEADERS, SRC_LOG_LEVELS
 from open_webui.routers.files import upload_file
 from open_webui.utils.auth import get_admin_user, get_verified_user
+from open_webui.utils.images.clients import (
+    automatic1111_generate_images,
+    automatic1111_get_models,
+    automatic1111_get_options,
+    automatic1111_set_options,
+    decode_b64_to_file,
+    download_image_to_file,
+    gather_with_concurrency,
+    gemini_generate_images,
+    openai_generate_images,
+)
 from open_webui.utils.images.comfyui import (
     ComfyUIGenerateImageForm,
     ComfyUIWorkflow,
     comfyui_generate_image,
+    get_object_info as get_comfyui_object_info,
 )
 from pydantic import BaseModel
 
@@ -195,29 +206,20 @@ def get_automatic1111_api_auth(request: Request):
 async def verify_url(request: Request, user=Depends(get_admin_user)):
     if request.app.state.config.IMAGE_GENERATION_ENGINE == "automatic1111":
         try:
-            r = requests.get(
-                url=f"{request.app.state.config.AUTOMATIC1111_BASE_URL}/sdapi/v1/options",
-                headers={"authorization": get_automatic1111_api_auth(request)},
+            await automatic1111_get_options(
+                request.app.state.config.AUTOMATIC1111_BASE_URL,
+                get_automatic1111_api_auth(request),
             )
-            r.raise_for_status()
             return True
         except Exception:
             request.app.state.config.ENABLE_IMAGE_GENERATION = False
             raise HTTPException(status_code=400, detail=ERROR_MESSAGES.INVALID_URL)
     elif request.app.state.config.IMAGE_GENERATION_ENGINE == "comfyui":
-
-        headers = None
-        if request.app.state.config.COMFYUI_API_KEY:
-            headers = {
-                "Authorization": f"Bearer {request.app.state.config.COMFYUI_API_KEY}"
-            }
-
         try:
-            r = requests.get(
-                url=f"{request.app.state.config.COMFYUI_BASE_URL}/object_info",
-                headers=headers,
+            await get_comfyui_object_info(
+                request.app.state.config.COMFYUI_BASE_URL,
+                request.app.state.config.COMFYUI_API_KEY,
             )
-            r.raise_for_status()
             return True
         except Exception:
             request.app.state.config.ENABLE_IMAGE_GENERATION = False
@@ -226,27 +228,23 @@ async def verify_url(request: Request, user=Depends(get_admin_user)):
         return True
 
 
-def set_image_model(request: Request, model: str):
+async def set_image_model(request: Request, model: str):
     log.info(f"Setting image model to {model}")
     request.app.state.config.IMAGE_GENERATION_MODEL = model
     if request.app.state.config.IMAGE_GENERATION_ENGINE in ["", "automatic1111"]:
         api_auth = get_automatic1111_api_auth(request)
-        r = requests.get(
-            url=f"{request.app.state.config.AUTOMATIC1111_BASE_URL}/sdapi/v1/options",
-            headers={"authorization": api_auth},
+        options = await automatic1111_get_options(
+            request.app.state.config.AUTOMATIC1111_BASE_URL, api_auth
         )
-        options = r.json()
         if model != options["sd_model_checkpoint"]:
             options["sd_model_checkpoint"] = model
-            r = requests.post(
-                url=f"{request.app.state.config.AUTOMATIC1111_BASE_URL}/sdapi/v1/options",
-                json=options,
-                headers={"authorization": api_auth},
+            await automatic1111_set_options(
+                request.app.state.config.AUTOMATIC1111_BASE_URL, api_auth, options
             )
     return request.app.state.config.IMAGE_GENERATION_MODEL
 
 
-def get_image_model(request):
+async def get_image_model(request):
     if request.app.state.config.IMAGE_GENERATION_ENGINE == "openai":
         return (
             request.app.state.config.IMAGE_GENERATION_MODEL
@@ -270,11 +268,10 @@ def get_image_model(request):
         or request.app.state.config.IMAGE_GENERATION_ENGINE == ""
     ):
         try:
-            r = requests.get(
-                url=f"{request.app.state.config.AUTOMATIC1111_BASE_URL}/sdapi/v1/options",
-                headers={"authorization": get_automatic1111_api_auth(request)},
+            options = await automatic1111_get_options(
+                request.app.state.config.AUTOMATIC1111_BASE_URL,
+                get_automatic1111_api_auth(request),
             )
-            options = r.json()
             return options["sd_model_checkpoint"]
         except Exception as e:
             request.app.state.config.ENABLE_IMAGE_GENERATION = False
@@ -300,7 +297,7 @@ async def get_image_config(request: Request, user=Depends(get_admin_user)):
 async def update_image_config(
     request: Request, form_data: ImageConfigForm, user=Depends(get_admin_user)
 ):
-    set_image_model(request, form_data.MODEL)
+    await set_image_model(request, form_data.MODEL)
 
     pattern = r"^\d+x\d+$"
     if re.match(pattern, form_data.IMAGE_SIZE):
@@ -327,7 +324,7 @@ async def update_image_config(
 
 
 @router.get("/models")
-def get_models(request: Request, user=Depends(get_verified_user)):
+async def get_models(request: Request, user=Depends(get_verified_user)):
     try:
         if request.app.state.config.IMAGE_GENERATION_ENGINE == "openai":
             return [
@@ -341,14 +338,10 @@ def get_models(request: Request, user=Depends(get_verified_user)):
             ]
         elif request.app.state.config.IMAGE_GENERATION_ENGINE == "comfyui":
             # TODO - get models from comfyui
-            headers = {
-                "Authorization": f"Bearer {request.app.state.config.COMFYUI_API_KEY}"
-            }
-            r = requests.get(
-                url=f"{request.app.state.config.COMFYUI_BASE_URL}/object_info",
-                headers=headers,
+            info = await get_comfyui_object_info(
+                request.app.state.config.COMFYUI_BASE_URL,
+                request.app.state.config.COMFYUI_API_KEY,
             )
-            info = r.json()
 
             workflow = json.loads(request.app.state.config.COMFYUI_WORKFLOW)
             model_node_id = None
@@ -392,11 +385,10 @@ def get_models(request: Request, user=Depends(get_verified_user)):
             request.app.state.config.IMAGE_GENERATION_ENGINE == "automatic1111"
             or request.app.state.config.IMAGE_GENERATION_ENGINE == ""
         ):
-            r = requests.get(
-                url=f"{request.app.state.config.AUTOMATIC1111_BASE_URL}/sdapi/v1/sd-models",
-                headers={"authorization": get_automatic1111_api_auth(request)},
+            models = await automatic1111_get_models(
+                request.app.state.config.AUTOMATIC1111_BASE_URL,
+                get_automatic1111_api_auth(request),
             )
-            models = r.json()
             return list(
                 map(
                     lambda model: {"id": model["title"], "name": model["model_name"]},
@@ -417,63 +409,72 @@ class GenerateImageForm(BaseModel):
 
 
 def load_b64_image_data(b64_str):
-    try:
-        if "," in b64_str:
-            header, encoded = b64_str.split(",", 1)
-            mime_type = header.split(";")[0].lstrip("data:")
-            img_data = base64.b64decode(encoded)
-        else:
-            mime_type = "image/png"
-            img_data = base64.b64decode(b64_str)
-        return img_data, mime_type
-    except Exception as e:
-        log.exception(f"Error loading image data: {e}")
-        return None, None
+    return decode_b64_to_file(b64_str)
 
 
-def load_url_image_data(url, headers=None):
-    try:
-        if headers:
-            r = requests.get(url, headers=headers)
-        else:
-            r = requests.get(url)
-
-        r.raise_for_status()
-        if r.headers["content-type"].split("/")[0] == "image":
-            mime_type = r.headers["content-type"]
-            return r.content, mime_type
-        else:
-            log.error("Url does not point to an image.")
-            return None
-
-    except Exception as e:
-        log.exception(f"Error saving image: {e}")
-        return None
+async def load_url_image_data(url, headers=None):
+    return await download_image_to_file(url, headers)
 
 
 def upload_image(request, image_data, content_type, metadata, user):
     image_format = mimetypes.guess_extension(content_type)
     file = UploadFile(
-        file=io.BytesIO(image_data),
+        file=(
+            io.BytesIO(image_data)
+            if isinstance(image_data, (bytes, bytearray))
+            else image_data
+        ),
         filename=f"generated-image{image_format}",  # will be converted to a unique ID on upload_file
         headers={
             "content-type": content_type,
         },
     )
-    file_item = upload_file(request, file, metadata=metadata, internal=True, user=user)
+    try:
+        file_item = upload_file(
+            request, file, metadata=metadata, internal=True, user=user
+        )
+    finally:
+        file.file.close()
     url = request.app.url_path_for("get_file_content_by_id", id=file_item.id)
     return url
 
 
+async def store_images(request, loaders: list, metadata, user) -> list[dict]:
+    """
+    Decode/download and upload generated images concurrently, preserving order.
+
+    `loaders` are awaitables resolving to (file, content_type).
+    """
+
+    async def store(loader):
+        image_data, content_type = await loader
+        if image_data is None:
+            raise Exception("Failed to load generated image")
+        url = await asyncio.to_thread(
+            upload_image, request, image_data, content_type, metadata, user
+        )
+        return {"url": url}
+
+    return await gather_with_concurrency([store(loader) for loader in loaders])
+
+
 @router.post("/generations")
 async def image_generations(
     request: Request,
     form_data: GenerateImageForm,
     user=Depends(get_verified_user),
+):
+    return await generate_images(request, form_data, user)
+
+
+async def generate_images(
+    request: Request,
+    form_data: GenerateImageForm,
+    user,
+    event_emitter=None,
 ):
     width, height = tuple(map(int, request.app.state.config.IMAGE_SIZE.split("x")))
 
-    r = None
     try:
         if request.app.state.config.IMAGE_GENERATION_ENGINE == "openai":
             headers = {}
@@ -508,35 +509,26 @@ async def image_generations(
                 ),
             }
 
-            # Use asyncio.to_thread for the requests.post call
-            r = await asyncio.to_thread(
-                requests.post,
-                url=f"{request.app.state.config.IMAGES_OPENAI_API_BASE_URL}/images/generations",
-                json=data,
-                headers=headers,
+            res = await openai_generate_images(
+                request.app.state.config.IMAGES_OPENAI_API_BASE_URL, headers, data
             )
 
-            r.raise_for_status()
-            res = r.json()
-
-            images = []
-
-            for image in res["data"]:
-                if image_url := image.get("url", None):
-                    image_data, content_type = load_url_image_data(image_url, headers)
-                else:
-                    image_data, content_type = load_b64_image_data(image["b64_json"])
-
-                url = upload_image(request, image_data, content_type, data, user)
-                images.append({"url": url})
-            return images
+            return await store_images(
+                request,
+                [
+                    (
+                        load_url_image_data(image_url, headers)
+                        if (image_url := image.get("url", None))
+                        else asyncio.to_thread(load_b64_image_data, image["b64_json"])
+                    )
+                    for image in res
+                ],
+                data,
+                user,
+            )
 
         elif request.app.state.config.IMAGE_GENERATION_ENGINE == "gemini":
-            headers = {}
-            headers["Content-Type"] = "application/json"
-            headers["x-goog-api-key"] = request.app.state.config.IMAGES_GEMINI_API_KEY
-
-            model = get_image_model(request)
+            model = await get_image_model(request)
             data = {
                 "instances": {"prompt": form_data.prompt},
                 "parameters": {
@@ -545,26 +537,22 @@ async def image_generations(
                 },
             }
 
-            # Use asyncio.to_thread for the requests.post call
-            r = await asyncio.to_thread(
-                requests.post,
-                url=f"{request.app.state.config.IMAGES_GEMINI_API_BASE_URL}/models/{model}:predict",
-                json=data,
-                headers=headers,
+            res = await gemini_generate_images(
+                request.app.state.config.IMAGES_GEMINI_API_BASE_URL,
+                request.app.state.config.IMAGES_GEMINI_API_KEY,
+                model,
+                data,
             )
 
-            r.raise_for_status()
-            res = r.json()
-
-            images = []
-            for image in res["predictions"]:
-                image_data, content_type = load_b64_image_data(
-                    image["bytesBase64Encoded"]
-                )
-                url = upload_image(request, image_data, content_type, data, user)
-                images.append({"url": url})
-
-            return images
+            return await store_images(
+                request,
+                [
+                    asyncio.to_thread(load_b64_image_data, image["bytesBase64Encoded"])
+                    for image in res
+                ],
+                data,
+                user,
+            )
 
         elif request.app.state.config.IMAGE_GENERATION_ENGINE == "comfyui":
             data = {
@@ -597,34 +585,31 @@ async def image_generations(
                 user.id,
                 request.app.state.config.COMFYUI_BASE_URL,
                 request.app.state.config.COMFYUI_API_KEY,
+                event_emitter=event_emitter,
             )
             log.debug(f"res: {res}")
 
-            images = []
-
-            for image in res["data"]:
-                headers = None
-                if request.app.state.config.COMFYUI_API_KEY:
-                    headers = {
-                        "Authorization": f"Bearer {request.app.state.config.COMFYUI_API_KEY}"
-                    }
-
-                image_data, content_type = load_url_image_data(image["url"], headers)
-                url = upload_image(
-                    request,
-                    image_data,
-                    content_type,
-                    form_data.model_dump(exclude_none=True),
-                    user,
-                )
-                images.append({"url": url})
-            return images
+            if res is None:
+                raise Exception("ComfyUI did not return any images")
+
+            headers = None
+            if request.app.state.config.COMFYUI_API_KEY:
+                headers = {
+                    "Authorization": f"Bearer {request.app.state.config.COMFYUI_API_KEY}"
+                }
+
+            return await store_images(
+                request,
+                [load_url_image_data(image["url"], headers) for image in res["data"]],
+                form_data.model_dump(exclude_none=True),
+                user,
+            )
         elif (
             request.app.state.config.IMAGE_GENERATION_ENGINE == "automatic1111"
             or request.app.state.config.IMAGE_GENERATION_ENGINE == ""
         ):
             if form_data.model:
-                set_image_model(request, form_data.model)
+                await set_image_model(request, form_data.model)
 
             data = {
                 "prompt": form_data.prompt,
@@ -648,34 +633,21 @@ async def image_generations(
             if request.app.state.config.AUTOMATIC1111_SCHEDULER:
                 data["scheduler"] = request.app.state.config.AUTOMATIC1111_SCHEDULER
 
-            # Use asyncio.to_thread for the requests.post call
-            r = await asyncio.to_thread(
-                requests.post,
-                url=f"{request.app.state.config.AUTOMATIC1111_BASE_URL}/sdapi/v1/txt2img",
-                json=data,
-                headers={"authorization": get_automatic1111_api_auth(request)},
+            res = await automatic1111_generate_images(
+                request.app.state.config.AUTOMATIC1111_BASE_URL,
+                get_automatic1111_api_auth(request),
+                data,
             )
-
-            res = r.json()
             log.debug(f"res: {res}")
 
-            images = []
-
-            for image in res["images"]:
-                image_data, content_type = load_b64_image_data(image)
-                url = upload_image(
-                    request,
-                    image_data,
-                    content_type,
-                    {**data, "info": res["info"]},
-                    user,
-                )
-                images.append({"url": url})
-            return images
+            return await store_images(
+                request,
+                [
+                    asyncio.to_thread(load_b64_image_data, image)
+                    for image in res["images"]
+                ],
+                {**data, "info": res["info"]},
+                user,
+            )
     except Exception as e:
-        error = e
-        if r != None:
-            data = r.json()
-            if "error" in data:
-                error = data["error"]["message"]
-        raise HTTPException(status_code=400, detail=ERROR_MESSAGES.DEFAULT(error))
+        raise HTTPException(status_code=400, detail=ERROR_MESSAGES.DEFAULT(e))
@@ -17,9 +17,6 @@ from pydantic import BaseModel
 from starlette.background import BackgroundTask
 
 from open_webui.models.models import Models
-from open_webui.config import (
-    CACHE_DIR,
-)
 from open_webui.env import (
     AIOHTTP_CLIENT_SESSION_SSL,
     AIOHTTP_CLIENT_TIMEOUT,
@@ -42,6 +39,7 @@ from open_webui.utils.misc import (
 )
 
 from open_webui.utils.auth import get_admin_user, get_verified_user
+from open_webui.utils.speech_cache import SPEECH_CACHE
 from open_webui.utils.access_control import has_access
 
 
@@ -260,13 +258,9 @@ async def speech(request: Request, user=Depends(get_verified_user)):
         body = await request.body()
         name = hashlib.sha256(body).hexdigest()
 
-        SPEECH_CACHE_DIR = CACHE_DIR / "audio" / "speech"
-        SPEECH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        file_path = SPEECH_CACHE_DIR.joinpath(f"{name}.mp3")
-        file_body_path = SPEECH_CACHE_DIR.joinpath(f"{name}.json")
-
         # Check if the file already exists in the cache
-        if file_path.is_file():
+        file_path = await asyncio.to_thread(SPEECH_CACHE.get, name)
+        if file_path:
             return FileResponse(file_path)
 
         url = request.app.state.config.OPENAI_API_BASE_URLS[idx]
@@ -303,13 +297,18 @@ async def speech(request: Request, user=Depends(get_verified_user)):
 
             r.raise_for_status()
 
-            # Save the streaming content to a file
-            with open(file_path, "wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    f.write(chunk)
-
-            with open(file_body_path, "w") as f:
-                json.dump(json.loads(body.decode("utf-8")), f)
+            # Save the streaming content to the speech cache
+            payload = json.loads(body.decode("utf-8"))
+            file_path = await asyncio.to_thread(
+                SPEECH_CACHE.put,
+                name,
+                b"".join(r.iter_content(chunk_size=8192)),
+                {
+                    "engine": "openai",
+                    "model": payload.get("model"),
+                    "voice": payload.get("voice"),
+                },
+            )
 
             # Return the saved file
             return FileResponse(file_path)
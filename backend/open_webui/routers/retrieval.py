@@ -8,6 +8,7 @@ import asyncio
 
 import uuid
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Iterator, List, Optional, Sequence, Union
 
@@ -36,36 +37,45 @@ from open_webui.models.knowledge import Knowledges
 from open_webui.storage.provider import Storage
 
 
-from open_webui.retrieval.vector.factory import VECTOR_DB_CLIENT
+from open_webui.retrieval.embedding_batcher import EMBEDDING_BATCHER
+from open_webui.retrieval.inference import INFERENCE_EXECUTOR
+from open_webui.retrieval.vector.main import GetResult
+from open_webui.retrieval.vector.factory import (
+    VECTOR_DB_CLIENT,
+    WEB_SEARCH_VECTOR_DB_CLIENT,
+    get_vector_db_client,
+)
 
 # Document loaders
+from open_webui.retrieval.loaders.cache import EXTRACTION_CACHE
 from open_webui.retrieval.loaders.main import Loader
 from open_webui.retrieval.loaders.youtube import YoutubeLoader
 
 # Web search engines
 from open_webui.retrieval.web.main import SearchResult
-from open_webui.retrieval.web.utils import get_web_loader
-from open_webui.retrieval.web.brave import search_brave
-from open_webui.retrieval.web.kagi import search_kagi
-from open_webui.retrieval.web.mojeek import search_mojeek
+from open_webui.retrieval.web.utils import get_search_rate_limiter, get_web_loader
+from open_webui.retrieval.web.brave import search_brave, asearch_brave
+from open_webui.retrieval.web.kagi import search_kagi, asearch_kagi
+from open_webui.retrieval.web.mojeek import search_mojeek, asearch_mojeek
 from open_webui.retrieval.web.bocha import search_bocha
 from open_webui.retrieval.web.duckduckgo import search_duckduckgo
-from open_webui.retrieval.web.google_pse import search_google_pse
-from open_webui.retrieval.web.jina_search import search_jina
-from open_webui.retrieval.web.searchapi import search_searchapi
-from open_webui.retrieval.web.serpapi import search_serpapi
-from open_webui.retrieval.web.searxng import search_searxng
+from open_webui.retrieval.web.google_pse import search_google_pse, asearch_google_pse
+from open_webui.retrieval.web.jina_search import search_jina, asearch_jina
+from open_webui.retrieval.web.searchapi import search_searchapi, asearch_searchapi
+from open_webui.retrieval.web.serpapi import search_serpapi, asearch_serpapi
+from open_webui.retrieval.web.searxng import search_searxng, asearch_searxng
 from open_webui.retrieval.web.yacy import search_yacy
-from open_webui.retrieval.web.serper import search_serper
-from open_webui.retrieval.web.serply import search_serply
-from open_webui.retrieval.web.serpstack import search_serpstack
-from open_webui.retrieval.web.tavily import search_tavily
+from open_webui.retrieval.web.serper import search_serper, asearch_serper
+from open_webui.retrieval.web.serply import search_serply, asearch_serply
+from open_webui.retrieval.web.serpstack import search_serpstack, asearch_serpstack
+from open_webui.retrieval.web.tavily import search_tavily, asearch_tavily
 from open_webui.retrieval.web.bing import search_bing
 from open_webui.retrieval.web.exa import search_exa
 from open_webui.retrieval.web.perplexity import search_perplexity
 from open_webui.retrieval.web.sougou import search_sougou
 from open_webui.retrieval.web.firecrawl import search_firecrawl
 from open_webui.retrieval.web.external import search_external
+from open_webui.retrieval.web.search_cache import SEARCH_RESULT_CACHE
 
 from open_webui.retrieval.utils import (
     get_embedding_function,
@@ -99,6 +109,8 @@ from open_webui.env import (
     SENTENCE_TRANSFORMERS_MODEL_KWARGS,
     SENTENCE_TRANSFORMERS_CROSS_ENCODER_BACKEND,
     SENTENCE_TRANSFORMERS_CROSS_ENCODER_MODEL_KWARGS,
+    SENTENCE_TRANSFORMERS_QUANTIZATION,
+    SENTENCE_TRANSFORMERS_CROSS_ENCODER_QUANTIZATION,
 )
 
 from open_webui.constants import ERROR_MESSAGES
@@ -122,12 +134,16 @@ def get_ef(
     if embedding_model and engine == "":
         from sentence_transformers import SentenceTransformer
 
+        from open_webui.retrieval.models.quantized import load_local_model
+
         try:
-            ef = SentenceTransformer(
+            ef = load_local_model(
+                SentenceTransformer,
                 get_model_path(embedding_model, auto_update),
+                backend=SENTENCE_TRANSFORMERS_BACKEND,
+                quantization=SENTENCE_TRANSFORMERS_QUANTIZATION,
                 device=DEVICE_TYPE,
                 trust_remote_code=RAG_EMBEDDING_MODEL_TRUST_REMOTE_CODE,
-                backend=SENTENCE_TRANSFORMERS_BACKEND,
                 model_kwargs=SENTENCE_TRANSFORMERS_MODEL_KWARGS,
             )
         except Exception as e:
@@ -152,6 +168,7 @@ def get_rf(
                 rf = ColBERT(
                     get_model_path(reranking_model, auto_update),
                     env="docker" if DOCKER else None,
+                    quantize=bool(SENTENCE_TRANSFORMERS_CROSS_ENCODER_QUANTIZATION),
                 )
 
             except Exception as e:
@@ -173,12 +190,16 @@ def get_rf(
             else:
                 import sentence_transformers
 
+                from open_webui.retrieval.models.quantized import load_local_model
+
                 try:
-                    rf = sentence_transformers.CrossEncoder(
+                    rf = load_local_model(
+                        sentence_transformers.CrossEncoder,
                         get_model_path(reranking_model, auto_update),
+                        backend=SENTENCE_TRANSFORMERS_CROSS_ENCODER_BACKEND,
+                        quantization=SENTENCE_TRANSFORMERS_CROSS_ENCODER_QUANTIZATION,
                         device=DEVICE_TYPE,
                         trust_remote_code=RAG_RERANKING_MODEL_TRUST_REMOTE_CODE,
-                        backend=SENTENCE_TRANSFORMERS_CROSS_ENCODER_BACKEND,
                         model_kwargs=SENTENCE_TRANSFORMERS_CROSS_ENCODER_MODEL_KWARGS,
                     )
                 except Exception as e:
@@ -247,6 +268,18 @@ async def get_embedding_config(request: Request, user=Depends(get_admin_user)):
     }
 
 
+@router.get("/embedding/batcher")
+async def get_embedding_batcher_stats(user=Depends(get_admin_user)):
+    if EMBEDDING_BATCHER is None:
+        return {"enabled": False}
+    return {"enabled": True, **EMBEDDING_BATCHER.get_stats()}
+
+
+@router.get("/inference")
+async def get_inference_stats(user=Depends(get_admin_user)):
+    return {"models": INFERENCE_EXECUTOR.get_stats()}
+
+
 class OpenAIConfigForm(BaseModel):
     url: str
     key: str
@@ -1092,6 +1125,50 @@ async def update_rag_config(
 ####################################
 
 
+def get_embedding_config_metadata(request: Request) -> str:
+    """The `embedding_config` stored with every chunk embedded by the current model."""
+    return json.dumps(
+        {
+            "engine": request.app.state.config.RAG_EMBEDDING_ENGINE,
+            "model": request.app.state.config.RAG_EMBEDDING_MODEL,
+        }
+    )
+
+
+def copy_file_vectors(
+    request: Request, file_id: str, collection_name: str, hash: str, stored: GetResult
+) -> bool:
+    """
+    Copy the chunks already embedded in `file-<id>` into `collection_name`.
+
+    Only done when every stored chunk belongs to the current content and was
+    embedded by the current model, otherwise returns False and the caller
+    embeds the documents again.
+    """
+    embedding_config = get_embedding_config_metadata(request)
+    if any(
+        (metadata or {}).get("embedding_config") != embedding_config
+        or (metadata or {}).get("hash") != hash
+        for metadata in stored.metadatas[0]
+    ):
+        return False
+
+    # Same duplicate check as save_docs_to_vector_db
+    result = VECTOR_DB_CLIENT.query(
+        collection_name=collection_name, filter={"hash": hash}
+    )
+    if result is not None and result.ids[0]:
+        log.info(f"Document with hash {hash} already exists")
+        raise ValueError(ERROR_MESSAGES.DUPLICATE_CONTENT)
+
+    copied = VECTOR_DB_CLIENT.copy(
+        f"file-{file_id}", collection_name, filter={"file_id": file_id}
+    )
+    if copied:
+        log.info(f"copied vectors of file {file_id} to collection {collection_name}")
+    return copied
+
+
 def save_docs_to_vector_db(
     request: Request,
     docs,
@@ -1124,7 +1201,7 @@ def save_docs_to_vector_db(
 
     # Check if entries with the same hash (metadata.hash) already exist
     if metadata and "hash" in metadata:
-        result = VECTOR_DB_CLIENT.query(
+        result = get_vector_db_client(collection_name).query(
             collection_name=collection_name,
             filter={"hash": metadata["hash"]},
         )
@@ -1167,12 +1244,7 @@ def save_docs_to_vector_db(
         {
             **doc.metadata,
             **(metadata if metadata else {}),
-            "embedding_config": json.dumps(
-                {
-                    "engine": request.app.state.config.RAG_EMBEDDING_ENGINE,
-                    "model": request.app.state.config.RAG_EMBEDDING_MODEL,
-                }
-            ),
+            "embedding_config": get_embedding_config_metadata(request),
         }
         for doc in docs
     ]
@@ -1189,11 +1261,15 @@ def save_docs_to_vector_db(
                 metadata[key] = str(value)
 
     try:
-        if VECTOR_DB_CLIENT.has_collection(collection_name=collection_name):
+        if get_vector_db_client(collection_name).has_collection(
+            collection_name=collection_name
+        ):
             log.info(f"collection {collection_name} already exists")
 
             if overwrite:
-                VECTOR_DB_CLIENT.delete_collection(collection_name=collection_name)
+                get_vector_db_client(collection_name).delete_collection(
+                    collection_name=collection_name
+                )
                 log.info(f"deleting existing collection {collection_name}")
             elif add is False:
                 log.info(
@@ -1248,7 +1324,7 @@ def save_docs_to_vector_db(
             for idx, text in enumerate(texts)
         ]
 
-        VECTOR_DB_CLIENT.insert(
+        get_vector_db_client(collection_name).insert(
             collection_name=collection_name,
             items=items,
         )
@@ -1265,6 +1341,44 @@ class ProcessFileForm(BaseModel):
     collection_name: Optional[str] = None
 
 
+@router.get("/process/file/cache")
+async def get_extraction_cache_stats(user=Depends(get_admin_user)):
+    if EXTRACTION_CACHE is None:
+        return {"enabled": False}
+    return {"enabled": True, **EXTRACTION_CACHE.get_stats()}
+
+
+def get_loader(request: Request) -> Loader:
+    return Loader(
+        engine=request.app.state.config.CONTENT_EXTRACTION_ENGINE,
+        DATALAB_MARKER_API_KEY=request.app.state.config.DATALAB_MARKER_API_KEY,
+        DATALAB_MARKER_LANGS=request.app.state.config.DATALAB_MARKER_LANGS,
+        DATALAB_MARKER_SKIP_CACHE=request.app.state.config.DATALAB_MARKER_SKIP_CACHE,
+        DATALAB_MARKER_FORCE_OCR=request.app.state.config.DATALAB_MARKER_FORCE_OCR,
+        DATALAB_MARKER_PAGINATE=request.app.state.config.DATALAB_MARKER_PAGINATE,
+        DATALAB_MARKER_STRIP_EXISTING_OCR=request.app.state.config.DATALAB_MARKER_STRIP_EXISTING_OCR,
+        DATALAB_MARKER_DISABLE_IMAGE_EXTRACTION=request.app.state.config.DATALAB_MARKER_DISABLE_IMAGE_EXTRACTION,
+        DATALAB_MARKER_USE_LLM=request.app.state.config.DATALAB_MARKER_USE_LLM,
+        DATALAB_MARKER_OUTPUT_FORMAT=request.app.state.config.DATALAB_MARKER_OUTPUT_FORMAT,
+        EXTERNAL_DOCUMENT_LOADER_URL=request.app.state.config.EXTERNAL_DOCUMENT_LOADER_URL,
+        EXTERNAL_DOCUMENT_LOADER_API_KEY=request.app.state.config.EXTERNAL_DOCUMENT_LOADER_API_KEY,
+        TIKA_SERVER_URL=request.app.state.config.TIKA_SERVER_URL,
+        DOCLING_SERVER_URL=request.app.state.config.DOCLING_SERVER_URL,
+        DOCLING_PARAMS={
+            "ocr_engine": request.app.state.config.DOCLING_OCR_ENGINE,
+            "ocr_lang": request.app.state.config.DOCLING_OCR_LANG,
+            "do_picture_description": request.app.state.config.DOCLING_DO_PICTURE_DESCRIPTION,
+            "picture_description_mode": request.app.state.config.DOCLING_PICTURE_DESCRIPTION_MODE,
+            "picture_description_local": request.app.state.config.DOCLING_PICTURE_DESCRIPTION_LOCAL,
+            "picture_description_api": request.app.state.config.DOCLING_PICTURE_DESCRIPTION_API,
+        },
+        PDF_EXTRACT_IMAGES=request.app.state.config.PDF_EXTRACT_IMAGES,
+        DOCUMENT_INTELLIGENCE_ENDPOINT=request.app.state.config.DOCUMENT_INTELLIGENCE_ENDPOINT,
+        DOCUMENT_INTELLIGENCE_KEY=request.app.state.config.DOCUMENT_INTELLIGENCE_KEY,
+        MISTRAL_OCR_API_KEY=request.app.state.config.MISTRAL_OCR_API_KEY,
+    )
+
+
 @router.post("/process/file")
 def process_file(
     request: Request,
@@ -1279,6 +1393,9 @@ def process_file(
         if collection_name is None:
             collection_name = f"file-{file.id}"
 
+        # Chunks of the file collection that can be copied instead of embedded again
+        stored = None
+
         if form_data.content:
             # Update the content in the file
             # Usage: /files/{file_id}/data/content/update, /files/ (audio file upload pipeline)
@@ -1313,6 +1430,7 @@ def process_file(
             )
 
             if result is not None and len(result.ids[0]) > 0:
+                stored = result
                 docs = [
                     Document(
                         page_content=result.documents[0][idx],
@@ -1341,34 +1459,7 @@ def process_file(
             file_path = file.path
             if file_path:
                 file_path = Storage.get_file(file_path)
-                loader = Loader(
-                    engine=request.app.state.config.CONTENT_EXTRACTION_ENGINE,
-                    DATALAB_MARKER_API_KEY=request.app.state.config.DATALAB_MARKER_API_KEY,
-                    DATALAB_MARKER_LANGS=request.app.state.config.DATALAB_MARKER_LANGS,
-                    DATALAB_MARKER_SKIP_CACHE=request.app.state.config.DATALAB_MARKER_SKIP_CACHE,
-                    DATALAB_MARKER_FORCE_OCR=request.app.state.config.DATALAB_MARKER_FORCE_OCR,
-                    DATALAB_MARKER_PAGINATE=request.app.state.config.DATALAB_MARKER_PAGINATE,
-                    DATALAB_MARKER_STRIP_EXISTING_OCR=request.app.state.config.DATALAB_MARKER_STRIP_EXISTING_OCR,
-                    DATALAB_MARKER_DISABLE_IMAGE_EXTRACTION=request.app.state.config.DATALAB_MARKER_DISABLE_IMAGE_EXTRACTION,
-                    DATALAB_MARKER_USE_LLM=request.app.state.config.DATALAB_MARKER_USE_LLM,
-                    DATALAB_MARKER_OUTPUT_FORMAT=request.app.state.config.DATALAB_MARKER_OUTPUT_FORMAT,
-                    EXTERNAL_DOCUMENT_LOADER_URL=request.app.state.config.EXTERNAL_DOCUMENT_LOADER_URL,
-                    EXTERNAL_DOCUMENT_LOADER_API_KEY=request.app.state.config.EXTERNAL_DOCUMENT_LOADER_API_KEY,
-                    TIKA_SERVER_URL=request.app.state.config.TIKA_SERVER_URL,
-                    DOCLING_SERVER_URL=request.app.state.config.DOCLING_SERVER_URL,
-                    DOCLING_PARAMS={
-                        "ocr_engine": request.app.state.config.DOCLING_OCR_ENGINE,
-                        "ocr_lang": request.app.state.config.DOCLING_OCR_LANG,
-                        "do_picture_description": request.app.state.config.DOCLING_DO_PICTURE_DESCRIPTION,
-                        "picture_description_mode": request.app.state.config.DOCLING_PICTURE_DESCRIPTION_MODE,
-                        "picture_description_local": request.app.state.config.DOCLING_PICTURE_DESCRIPTION_LOCAL,
-                        "picture_description_api": request.app.state.config.DOCLING_PICTURE_DESCRIPTION_API,
-                    },
-                    PDF_EXTRACT_IMAGES=request.app.state.config.PDF_EXTRACT_IMAGES,
-                    DOCUMENT_INTELLIGENCE_ENDPOINT=request.app.state.config.DOCUMENT_INTELLIGENCE_ENDPOINT,
-                    DOCUMENT_INTELLIGENCE_KEY=request.app.state.config.DOCUMENT_INTELLIGENCE_KEY,
-                    MISTRAL_OCR_API_KEY=request.app.state.config.MISTRAL_OCR_API_KEY,
-                )
+                loader = get_loader(request)
                 docs = loader.load(
                     file.filename, file.meta.get("content_type"), file_path
                 )
@@ -1412,18 +1503,22 @@ def process_file(
 
         if not request.app.state.config.BYPASS_EMBEDDING_AND_RETRIEVAL:
             try:
-                result = save_docs_to_vector_db(
-                    request,
-                    docs=docs,
-                    collection_name=collection_name,
-                    metadata={
-                        "file_id": file.id,
-                        "name": file.filename,
-                        "hash": hash,
-                    },
-                    add=(True if form_data.collection_name else False),
-                    user=user,
+                result = stored is not None and copy_file_vectors(
+                    request, file.id, collection_name, hash, stored
                 )
+                if not result:
+                    result = save_docs_to_vector_db(
+                        request,
+                        docs=docs,
+                        collection_name=collection_name,
+                        metadata={
+                            "file_id": file.id,
+                            "name": file.filename,
+                            "hash": hash,
+                        },
+                        add=(True if form_data.collection_name else False),
+                        user=user,
+                    )
 
                 if result:
                     Files.update_file_metadata_by_id(
@@ -1616,11 +1711,16 @@ def search_web(request: Request, engine: str, query: str) -> list[SearchResult]:
     Args:
         query (str): The query to search for
     """
+    return get_search_call(request, engine, query)()
 
+
+def get_search_call(request: Request, engine: str, query: str) -> partial:
+    """Resolve the configured engine into a ready to run call of its search function."""
     # TODO: add playwright to search the web
     if engine == "searxng":
         if request.app.state.config.SEARXNG_QUERY_URL:
-            return search_searxng(
+            return partial(
+                search_searxng,
                 request.app.state.config.SEARXNG_QUERY_URL,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -1630,7 +1730,8 @@ def search_web(request: Request, engine: str, query: str) -> list[SearchResult]:
             raise Exception("No SEARXNG_QUERY_URL found in environment variables")
     elif engine == "yacy":
         if request.app.state.config.YACY_QUERY_URL:
-            return search_yacy(
+            return partial(
+                search_yacy,
                 request.app.state.config.YACY_QUERY_URL,
                 request.app.state.config.YACY_USERNAME,
                 request.app.state.config.YACY_PASSWORD,
@@ -1645,7 +1746,8 @@ def search_web(request: Request, engine: str, query: str) -> list[SearchResult]:
             request.app.state.config.GOOGLE_PSE_API_KEY
             and request.app.state.config.GOOGLE_PSE_ENGINE_ID
         ):
-            return search_google_pse(
+            return partial(
+                search_google_pse,
                 request.app.state.config.GOOGLE_PSE_API_KEY,
                 request.app.state.config.GOOGLE_PSE_ENGINE_ID,
                 query,
@@ -1658,7 +1760,8 @@ def search_web(request: Request, engine: str, query: str) -> list[SearchResult]:
             )
     elif engine == "brave":
         if request.app.state.config.BRAVE_SEARCH_API_KEY:
-            return search_brave(
+            return partial(
+                search_brave,
                 request.app.state.config.BRAVE_SEARCH_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -1668,7 +1771,8 @@ def search_web(request: Request, engine: str, query: str) -> list[SearchResult]:
             raise Exception("No BRAVE_SEARCH_API_KEY found in environment variables")
     elif engine == "kagi":
         if request.app.state.config.KAGI_SEARCH_API_KEY:
-            return search_kagi(
+            return partial(
+                search_kagi,
                 request.app.state.config.KAGI_SEARCH_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -1678,7 +1782,8 @@ def search_web(request: Request, engine: str, query: str) -> list[SearchResult]:
             raise Exception("No KAGI_SEARCH_API_KEY found in environment variables")
     elif engine == "mojeek":
         if request.app.state.config.MOJEEK_SEARCH_API_KEY:
-            return search_mojeek(
+            return partial(
+                search_mojeek,
                 request.app.state.config.MOJEEK_SEARCH_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -1688,7 +1793,8 @@ def search_web(request: Request, engine: str, query: str) -> list[SearchResult]:
             raise Exception("No MOJEEK_SEARCH_API_KEY found in environment variables")
     elif engine == "bocha":
         if request.app.state.config.BOCHA_SEARCH_API_KEY:
-            return search_bocha(
+            return partial(
+                search_bocha,
                 request.app.state.config.BOCHA_SEARCH_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -1698,7 +1804,8 @@ def search_web(request: Request, engine: str, query: str) -> list[SearchResult]:
             raise Exception("No BOCHA_SEARCH_API_KEY found in environment variables")
     elif engine == "serpstack":
         if request.app.state.config.SERPSTACK_API_KEY:
-            return search_serpstack(
+            return partial(
+                search_serpstack,
                 request.app.state.config.SERPSTACK_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -1709,7 +1816,8 @@ def search_web(request: Request, engine: str, query: str) -> list[SearchResult]:
             raise Exception("No SERPSTACK_API_KEY found in environment variables")
     elif engine == "serper":
         if request.app.state.config.SERPER_API_KEY:
-            return search_serper(
+            return partial(
+                search_serper,
                 request.app.state.config.SERPER_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -1719,7 +1827,8 @@ def search_web(request: Request, engine: str, query: str) -> list[SearchResult]:
             raise Exception("No SERPER_API_KEY found in environment variables")
     elif engine == "serply":
         if request.app.state.config.SERPLY_API_KEY:
-            return search_serply(
+            return partial(
+                search_serply,
                 request.app.state.config.SERPLY_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -1728,14 +1837,16 @@ def search_web(request: Request, engine: str, query: str) -> list[SearchResult]:
         else:
             raise Exception("No SERPLY_API_KEY found in environment variables")
     elif engine == "duckduckgo":
-        return search_duckduckgo(
+        return partial(
+            search_duckduckgo,
             query,
             request.app.state.config.WEB_SEARCH_RESULT_COUNT,
             request.app.state.config.WEB_SEARCH_DOMAIN_FILTER_LIST,
         )
     elif engine == "tavily":
         if request.app.state.config.TAVILY_API_KEY:
-            return search_tavily(
+            return partial(
+                search_tavily,
                 request.app.state.config.TAVILY_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -1745,7 +1856,8 @@ def search_web(request: Request, engine: str, query: str) -> list[SearchResult]:
             raise Exception("No TAVILY_API_KEY found in environment variables")
     elif engine == "searchapi":
         if request.app.state.config.SEARCHAPI_API_KEY:
-            return search_searchapi(
+            return partial(
+                search_searchapi,
                 request.app.state.config.SEARCHAPI_API_KEY,
                 request.app.state.config.SEARCHAPI_ENGINE,
                 query,
@@ -1756,7 +1868,8 @@ def search_web(request: Request, engine: str, query: str) -> list[SearchResult]:
             raise Exception("No SEARCHAPI_API_KEY found in environment variables")
     elif engine == "serpapi":
         if request.app.state.config.SERPAPI_API_KEY:
-            return search_serpapi(
+            return partial(
+                search_serpapi,
                 request.app.state.config.SERPAPI_API_KEY,
                 request.app.state.config.SERPAPI_ENGINE,
                 query,
@@ -1766,13 +1879,15 @@ def search_web(request: Request, engine: str, query: str) -> list[SearchResult]:
         else:
             raise Exception("No SERPAPI_API_KEY found in environment variables")
     elif engine == "jina":
-        return search_jina(
+        return partial(
+            search_jina,
             request.app.state.config.JINA_API_KEY,
             query,
             request.app.state.config.WEB_SEARCH_RESULT_COUNT,
         )
     elif engine == "bing":
-        return search_bing(
+        return partial(
+            search_bing,
             request.app.state.config.BING_SEARCH_V7_SUBSCRIPTION_KEY,
             request.app.state.config.BING_SEARCH_V7_ENDPOINT,
             str(DEFAULT_LOCALE),
@@ -1781,7 +1896,8 @@ def search_web(request: Request, engine: str, query: str) -> list[SearchResult]:
             request.app.state.config.WEB_SEARCH_DOMAIN_FILTER_LIST,
         )
     elif engine == "perplexity":
-        return search_perplexity(
+        return partial(
+            search_perplexity,
             request.app.state.config.PERPLEXITY_API_KEY,
             query,
             request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -1794,7 +1910,8 @@ def search_web(request: Request, engine: str, query: str) -> list[SearchResult]:
             request.app.state.config.SOUGOU_API_SID
             and request.app.state.config.SOUGOU_API_SK
         ):
-            return search_sougou(
+            return partial(
+                search_sougou,
                 request.app.state.config.SOUGOU_API_SID,
                 request.app.state.config.SOUGOU_API_SK,
                 query,
@@ -1806,7 +1923,8 @@ def search_web(request: Request, engine: str, query: str) -> list[SearchResult]:
                 "No SOUGOU_API_SID or SOUGOU_API_SK found in environment variables"
             )
     elif engine == "firecrawl":
-        return search_firecrawl(
+        return partial(
+            search_firecrawl,
             request.app.state.config.FIRECRAWL_API_BASE_URL,
             request.app.state.config.FIRECRAWL_API_KEY,
             query,
@@ -1814,7 +1932,8 @@ def search_web(request: Request, engine: str, query: str) -> list[SearchResult]:
             request.app.state.config.WEB_SEARCH_DOMAIN_FILTER_LIST,
         )
     elif engine == "external":
-        return search_external(
+        return partial(
+            search_external,
             request.app.state.config.EXTERNAL_WEB_SEARCH_URL,
             request.app.state.config.EXTERNAL_WEB_SEARCH_API_KEY,
             query,
@@ -1825,11 +1944,93 @@ def search_web(request: Request, engine: str, query: str) -> list[SearchResult]:
         raise Exception("No search engine API key found in environment variables")
 
 
+# Engines with an async client, keyed by their sync search function
+ASYNC_SEARCH_FUNCTIONS = {
+    search_brave: asearch_brave,
+    search_google_pse: asearch_google_pse,
+    search_jina: asearch_jina,
+    search_kagi: asearch_kagi,
+    search_mojeek: asearch_mojeek,
+    search_searchapi: asearch_searchapi,
+    search_searxng: asearch_searxng,
+    search_serpapi: asearch_serpapi,
+    search_serper: asearch_serper,
+    search_serply: asearch_serply,
+    search_serpstack: asearch_serpstack,
+    search_tavily: asearch_tavily,
+}
+
+
+async def asearch_web(request: Request, engine: str, query: str) -> list[SearchResult]:
+    """
+    Async version of search_web, rate limited per engine.
+
+    Engines with an async client share the pooled HTTP session on the event
+    loop; the others still run their blocking client in the threadpool.
+    """
+    call = get_search_call(request, engine, query)
+    await get_search_rate_limiter(engine).wait()
+
+    if asearch := ASYNC_SEARCH_FUNCTIONS.get(call.func):
+        return await asearch(*call.args, **call.keywords)
+    return await run_in_threadpool(call)
+
+
+async def search_web_with_cache(
+    request: Request, engine: str, query: str
+) -> list[SearchResult]:
+    """Search without blocking the event loop, sharing results of identical searches."""
+    if SEARCH_RESULT_CACHE is None:
+        return await asearch_web(request, engine, query)
+
+    return await SEARCH_RESULT_CACHE.get_or_search(
+        engine,
+        query,
+        request.app.state.config.WEB_SEARCH_RESULT_COUNT,
+        request.app.state.config.WEB_SEARCH_DOMAIN_FILTER_LIST,
+        lambda: asearch_web(request, engine, query),
+    )
+
+
+@router.get("/web/search/cache")
+async def get_web_search_cache_stats(user=Depends(get_admin_user)):
+    if SEARCH_RESULT_CACHE is None:
+        return {"enabled": False, "engines": {}}
+    return {"enabled": True, "engines": SEARCH_RESULT_CACHE.get_stats()}
+
+
 @router.post("/process/web/search")
 async def process_web_search(
     request: Request, form_data: SearchForm, user=Depends(get_verified_user)
 ):
 
+    # Create a single collection for all documents
+    collection_name = (
+        f"web-search-{calculate_sha256_string('-'.join(form_data.queries))}"[:63]
+    )
+
+    # A repeated query within the TTL reuses the stored results, skipping search, fetch and embedding
+    if (
+        WEB_SEARCH_VECTOR_DB_CLIENT is not None
+        and not request.app.state.config.BYPASS_WEB_SEARCH_EMBEDDING_AND_RETRIEVAL
+    ):
+        result = WEB_SEARCH_VECTOR_DB_CLIENT.get(collection_name=collection_name)
+        if result is not None and result.ids[0]:
+            log.debug(f"reusing web search results from {collection_name}")
+            urls = list(
+                dict.fromkeys(
+                    metadata.get("source")
+                    for metadata in result.metadatas[0]
+                    if metadata and metadata.get("source")
+                )
+            )
+            return {
+                "status": True,
+                "collection_names": [collection_name],
+                "filenames": urls,
+                "loaded_count": len(urls),
+            }
+
     urls = []
     try:
         logging.info(
@@ -1837,8 +2038,7 @@ async def process_web_search(
         )
 
         search_tasks = [
-            run_in_threadpool(
-                search_web,
+            search_web_with_cache(
                 request,
                 request.app.state.config.WEB_SEARCH_ENGINE,
                 query,
@@ -1908,13 +2108,6 @@ async def process_web_search(
                 "loaded_count": len(docs),
             }
         else:
-            # Create a single collection for all documents
-            collection_name = (
-                f"web-search-{calculate_sha256_string('-'.join(form_data.queries))}"[
-                    :63
-                ]
-            )
-
             try:
                 await run_in_threadpool(
                     save_docs_to_vector_db,
@@ -1959,9 +2152,9 @@ def query_doc_handler(
     try:
         if request.app.state.config.ENABLE_RAG_HYBRID_SEARCH:
             collection_results = {}
-            collection_results[form_data.collection_name] = VECTOR_DB_CLIENT.get(
-                collection_name=form_data.collection_name
-            )
+            collection_results[form_data.collection_name] = get_vector_db_client(
+                form_data.collection_name
+            ).get(collection_name=form_data.collection_name)
             return query_doc_with_hybrid_search(
                 collection_name=form_data.collection_name,
                 collection_result=collection_results[form_data.collection_name],
@@ -2093,6 +2286,8 @@ def delete_entries_from_collection(form_data: DeleteForm, user=Depends(get_admin
 @router.post("/reset/db")
 def reset_vector_db(user=Depends(get_admin_user)):
     VECTOR_DB_CLIENT.reset()
+    if WEB_SEARCH_VECTOR_DB_CLIENT is not None:
+        WEB_SEARCH_VECTOR_DB_CLIENT.reset()
     Knowledges.delete_all_knowledge()
 
 
@@ -2155,28 +2350,88 @@ def process_files_batch(
     """
     Process a batch of files and save them to the vector database.
     """
+    from open_webui.routers.files import has_access_to_file
+
     results: List[BatchProcessFilesResult] = []
     errors: List[BatchProcessFilesResult] = []
     collection_name = form_data.collection_name
 
+    # Only the stored files are trusted, the request body could point
+    # their path anywhere on the server
+    stored_files: List[FileModel] = []
+    for form_file in form_data.files:
+        file = Files.get_file_by_id(form_file.id)
+        if file is None or not (
+            file.user_id == user.id
+            or user.role == "admin"
+            or has_access_to_file(file.id, "read", user)
+        ):
+            errors.append(
+                BatchProcessFilesResult(
+                    file_id=form_file.id,
+                    status="failed",
+                    error=ERROR_MESSAGES.NOT_FOUND,
+                )
+            )
+            continue
+        stored_files.append(file)
+
+    # Files without content were not processed on upload, extract them
+    # concurrently so OCR engines work on several documents at once
+    extracted = {}
+    unprocessed = [
+        file
+        for file in stored_files
+        if file.path and not (file.data or {}).get("content")
+    ]
+    if unprocessed:
+        files = []
+        for file in unprocessed:
+            try:
+                files.append(
+                    (
+                        file.filename,
+                        (file.meta or {}).get("content_type"),
+                        Storage.get_file(file.path),
+                    )
+                )
+            except Exception as e:
+                extracted[file.id] = e
+        unprocessed = [file for file in unprocessed if file.id not in extracted]
+
+        # Sync endpoints run in the threadpool, without an event loop
+        loaded = asyncio.run(get_loader(request).aload_batch(files))
+        extracted.update(zip([file.id for file in unprocessed], loaded))
+
     # Prepare all documents first
     all_docs: List[Document] = []
-    for file in form_data.files:
+    for file in stored_files:
         try:
-            text_content = file.data.get("content", "")
-
-            docs: List[Document] = [
-                Document(
-                    page_content=text_content.replace("<br/>", "\n"),
-                    metadata={
-                        **file.meta,
-                        "name": file.filename,
-                        "created_by": file.user_id,
-                        "file_id": file.id,
-                        "source": file.filename,
-                    },
-                )
-            ]
+            metadata = {
+                "name": file.filename,
+                "created_by": file.user_id,
+                "file_id": file.id,
+                "source": file.filename,
+            }
+            if file.id in extracted:
+                if isinstance(extracted[file.id], Exception):
+                    raise extracted[file.id]
+                docs: List[Document] = [
+                    Document(
+                        page_content=doc.page_content,
+                        metadata={**doc.metadata, **metadata},
+                    )
+                    for doc in extracted[file.id]
+                ]
+                text_content = " ".join([doc.page_content for doc in docs])
+            else:
+                text_content = (file.data or {}).get("content", "")
+                docs = [
+                    Document(
+                        page_content=text_content.replace("<br/>", "\n"),
+                        metadata={**(file.meta or {}), **metadata},
+                    )
+                ]
 
             hash = calculate_sha256_string(text_content)
             Files.update_file_hash_by_id(file.id, hash)
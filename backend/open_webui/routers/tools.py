@@ -17,7 +17,7 @@ from open_webui.utils.plugin import load_tool_module_by_id, replace_imports
 from open_webui.config import CACHE_DIR
 from open_webui.constants import ERROR_MESSAGES
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from open_webui.utils.tools import get_tool_specs
+from open_webui.utils.tools import get_tool_specs, TOOL_REGISTRY
 from open_webui.utils.auth import get_admin_user, get_verified_user
 from open_webui.utils.access_control import has_access, has_permission
 from open_webui.env import SRC_LOG_LEVELS
@@ -411,6 +411,7 @@ async def update_tools_by_id(
 
         log.debug(updated)
         tools = Tools.update_tool_by_id(id, updated)
+        TOOL_REGISTRY.invalidate(id)
 
         if tools:
             return tools
@@ -458,6 +459,7 @@ async def delete_tools_by_id(
         TOOLS = request.app.state.TOOLS
         if id in TOOLS:
             del TOOLS[id]
+        TOOL_REGISTRY.invalidate(id)
 
     return result
 
@@ -557,6 +559,7 @@ async def update_tools_valves_by_id(
         form_data = {k: v for k, v in form_data.items() if v is not None}
         valves = Valves(**form_data)
         Tools.update_tool_valves_by_id(id, valves.model_dump())
+        TOOL_REGISTRY.invalidate(id)
         return valves.model_dump()
     except Exception as e:
         log.exception(f"Failed to update tool valves by id {id}: {e}")
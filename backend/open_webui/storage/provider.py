@@ -3,8 +3,12 @@ import shutil
 import json
 import logging
 import re
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import BinaryIO, Tuple, Dict
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, BinaryIO, Callable, Iterator, Optional, Tuple, Dict
 
 import boto3
 from botocore.config import Config
@@ -25,13 +29,16 @@ from open_webui.config import (
     AZURE_STORAGE_CONTAINER_NAME,
     AZURE_STORAGE_KEY,
     STORAGE_PROVIDER,
+    STORAGE_LOCAL_CACHE_MAX_SIZE,
+    STORAGE_LOCAL_CACHE_REVALIDATE_INTERVAL,
+    STORAGE_PRESIGNED_URL_EXPIRY,
     UPLOAD_DIR,
 )
 from google.cloud import storage
 from google.cloud.exceptions import GoogleCloudError, NotFound
 from open_webui.constants import ERROR_MESSAGES
 from azure.identity import DefaultAzureCredential
-from azure.storage.blob import BlobServiceClient
+from azure.storage.blob import BlobSasPermissions, BlobServiceClient, generate_blob_sas
 from azure.core.exceptions import ResourceNotFoundError
 from open_webui.env import SRC_LOG_LEVELS
 
@@ -40,6 +47,214 @@ log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MAIN"])
 
 
+class LocalFileCache:
+    """
+    Local copies of object storage files, bounded by their total size.
+
+    A copy checked less than `revalidate_interval` seconds ago is served as
+    is. Older copies are checked against the object's current version (ETag
+    or generation) and downloaded again only if it changed. Copies without a
+    known version, written by an upload or left over from a previous run,
+    take the remote version when their size matches, as object names carry a
+    unique file id and are never rewritten. Least recently used copies are
+    removed once `max_size` is exceeded, and concurrent requests for the same
+    object share a single download.
+
+    Evicted copies stay on disk for `eviction_delay` seconds, so a caller
+    that was just given the path of one can still open it.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 0,
+        revalidate_interval: int = 300,
+        eviction_delay: float = 60,
+    ):
+        self.max_size = max_size
+        self.revalidate_interval = revalidate_interval
+        self.eviction_delay = eviction_delay
+
+        self._lock = threading.Lock()
+        self._download_locks = [threading.Lock() for _ in range(64)]
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._size = 0
+        # (evicted at, key, path) of the copies waiting to be removed
+        self._evicted: list[Tuple[float, str, str]] = []
+        # Keys being served by get_file, their copies are not removed
+        self._in_use: set[str] = set()
+        self._stats = {"hits": 0, "misses": 0, "revalidations": 0, "evictions": 0}
+
+    def get_file(
+        self,
+        key: str,
+        local_file_path: str,
+        get_version: Callable[[], Tuple[Any, int]],
+        download: Callable[[str], None],
+    ) -> str:
+        """
+        Path of an up to date local copy of the object `key`.
+
+        `get_version` returns the object's current (version, size) and
+        `download` writes the object to the given path.
+        """
+        with self._download_locks[hash(key) % len(self._download_locks)]:
+            with self._lock:
+                self._in_use.add(key)
+            try:
+                return self._get_file(key, local_file_path, get_version, download)
+            finally:
+                with self._lock:
+                    self._in_use.discard(key)
+
+    def _get_file(
+        self,
+        key: str,
+        local_file_path: str,
+        get_version: Callable[[], Tuple[Any, int]],
+        download: Callable[[str], None],
+    ) -> str:
+        entry = self._get_entry(key, local_file_path)
+
+        if entry is not None:
+            if time.time() - entry["checked_at"] <= self.revalidate_interval:
+                self._count("hits")
+                return local_file_path
+
+            version, size = get_version()
+            self._count("revalidations")
+            if entry["version"] == version or (
+                entry["version"] is None and entry["size"] == size
+            ):
+                entry["version"] = version
+                entry["checked_at"] = time.time()
+                self._count("hits")
+                return local_file_path
+        else:
+            version, _ = get_version()
+
+        self._count("misses")
+        tmp_file_path = f"{local_file_path}.{threading.get_ident()}.tmp"
+        try:
+            download(tmp_file_path)
+            os.replace(tmp_file_path, local_file_path)
+        finally:
+            if os.path.exists(tmp_file_path):
+                os.remove(tmp_file_path)
+
+        self.add(key, local_file_path, version)
+        return local_file_path
+
+    def _get_entry(self, key: str, local_file_path: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["path"] != local_file_path:
+                self._pop(key)
+                entry = None
+
+        if not os.path.isfile(local_file_path):
+            if entry is not None:
+                with self._lock:
+                    self._pop(key)
+            return None
+
+        if entry is None:
+            # A copy from an upload or a previous run, verify it before serving it
+            self.add(key, local_file_path, None, checked=False)
+            entry = self._entries.get(key)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        return entry
+
+    def add(
+        self,
+        key: str,
+        local_file_path: str,
+        version: Any = None,
+        checked: bool = True,
+    ) -> None:
+        """Track a local copy, e.g. one just written by an upload."""
+        with self._lock:
+            self._pop(key)
+            entry = {
+                "path": local_file_path,
+                "version": version,
+                "size": os.path.getsize(local_file_path),
+                "checked_at": time.time() if checked else 0,
+            }
+            self._entries[key] = entry
+            self._size += entry["size"]
+
+            while (
+                self.max_size > 0
+                and self._size > self.max_size
+                and len(self._entries) > 1
+            ):
+                evicted_key = next(iter(self._entries))
+                evicted = self._pop(evicted_key)
+                self._stats["evictions"] += 1
+                self._evicted.append((time.time(), evicted_key, evicted["path"]))
+
+        self._remove_evicted()
+
+    def _remove_evicted(self) -> None:
+        now = time.time()
+        with self._lock:
+            pending = []
+            for evicted_at, key, path in self._evicted:
+                if now - evicted_at < self.eviction_delay:
+                    pending.append((evicted_at, key, path))
+                    continue
+                entry = self._entries.get(key)
+                if key in self._in_use or (entry is not None and entry["path"] == path):
+                    # Served or tracked again since, the copy is not stale
+                    continue
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            self._evicted = pending
+
+    def get_cached_file(self, key: str) -> Optional[str]:
+        """Path of the tracked local copy of `key`, without checking its version."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or not os.path.isfile(entry["path"]):
+            return None
+        return entry["path"]
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _pop(self, key: str) -> Optional[dict]:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry["size"]
+        return entry
+
+    def _count(self, stat: str):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            requests = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_ratio": self._stats["hits"] / requests if requests else 0.0,
+                "files": len(self._entries),
+                "size": self._size,
+                "max_size": self.max_size,
+            }
+
+
 class StorageProvider(ABC):
     @abstractmethod
     def get_file(self, file_path: str) -> str:
@@ -59,6 +274,29 @@ class StorageProvider(ABC):
     def delete_file(self, file_path: str) -> None:
         pass
 
+    def get_local_file(self, file_path: str) -> Optional[str]:
+        """Path of a local copy of the file if there is one, without downloading it."""
+        return None
+
+    def iter_file_range(
+        self, file_path: str, start: int, end: int, chunk_size: int = 1024 * 1024
+    ) -> Iterator[bytes]:
+        """Bytes `start` to `end` (inclusive) of the file."""
+        with open(self.get_file(file_path), "rb") as f:
+            f.seek(start)
+            while start <= end:
+                chunk = f.read(min(chunk_size, end - start + 1))
+                if not chunk:
+                    break
+                start += len(chunk)
+                yield chunk
+
+    def get_presigned_url(
+        self, file_path: str, content_type: Optional[str], content_disposition: str
+    ) -> Optional[str]:
+        """Time-limited URL to download the file from the backend, if it has one."""
+        return None
+
 
 class LocalStorageProvider(StorageProvider):
     @staticmethod
@@ -78,6 +316,10 @@ class LocalStorageProvider(StorageProvider):
         """Handles downloading of the file from local storage."""
         return file_path
 
+    @staticmethod
+    def get_local_file(file_path: str) -> Optional[str]:
+        return file_path if os.path.isfile(file_path) else None
+
     @staticmethod
     def delete_file(file_path: str) -> None:
         """Handles deletion of the file from local storage."""
@@ -137,6 +379,11 @@ class S3StorageProvider(StorageProvider):
         self.bucket_name = S3_BUCKET_NAME
         self.key_prefix = S3_KEY_PREFIX if S3_KEY_PREFIX else ""
 
+        self.cache = LocalFileCache(
+            max_size=STORAGE_LOCAL_CACHE_MAX_SIZE,
+            revalidate_interval=STORAGE_LOCAL_CACHE_REVALIDATE_INTERVAL,
+        )
+
     @staticmethod
     def sanitize_tag_value(s: str) -> str:
         """Only include S3 allowed characters."""
@@ -165,6 +412,7 @@ class S3StorageProvider(StorageProvider):
                     Key=s3_key,
                     Tagging=tagging,
                 )
+            self.cache.add(f"s3://{self.bucket_name}/{s3_key}", file_path)
             return (
                 open(file_path, "rb").read(),
                 f"s3://{self.bucket_name}/{s3_key}",
@@ -173,15 +421,56 @@ class S3StorageProvider(StorageProvider):
             raise RuntimeError(f"Error uploading file to S3: {e}")
 
     def get_file(self, file_path: str) -> str:
-        """Handles downloading of the file from S3 storage."""
+        """Handles downloading of the file from S3 storage, unless a local copy is up to date."""
         try:
             s3_key = self._extract_s3_key(file_path)
             local_file_path = self._get_local_file_path(s3_key)
-            self.s3_client.download_file(self.bucket_name, s3_key, local_file_path)
-            return local_file_path
+
+            def get_version():
+                response = self.s3_client.head_object(
+                    Bucket=self.bucket_name, Key=s3_key
+                )
+                return response["ETag"], response["ContentLength"]
+
+            return self.cache.get_file(
+                file_path,
+                local_file_path,
+                get_version,
+                lambda path: self.s3_client.download_file(
+                    self.bucket_name, s3_key, path
+                ),
+            )
         except ClientError as e:
             raise RuntimeError(f"Error downloading file from S3: {e}")
 
+    def get_local_file(self, file_path: str) -> Optional[str]:
+        return self.cache.get_cached_file(file_path)
+
+    def iter_file_range(
+        self, file_path: str, start: int, end: int, chunk_size: int = 1024 * 1024
+    ) -> Iterator[bytes]:
+        """Streams a byte range of the file from S3 storage."""
+        response = self.s3_client.get_object(
+            Bucket=self.bucket_name,
+            Key=self._extract_s3_key(file_path),
+            Range=f"bytes={start}-{end}",
+        )
+        yield from response["Body"].iter_chunks(chunk_size)
+
+    def get_presigned_url(
+        self, file_path: str, content_type: Optional[str], content_disposition: str
+    ) -> Optional[str]:
+        params = {
+            "Bucket": self.bucket_name,
+            "Key": self._extract_s3_key(file_path),
+            "ResponseContentDisposition": content_disposition,
+        }
+        if content_type:
+            params["ResponseContentType"] = content_type
+        return self.s3_client.generate_presigned_url(
+            "get_object", Params=params, ExpiresIn=STORAGE_PRESIGNED_URL_EXPIRY
+        )
+
     def delete_file(self, file_path: str) -> None:
         """Handles deletion of the file from S3 storage."""
         try:
@@ -191,6 +480,7 @@ class S3StorageProvider(StorageProvider):
             raise RuntimeError(f"Error deleting file from S3: {e}")
 
         # Always delete from local storage
+        self.cache.remove(file_path)
         LocalStorageProvider.delete_file(file_path)
 
     def delete_all_files(self) -> None:
@@ -210,6 +500,7 @@ class S3StorageProvider(StorageProvider):
             raise RuntimeError(f"Error deleting all files from S3: {e}")
 
         # Always delete from local storage
+        self.cache.clear()
         LocalStorageProvider.delete_all_files()
 
     # The s3 key is the name assigned to an object. It excludes the bucket name, but includes the internal path and the file name.
@@ -235,6 +526,11 @@ class GCSStorageProvider(StorageProvider):
             self.gcs_client = storage.Client()
         self.bucket = self.gcs_client.bucket(GCS_BUCKET_NAME)
 
+        self.cache = LocalFileCache(
+            max_size=STORAGE_LOCAL_CACHE_MAX_SIZE,
+            revalidate_interval=STORAGE_LOCAL_CACHE_REVALIDATE_INTERVAL,
+        )
+
     def upload_file(
         self, file: BinaryIO, filename: str, tags: Dict[str, str]
     ) -> Tuple[bytes, str]:
@@ -243,22 +539,58 @@ class GCSStorageProvider(StorageProvider):
         try:
             blob = self.bucket.blob(filename)
             blob.upload_from_filename(file_path)
+            self.cache.add("gs://" + self.bucket_name + "/" + filename, file_path)
             return contents, "gs://" + self.bucket_name + "/" + filename
         except GoogleCloudError as e:
             raise RuntimeError(f"Error uploading file to GCS: {e}")
 
     def get_file(self, file_path: str) -> str:
-        """Handles downloading of the file from GCS storage."""
+        """Handles downloading of the file from GCS storage, unless a local copy is up to date."""
         try:
             filename = file_path.removeprefix("gs://").split("/")[1]
             local_file_path = f"{UPLOAD_DIR}/{filename}"
-            blob = self.bucket.get_blob(filename)
-            blob.download_to_filename(local_file_path)
-
-            return local_file_path
+            blob = None
+
+            def get_version():
+                nonlocal blob
+                blob = self.bucket.get_blob(filename)
+                if blob is None:
+                    raise NotFound(f"Blob {filename} not found")
+                return blob.generation, blob.size
+
+            return self.cache.get_file(
+                file_path,
+                local_file_path,
+                get_version,
+                lambda path: blob.download_to_filename(path),
+            )
         except NotFound as e:
             raise RuntimeError(f"Error downloading file from GCS: {e}")
 
+    def get_local_file(self, file_path: str) -> Optional[str]:
+        return self.cache.get_cached_file(file_path)
+
+    def iter_file_range(
+        self, file_path: str, start: int, end: int, chunk_size: int = 1024 * 1024
+    ) -> Iterator[bytes]:
+        """Streams a byte range of the file from GCS storage."""
+        blob = self.bucket.blob(file_path.removeprefix("gs://").split("/")[1])
+        while start <= end:
+            chunk_end = min(start + chunk_size, end + 1) - 1
+            yield blob.download_as_bytes(start=start, end=chunk_end)
+            start = chunk_end + 1
+
+    def get_presigned_url(
+        self, file_path: str, content_type: Optional[str], content_disposition: str
+    ) -> Optional[str]:
+        blob = self.bucket.blob(file_path.removeprefix("gs://").split("/")[1])
+        return blob.generate_signed_url(
+            version="v4",
+            expiration=timedelta(seconds=STORAGE_PRESIGNED_URL_EXPIRY),
+            response_disposition=content_disposition,
+            response_type=content_type,
+        )
+
     def delete_file(self, file_path: str) -> None:
         """Handles deletion of the file from GCS storage."""
         try:
@@ -269,6 +601,7 @@ class GCSStorageProvider(StorageProvider):
             raise RuntimeError(f"Error deleting file from GCS: {e}")
 
         # Always delete from local storage
+        self.cache.remove(file_path)
         LocalStorageProvider.delete_file(file_path)
 
     def delete_all_files(self) -> None:
@@ -283,6 +616,7 @@ class GCSStorageProvider(StorageProvider):
             raise RuntimeError(f"Error deleting all files from GCS: {e}")
 
         # Always delete from local storage
+        self.cache.clear()
         LocalStorageProvider.delete_all_files()
 
 
@@ -291,6 +625,7 @@ class AzureStorageProvider(StorageProvider):
         self.endpoint = AZURE_STORAGE_ENDPOINT
         self.container_name = AZURE_STORAGE_CONTAINER_NAME
         storage_key = AZURE_STORAGE_KEY
+        self.storage_key = storage_key
 
         if storage_key:
             # Configure using the Azure Storage Account Endpoint and Key
@@ -307,6 +642,11 @@ class AzureStorageProvider(StorageProvider):
             self.container_name
         )
 
+        self.cache = LocalFileCache(
+            max_size=STORAGE_LOCAL_CACHE_MAX_SIZE,
+            revalidate_interval=STORAGE_LOCAL_CACHE_REVALIDATE_INTERVAL,
+        )
+
     def upload_file(
         self, file: BinaryIO, filename: str, tags: Dict[str, str]
     ) -> Tuple[bytes, str]:
@@ -315,22 +655,67 @@ class AzureStorageProvider(StorageProvider):
         try:
             blob_client = self.container_client.get_blob_client(filename)
             blob_client.upload_blob(contents, overwrite=True)
+            self.cache.add(
+                f"{self.endpoint}/{self.container_name}/{filename}", file_path
+            )
             return contents, f"{self.endpoint}/{self.container_name}/{filename}"
         except Exception as e:
             raise RuntimeError(f"Error uploading file to Azure Blob Storage: {e}")
 
     def get_file(self, file_path: str) -> str:
-        """Handles downloading of the file from Azure Blob Storage."""
+        """Handles downloading of the file from Azure Blob Storage, unless a local copy is up to date."""
         try:
             filename = file_path.split("/")[-1]
             local_file_path = f"{UPLOAD_DIR}/{filename}"
             blob_client = self.container_client.get_blob_client(filename)
-            with open(local_file_path, "wb") as download_file:
-                download_file.write(blob_client.download_blob().readall())
-            return local_file_path
+
+            def get_version():
+                properties = blob_client.get_blob_properties()
+                return properties.etag, properties.size
+
+            def download(path: str):
+                with open(path, "wb") as download_file:
+                    download_file.write(blob_client.download_blob().readall())
+
+            return self.cache.get_file(
+                file_path, local_file_path, get_version, download
+            )
         except ResourceNotFoundError as e:
             raise RuntimeError(f"Error downloading file from Azure Blob Storage: {e}")
 
+    def get_local_file(self, file_path: str) -> Optional[str]:
+        return self.cache.get_cached_file(file_path)
+
+    def iter_file_range(
+        self, file_path: str, start: int, end: int, chunk_size: int = 1024 * 1024
+    ) -> Iterator[bytes]:
+        """Streams a byte range of the file from Azure Blob Storage."""
+        blob_client = self.container_client.get_blob_client(file_path.split("/")[-1])
+        yield from blob_client.download_blob(
+            offset=start, length=end - start + 1
+        ).chunks()
+
+    def get_presigned_url(
+        self, file_path: str, content_type: Optional[str], content_disposition: str
+    ) -> Optional[str]:
+        # SAS tokens are signed with the account key, not available with managed identities
+        if not self.storage_key:
+            return None
+
+        blob_client = self.container_client.get_blob_client(file_path.split("/")[-1])
+        sas_token = generate_blob_sas(
+            account_name=blob_client.account_name,
+            container_name=self.container_name,
+            blob_name=blob_client.blob_name,
+            account_key=self.storage_key,
+            permission=BlobSasPermissions(read=True),
+            expiry=datetime.now(timezone.utc)
+            + timedelta(seconds=STORAGE_PRESIGNED_URL_EXPIRY),
+            content_disposition=content_disposition,
+            content_type=content_type,
+        )
+        return f"{blob_client.url}?{sas_token}"
+
     def delete_file(self, file_path: str) -> None:
         """Handles deletion of the file from Azure Blob Storage."""
         try:
@@ -341,6 +726,7 @@ class AzureStorageProvider(StorageProvider):
             raise RuntimeError(f"Error deleting file from Azure Blob Storage: {e}")
 
         # Always delete from local storage
+        self.cache.remove(file_path)
         LocalStorageProvider.delete_file(file_path)
 
     def delete_all_files(self) -> None:
@@ -353,6 +739,7 @@ class AzureStorageProvider(StorageProvider):
             raise RuntimeError(f"Error deleting all files from Azure Blob Storage: {e}")
 
         # Always delete from local storage
+        self.cache.clear()
         LocalStorageProvider.delete_all_files()
 
 
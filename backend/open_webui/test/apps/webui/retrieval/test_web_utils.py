@@ -0,0 +1,47 @@
+import asyncio
+from typing import Optional
+
+import pytest
+
+from open_webui.retrieval.web.utils import SafeWebBaseLoader
+
+
+async def serve(body: bytes, content_type: Optional[str]):
+    """Raw HTTP server, so the response has exactly the headers given."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        await reader.readuntil(b"\r\n\r\n")
+        headers = [b"HTTP/1.1 200 OK", f"Content-Length: {len(body)}".encode()]
+        if content_type is not None:
+            headers.append(f"Content-Type: {content_type}".encode())
+        writer.write(b"\r\n".join(headers) + b"\r\n\r\n" + body)
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}/"
+
+
+def fetch(body: bytes, content_type: Optional[str]) -> str:
+    async def main():
+        server, url = await serve(body, content_type)
+        async with server:
+            loader = SafeWebBaseLoader(web_path=[url])
+            _, text, _ = await loader._fetch_response(url)
+            return text
+
+    return asyncio.run(main())
+
+
+def test_fetch_without_content_type():
+    assert fetch(b"<p>hello</p>", None) == "<p>hello</p>"
+
+
+def test_fetch_text_content_type():
+    assert fetch(b"<p>hello</p>", "text/html; charset=utf-8") == "<p>hello</p>"
+
+
+def test_fetch_binary_content_type():
+    with pytest.raises(ValueError, match="application/pdf"):
+        fetch(b"%PDF-1.4", "application/pdf")
@@ -1,5 +1,7 @@
 import io
 import os
+import threading
+import time
 import boto3
 import pytest
 from botocore.exceptions import ClientError
@@ -433,3 +435,153 @@ class TestAzureStorageProvider:
         )
         with pytest.raises(Exception, match="Blob not found"):
             self.Storage.get_file(file_url)
+
+
+class TestLocalFileCache:
+    file_content = b"test content"
+    key = "s3://my-bucket/test.txt"
+
+    def setup_cache(self, **kwargs):
+        cache = provider.LocalFileCache(**kwargs)
+        downloads = []
+
+        def download(path):
+            downloads.append(path)
+            with open(path, "wb") as f:
+                f.write(self.file_content)
+
+        return cache, downloads, download
+
+    def test_read_through(self, tmp_path):
+        cache, downloads, download = self.setup_cache()
+        local_file_path = str(tmp_path / "test.txt")
+        get_version = MagicMock(return_value=("v1", len(self.file_content)))
+
+        for _ in range(3):
+            path = cache.get_file(self.key, local_file_path, get_version, download)
+            assert path == local_file_path
+            assert (tmp_path / "test.txt").read_bytes() == self.file_content
+        assert len(downloads) == 1
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 2 / 3
+        assert stats["size"] == len(self.file_content)
+
+    def test_revalidation(self, tmp_path):
+        cache, downloads, download = self.setup_cache(revalidate_interval=0)
+        local_file_path = str(tmp_path / "test.txt")
+        get_version = MagicMock(return_value=("v1", len(self.file_content)))
+
+        cache.get_file(self.key, local_file_path, get_version, download)
+        cache.get_file(self.key, local_file_path, get_version, download)
+        assert len(downloads) == 1
+        assert cache.get_stats()["revalidations"] == 1
+
+        get_version.return_value = ("v2", len(self.file_content))
+        cache.get_file(self.key, local_file_path, get_version, download)
+        assert len(downloads) == 2
+
+    def test_existing_copy(self, tmp_path):
+        cache, downloads, download = self.setup_cache()
+        (tmp_path / "test.txt").write_bytes(self.file_content)
+        local_file_path = str(tmp_path / "test.txt")
+
+        # Same size as the object, the copy is kept
+        get_version = MagicMock(return_value=("v1", len(self.file_content)))
+        cache.get_file(self.key, local_file_path, get_version, download)
+        assert len(downloads) == 0
+
+        # A different object under the same name is downloaded again
+        cache.remove(self.key)
+        get_version.return_value = ("v2", len(self.file_content) + 1)
+        cache.get_file(self.key, local_file_path, get_version, download)
+        assert len(downloads) == 1
+
+    def test_eviction(self, tmp_path):
+        cache, downloads, download = self.setup_cache(
+            max_size=len(self.file_content) * 2, eviction_delay=0
+        )
+        get_version = MagicMock(return_value=("v1", len(self.file_content)))
+
+        for name in ["a.txt", "b.txt", "a.txt", "c.txt"]:
+            cache.get_file(
+                f"s3://my-bucket/{name}", str(tmp_path / name), get_version, download
+            )
+
+        # b.txt was the least recently used
+        assert (tmp_path / "a.txt").exists()
+        assert not (tmp_path / "b.txt").exists()
+        assert (tmp_path / "c.txt").exists()
+        assert cache.get_stats()["evictions"] == 1
+        assert cache.get_stats()["size"] == len(self.file_content) * 2
+
+    def test_eviction_delay(self, tmp_path):
+        cache, downloads, download = self.setup_cache(
+            max_size=len(self.file_content), eviction_delay=0.2
+        )
+        get_version = MagicMock(return_value=("v1", len(self.file_content)))
+
+        # A path just handed out is still readable after its copy was evicted
+        path = cache.get_file(
+            "s3://my-bucket/a.txt", str(tmp_path / "a.txt"), get_version, download
+        )
+        cache.get_file(
+            "s3://my-bucket/b.txt", str(tmp_path / "b.txt"), get_version, download
+        )
+        with open(path, "rb") as f:
+            assert f.read() == self.file_content
+
+        time.sleep(0.2)
+        cache.get_file(
+            "s3://my-bucket/c.txt", str(tmp_path / "c.txt"), get_version, download
+        )
+        assert not (tmp_path / "a.txt").exists()
+        assert cache.get_stats()["evictions"] == 2
+
+    def test_concurrent_downloads(self, tmp_path):
+        cache, downloads, download = self.setup_cache()
+        local_file_path = str(tmp_path / "test.txt")
+        get_version = MagicMock(return_value=("v1", len(self.file_content)))
+
+        def slow_download(path):
+            time.sleep(0.1)
+            download(path)
+
+        threads = [
+            threading.Thread(
+                target=cache.get_file,
+                args=(self.key, local_file_path, get_version, slow_download),
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(downloads) == 1
+
+
+def test_s3_get_file_uses_local_copy(monkeypatch, tmp_path):
+    upload_dir = mock_upload_dir(monkeypatch, tmp_path)
+    with mock_aws():
+        Storage = provider.S3StorageProvider()
+        Storage.bucket_name = "my-bucket"
+        boto3.resource("s3", region_name="us-east-1").create_bucket(
+            Bucket=Storage.bucket_name
+        )
+        _, s3_file_path = Storage.upload_file(
+            io.BytesIO(b"test content"), "test.txt", {}
+        )
+        Storage.s3_client = MagicMock(wraps=Storage.s3_client)
+
+        # The copy written by the upload is served without downloading it
+        assert Storage.get_file(s3_file_path) == str(upload_dir / "test.txt")
+        Storage.s3_client.download_file.assert_not_called()
+
+        # A missing copy is downloaded again
+        (upload_dir / "test.txt").unlink()
+        assert Storage.get_file(s3_file_path) == str(upload_dir / "test.txt")
+        assert (upload_dir / "test.txt").read_bytes() == b"test content"
+        Storage.s3_client.download_file.assert_called_once()
@@ -0,0 +1,88 @@
+import asyncio
+import contextlib
+from unittest import mock
+
+from open_webui.utils import code_interpreter
+from open_webui.utils.code_interpreter import JupyterKernel, JupyterKernelPool
+
+
+class FakeKernelPool(JupyterKernelPool):
+    """Pool whose kernels live in memory, starting one takes `start_delay`."""
+
+    def __init__(self, start_delay: float = 0, **kwargs):
+        super().__init__("http://jupyter", **kwargs)
+        self.start_delay = start_delay
+        self.started = 0
+        self.deleted = []
+
+    async def _get_session(self):
+        return None
+
+    async def _start_kernel(self) -> JupyterKernel:
+        await asyncio.sleep(self.start_delay)
+        self.started += 1
+        return JupyterKernel(f"kernel-{self.started}")
+
+    async def _delete_kernel(self, kernel: JupyterKernel):
+        self.deleted.append(kernel.id)
+
+    async def _is_healthy(self, kernel: JupyterKernel) -> bool:
+        return True
+
+
+@contextlib.asynccontextmanager
+async def hanging_connect(*args, **kwargs):
+    await asyncio.sleep(3600)
+    yield
+
+
+def patch_websocket():
+    return mock.patch.multiple(
+        code_interpreter,
+        get_ws_connection=mock.Mock(return_value=("ws://jupyter", {})),
+        websockets=mock.Mock(connect=hanging_connect),
+    )
+
+
+async def cancel_after(coro, delay: float):
+    task = asyncio.create_task(coro)
+    await asyncio.sleep(delay)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    # Let the background discard run
+    await asyncio.sleep(0.05)
+
+
+def test_cancelled_execute_releases_kernel():
+    async def main():
+        pool = FakeKernelPool(size=0, max_kernels=1)
+        with patch_websocket():
+            await cancel_after(pool.execute("while True: pass"), 0.1)
+        return pool
+
+    pool = asyncio.run(main())
+    assert pool._count == 0
+    assert pool.deleted == ["kernel-1"]
+
+
+def test_cancelled_kernel_start_releases_slot():
+    async def main():
+        pool = FakeKernelPool(start_delay=1, size=0, max_kernels=1)
+        await cancel_after(pool.execute("1"), 0.1)
+        return pool
+
+    pool = asyncio.run(main())
+    assert pool._count == 0
+    assert pool.started == 0
+
+
+def test_kernel_is_discarded_once():
+    async def main():
+        pool = FakeKernelPool(size=0, max_kernels=2)
+        kernel = await pool._acquire(chat_id="chat")
+        await asyncio.gather(pool._discard(kernel), pool._discard(kernel))
+        return pool
+
+    pool = asyncio.run(main())
+    assert pool._count == 0
+    assert pool.deleted == ["kernel-1"]
@@ -0,0 +1,77 @@
+import asyncio
+import time
+
+from open_webui.utils.tools import (
+    execute_tool_call,
+    gather_tool_calls,
+    get_async_tool_function_and_apply_extra_params,
+)
+
+
+def get_tool(function, timeout=None):
+    return {
+        "callable": get_async_tool_function_and_apply_extra_params(function, {}),
+        "metadata": {"timeout": timeout},
+    }
+
+
+def test_sync_tool_does_not_block_event_loop():
+    def slow(seconds: float) -> str:
+        time.sleep(seconds)
+        return "slow"
+
+    async def main():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        result = await execute_tool_call(get_tool(slow), "slow", {"seconds": 0.3})
+        ticker.cancel()
+        return result, ticks
+
+    result, ticks = asyncio.run(main())
+    assert result == "slow"
+    assert ticks >= 10
+
+
+def test_sync_tool_timeout():
+    def blocking() -> str:
+        time.sleep(1)
+        return "done"
+
+    async def main():
+        start = time.monotonic()
+        result = await execute_tool_call(
+            get_tool(blocking, timeout=0.2), "blocking", {}
+        )
+        return result, time.monotonic() - start
+
+    result, elapsed = asyncio.run(main())
+    assert "timed out" in result
+    assert elapsed < 0.8
+
+
+def test_sync_tools_run_concurrently():
+    def slow(name: str) -> str:
+        time.sleep(0.3)
+        return name
+
+    tool = get_tool(slow)
+
+    async def main():
+        start = time.monotonic()
+        results = await gather_tool_calls(
+            ["a", "b", "c"],
+            lambda name: execute_tool_call(tool, "slow", {"name": name}),
+            limit=3,
+        )
+        return results, time.monotonic() - start
+
+    results, elapsed = asyncio.run(main())
+    assert results == ["a", "b", "c"]
+    assert elapsed < 0.8
@@ -53,14 +53,13 @@ def get_permissions(
                     )  # Use the most permissive value (True > False)
         return permissions
 
-    user_groups = Groups.get_groups_by_member_id(user_id)
+    user_group_permissions = Groups.get_group_permissions_by_member_id(user_id)
 
     # Deep copy default permissions to avoid modifying the original dict
     permissions = json.loads(json.dumps(default_permissions))
 
     # Combine permissions from all user groups
-    for group in user_groups:
-        group_permissions = group.permissions
+    for group_permissions in user_group_permissions:
         permissions = combine_permissions(permissions, group_permissions)
 
     # Ensure all fields from default_permissions are present and filled in
@@ -93,10 +92,9 @@ def has_permission(
     permission_hierarchy = permission_key.split(".")
 
     # Retrieve user group permissions
-    user_groups = Groups.get_groups_by_member_id(user_id)
+    user_group_permissions = Groups.get_group_permissions_by_member_id(user_id)
 
-    for group in user_groups:
-        group_permissions = group.permissions
+    for group_permissions in user_group_permissions:
         if get_permission(group_permissions, permission_hierarchy):
             return True
 
@@ -115,15 +113,17 @@ def has_access(
     if access_control is None:
         return type == "read"
 
-    user_groups = Groups.get_groups_by_member_id(user_id)
-    user_group_ids = [group.id for group in user_groups]
     permission_access = access_control.get(type, {})
     permitted_group_ids = permission_access.get("group_ids", [])
     permitted_user_ids = permission_access.get("user_ids", [])
 
-    return user_id in permitted_user_ids or any(
-        group_id in permitted_group_ids for group_id in user_group_ids
-    )
+    if user_id in permitted_user_ids:
+        return True
+    if not permitted_group_ids:
+        return False
+
+    user_group_ids = Groups.get_group_ids_by_member_id(user_id)
+    return any(group_id in permitted_group_ids for group_id in user_group_ids)
 
 
 # Get all users with access to a resource
@@ -138,10 +138,6 @@ def get_users_with_access(
     permitted_user_ids = permission_access.get("user_ids", [])
 
     user_ids_with_access = set(permitted_user_ids)
-
-    for group_id in permitted_group_ids:
-        group_user_ids = Groups.get_group_user_ids_by_id(group_id)
-        if group_user_ids:
-            user_ids_with_access.update(group_user_ids)
+    user_ids_with_access.update(Groups.get_user_ids_by_group_ids(permitted_group_ids))
 
     return Users.get_users_by_user_ids(list(user_ids_with_access))
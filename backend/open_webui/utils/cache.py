@@ -0,0 +1,191 @@
+import os
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from open_webui.config import CACHE_DIR
+
+
+class Cache(ABC):
+    """
+    Bytes values by string key, the storage behind the application caches.
+
+    Entries are dropped `ttl` seconds after they were last set (0 keeps them
+    until evicted). Callers serialise their values and handle errors.
+    """
+
+    def __init__(self, ttl: int = 0):
+        self.ttl = ttl
+
+    def _get_expires_at(self) -> float:
+        return time.time() + self.ttl if self.ttl > 0 else 0.0
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the value, or None if it is missing or expired."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes) -> None:
+        """Store the value and restart its expiry."""
+        pass
+
+
+class MemoryCache(Cache):
+    """Per-process LRU cache, bounded by the total size and number of values."""
+
+    def __init__(self, ttl: int = 0, max_size: int = 0, max_entries: int = 0):
+        super().__init__(ttl)
+        self.max_size = max_size
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple[float, bytes]]" = OrderedDict()
+        self._size = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] and entry[0] <= time.time():
+                self._pop(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (self._get_expires_at(), value)
+            self._size += len(value)
+
+            while self._entries and (
+                (self.max_size > 0 and self._size > self.max_size)
+                or (self.max_entries > 0 and len(self._entries) > self.max_entries)
+            ):
+                self._pop(next(iter(self._entries)))
+
+    def _pop(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+
+class DiskCache(Cache):
+    """
+    Cache of files under `path`, bounded by their total size.
+
+    Each file starts with the entry's expiry time. Hits refresh a file's
+    modification time, so the least recently used files are removed first
+    once the limit is reached.
+    """
+
+    HEADER = struct.Struct("!d")
+
+    def __init__(self, path: Path, ttl: int = 0, max_size: int = 0):
+        super().__init__(ttl)
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{key}.cache"
+
+    def get(self, key: str) -> Optional[bytes]:
+        file = self._file(key)
+        try:
+            with open(file, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        (expires_at,) = self.HEADER.unpack_from(data)
+        if expires_at and expires_at <= time.time():
+            return None
+        try:
+            os.utime(file)
+        except FileNotFoundError:
+            pass
+        return data[self.HEADER.size :]
+
+    def set(self, key: str, value: bytes) -> None:
+        file = self._file(key)
+        tmp_file = file.with_suffix(f".{threading.get_ident()}.tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(self.HEADER.pack(self._get_expires_at()))
+            f.write(value)
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(f.stat().st_size for f in self.path.glob("*.cache"))
+            if file.exists():
+                self._size -= file.stat().st_size
+            os.replace(tmp_file, file)
+            self._size += self.HEADER.size + len(value)
+
+            if self.max_size > 0 and self._size > self.max_size:
+                self._prune()
+
+    def _prune(self):
+        files = sorted(self.path.glob("*.cache"), key=lambda f: f.stat().st_mtime)
+        for file in files:
+            if self._size <= self.max_size * 0.9:
+                break
+            try:
+                size = file.stat().st_size
+                file.unlink()
+                self._size -= size
+            except FileNotFoundError:
+                continue
+
+
+class RedisCache(Cache):
+    """Cache shared between workers, expiry is delegated to Redis key TTLs."""
+
+    def __init__(self, redis, prefix: str, ttl: int = 0):
+        super().__init__(ttl)
+        self.redis = redis
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.redis.get(f"{self.prefix}{key}")
+
+    def set(self, key: str, value: bytes) -> None:
+        self.redis.set(f"{self.prefix}{key}", value, ex=self.ttl or None)
+
+
+def get_cache(
+    store: str, name: str, ttl: int = 0, max_size: int = 0, max_entries: int = 0
+) -> Optional[Cache]:
+    """
+    Cache for `store`, "memory", "disk" (under CACHE_DIR/`name`) or "redis"
+    (keys prefixed with `name`). None if `store` is empty.
+
+    `max_size` bounds the memory and disk caches, `max_entries` the memory one.
+    """
+    match store:
+        case "memory":
+            return MemoryCache(ttl=ttl, max_size=max_size, max_entries=max_entries)
+        case "disk":
+            return DiskCache(CACHE_DIR / name, ttl=ttl, max_size=max_size)
+        case "redis":
+            from open_webui.utils.redis import get_redis_client
+
+            return RedisCache(
+                get_redis_client(decode_responses=False),
+                prefix=f"open-webui:{name}:",
+                ttl=ttl,
+            )
+        case "":
+            return None
+        case _:
+            raise ValueError(f"Unsupported {name} cache: {store}")
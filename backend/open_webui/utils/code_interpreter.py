@@ -1,14 +1,22 @@
 import asyncio
 import json
 import logging
+import time
 import uuid
+from collections import OrderedDict
 from typing import Optional
 
 import aiohttp
 import websockets
 from pydantic import BaseModel
 
-from open_webui.env import SRC_LOG_LEVELS
+from open_webui.env import (
+    SRC_LOG_LEVELS,
+    CODE_INTERPRETER_JUPYTER_POOL_SIZE,
+    CODE_INTERPRETER_JUPYTER_MAX_KERNELS,
+    CODE_INTERPRETER_JUPYTER_KERNEL_PER_CHAT,
+    CODE_INTERPRETER_JUPYTER_KERNEL_IDLE_TIMEOUT,
+)
 
 logger = logging.getLogger(__name__)
 logger.setLevel(SRC_LOG_LEVELS["MAIN"])
@@ -24,6 +32,126 @@ class ResultModel(BaseModel):
     result: Optional[str] = ""
 
 
+async def sign_in(session: aiohttp.ClientSession, token: str, password: str) -> dict:
+    """Authenticate `session` with the Jupyter server, returning the query params to send."""
+    # password authentication
+    if password and not token:
+        async with session.get("login") as response:
+            response.raise_for_status()
+            xsrf_token = response.cookies["_xsrf"].value
+            if not xsrf_token:
+                raise ValueError("_xsrf token not found")
+            session.cookie_jar.update_cookies(response.cookies)
+            session.headers.update({"X-XSRFToken": xsrf_token})
+        async with session.post(
+            "login",
+            data={"_xsrf": xsrf_token, "password": password},
+            allow_redirects=False,
+        ) as response:
+            response.raise_for_status()
+            session.cookie_jar.update_cookies(response.cookies)
+
+    # token authentication
+    if token:
+        return {"token": token}
+    return {}
+
+
+def get_ws_connection(
+    base_url: str,
+    kernel_id: str,
+    session: aiohttp.ClientSession,
+    params: dict,
+    use_cookies: bool = False,
+) -> (str, dict):
+    ws_base = base_url.replace("http", "ws", 1)
+    ws_params = "?" + "&".join([f"{key}={val}" for key, val in params.items()])
+    websocket_url = f"{ws_base}api/kernels/{kernel_id}/channels{ws_params if len(ws_params) > 1 else ''}"
+    ws_headers = {}
+    if use_cookies:
+        ws_headers = {
+            "Cookie": "; ".join(
+                [f"{cookie.key}={cookie.value}" for cookie in session.cookie_jar]
+            ),
+            **session.headers,
+        }
+    return websocket_url, ws_headers
+
+
+async def execute_in_kernel(ws, code: str, timeout: int) -> tuple[ResultModel, bool]:
+    """Run code over a kernel channels websocket, returning the result and whether it timed out."""
+    # send message
+    msg_id = uuid.uuid4().hex
+    await ws.send(
+        json.dumps(
+            {
+                "header": {
+                    "msg_id": msg_id,
+                    "msg_type": "execute_request",
+                    "username": "user",
+                    "session": uuid.uuid4().hex,
+                    "date": "",
+                    "version": "5.3",
+                },
+                "parent_header": {},
+                "metadata": {},
+                "content": {
+                    "code": code,
+                    "silent": False,
+                    "store_history": True,
+                    "user_expressions": {},
+                    "allow_stdin": False,
+                    "stop_on_error": True,
+                },
+                "channel": "shell",
+            }
+        )
+    )
+    # parse message
+    stdout, stderr, result = "", "", []
+    timed_out = False
+    while True:
+        try:
+            # wait for message
+            message = await asyncio.wait_for(ws.recv(), timeout)
+            message_data = json.loads(message)
+            # msg id not match, skip
+            if message_data.get("parent_header", {}).get("msg_id") != msg_id:
+                continue
+            # check message type
+            msg_type = message_data.get("msg_type")
+            match msg_type:
+                case "stream":
+                    if message_data["content"]["name"] == "stdout":
+                        stdout += message_data["content"]["text"]
+                    elif message_data["content"]["name"] == "stderr":
+                        stderr += message_data["content"]["text"]
+                case "execute_result" | "display_data":
+                    data = message_data["content"]["data"]
+                    if "image/png" in data:
+                        result.append(f"data:image/png;base64,{data['image/png']}")
+                    elif "text/plain" in data:
+                        result.append(data["text/plain"])
+                case "error":
+                    stderr += "\n".join(message_data["content"]["traceback"])
+                case "status":
+                    if message_data["content"]["execution_state"] == "idle":
+                        break
+
+        except asyncio.TimeoutError:
+            stderr += "\nExecution timed out."
+            timed_out = True
+            break
+    return (
+        ResultModel(
+            stdout=stdout.strip(),
+            stderr=stderr.strip(),
+            result="\n".join(result).strip() if result else "",
+        ),
+        timed_out,
+    )
+
+
 class JupyterCodeExecuter:
     """
     Execute code in jupyter notebook
@@ -81,26 +209,7 @@ class JupyterCodeExecuter:
         return self.result
 
     async def sign_in(self) -> None:
-        # password authentication
-        if self.password and not self.token:
-            async with self.session.get("login") as response:
-                response.raise_for_status()
-                xsrf_token = response.cookies["_xsrf"].value
-                if not xsrf_token:
-                    raise ValueError("_xsrf token not found")
-                self.session.cookie_jar.update_cookies(response.cookies)
-                self.session.headers.update({"X-XSRFToken": xsrf_token})
-            async with self.session.post(
-                "login",
-                data={"_xsrf": xsrf_token, "password": self.password},
-                allow_redirects=False,
-            ) as response:
-                response.raise_for_status()
-                self.session.cookie_jar.update_cookies(response.cookies)
-
-        # token authentication
-        if self.token:
-            self.params.update({"token": self.token})
+        self.params.update(await sign_in(self.session, self.token, self.password))
 
     async def init_kernel(self) -> None:
         async with self.session.post(url="api/kernels", params=self.params) as response:
@@ -109,21 +218,13 @@ class JupyterCodeExecuter:
             self.kernel_id = kernel_data["id"]
 
     def init_ws(self) -> (str, dict):
-        ws_base = self.base_url.replace("http", "ws", 1)
-        ws_params = "?" + "&".join([f"{key}={val}" for key, val in self.params.items()])
-        websocket_url = f"{ws_base}api/kernels/{self.kernel_id}/channels{ws_params if len(ws_params) > 1 else ''}"
-        ws_headers = {}
-        if self.password and not self.token:
-            ws_headers = {
-                "Cookie": "; ".join(
-                    [
-                        f"{cookie.key}={cookie.value}"
-                        for cookie in self.session.cookie_jar
-                    ]
-                ),
-                **self.session.headers,
-            }
-        return websocket_url, ws_headers
+        return get_ws_connection(
+            self.base_url,
+            self.kernel_id,
+            self.session,
+            self.params,
+            use_cookies=bool(self.password and not self.token),
+        )
 
     async def execute_code(self) -> None:
         # initialize ws
@@ -135,74 +236,361 @@ class JupyterCodeExecuter:
             await self.execute_in_jupyter(ws)
 
     async def execute_in_jupyter(self, ws) -> None:
-        # send message
-        msg_id = uuid.uuid4().hex
-        await ws.send(
-            json.dumps(
-                {
-                    "header": {
-                        "msg_id": msg_id,
-                        "msg_type": "execute_request",
-                        "username": "user",
-                        "session": uuid.uuid4().hex,
-                        "date": "",
-                        "version": "5.3",
-                    },
-                    "parent_header": {},
-                    "metadata": {},
-                    "content": {
-                        "code": self.code,
-                        "silent": False,
-                        "store_history": True,
-                        "user_expressions": {},
-                        "allow_stdin": False,
-                        "stop_on_error": True,
-                    },
-                    "channel": "shell",
-                }
-            )
-        )
-        # parse message
-        stdout, stderr, result = "", "", []
+        self.result, _ = await execute_in_kernel(ws, self.code, self.timeout)
+
+
+class JupyterKernel:
+    def __init__(self, kernel_id: str):
+        self.id = kernel_id
+        self.chat_id: Optional[str] = None
+        self.last_used = time.monotonic()
+        # One execution at a time per kernel
+        self.lock = asyncio.Lock()
+        # Set once the kernel was given up, so its slot is released only once
+        self.discarded = False
+
+
+class JupyterKernelPool:
+    """
+    Kernels of one Jupyter server, shared by all executions.
+
+    A few fresh kernels are kept started so executions do not wait for a
+    kernel to boot. Without a chat id a kernel runs a single execution and
+    is then shut down, so no state leaks between users. With a chat id the
+    kernel sticks to that chat and keeps its variables across turns until
+    it has been idle for `idle_timeout` seconds. At most `max_kernels`
+    kernels are alive at once; idle chat kernels are evicted first when
+    the limit is reached. The authenticated HTTP session is reused for
+    every request.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        token: str = "",
+        password: str = "",
+        size: int = 2,
+        max_kernels: int = 20,
+        idle_timeout: int = 600,
+    ):
+        self.base_url = base_url if base_url.endswith("/") else f"{base_url}/"
+        self.token = token
+        self.password = password
+        self.size = size
+        self.max_kernels = max_kernels
+        self.idle_timeout = idle_timeout
+
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.params: dict = {}
+        self._signed_in = False
+        self._sign_in_lock = asyncio.Lock()
+
+        self._warm: list[JupyterKernel] = []
+        self._chats: "OrderedDict[str, JupyterKernel]" = OrderedDict()
+        # Kernels alive or starting, counted against max_kernels
+        self._count = 0
+        self._starting = 0
+        self._condition = asyncio.Condition()
+        self._reaper: Optional[asyncio.Task] = None
+        # Background tasks, referenced until done so they are not collected
+        self._tasks: set[asyncio.Task] = set()
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(trust_env=True, base_url=self.base_url)
+            self._signed_in = False
+
+        if not self._signed_in:
+            async with self._sign_in_lock:
+                if not self._signed_in:
+                    self.params = await sign_in(self.session, self.token, self.password)
+                    self._signed_in = True
+        return self.session
+
+    async def _start_kernel(self) -> JupyterKernel:
+        for attempt in range(2):
+            session = await self._get_session()
+            async with session.post(url="api/kernels", params=self.params) as response:
+                if response.status in (401, 403) and attempt == 0:
+                    # Session expired, sign in again
+                    self._signed_in = False
+                    continue
+                response.raise_for_status()
+                kernel_data = await response.json()
+                return JupyterKernel(kernel_data["id"])
+
+    async def _delete_kernel(self, kernel: JupyterKernel):
+        try:
+            session = await self._get_session()
+            async with session.delete(
+                f"api/kernels/{kernel.id}", params=self.params
+            ) as response:
+                response.raise_for_status()
+        except Exception as err:
+            logger.exception("close kernel failed, %s", err)
+
+    async def _is_healthy(self, kernel: JupyterKernel) -> bool:
+        try:
+            session = await self._get_session()
+            async with session.get(
+                f"api/kernels/{kernel.id}", params=self.params
+            ) as response:
+                if response.status != 200:
+                    return False
+                kernel_data = await response.json()
+                return kernel_data.get("execution_state") != "dead"
+        except Exception as err:
+            logger.warning(f"kernel {kernel.id} health check failed: {err}")
+            return False
+
+    async def _interrupt_kernel(self, kernel: JupyterKernel):
+        try:
+            session = await self._get_session()
+            async with session.post(
+                f"api/kernels/{kernel.id}/interrupt", params=self.params
+            ) as response:
+                response.raise_for_status()
+        except Exception as err:
+            logger.warning(f"kernel {kernel.id} interrupt failed: {err}")
+
+    async def _release_slot(self):
+        async with self._condition:
+            self._count -= 1
+            self._condition.notify()
+
+    async def _discard(self, kernel: JupyterKernel):
+        # The reaper and an execution may both give up the same kernel
+        if kernel.discarded:
+            return
+        kernel.discarded = True
+        if kernel.chat_id and self._chats.get(kernel.chat_id) is kernel:
+            del self._chats[kernel.chat_id]
+        await self._delete_kernel(kernel)
+        await self._release_slot()
+        self._replenish()
+
+    def _replenish(self):
+        while (
+            len(self._warm) + self._starting < self.size
+            and self._count < self.max_kernels
+        ):
+            self._count += 1
+            self._starting += 1
+            self._spawn(self._add_warm_kernel())
+
+    async def _add_warm_kernel(self):
+        try:
+            kernel = await self._start_kernel()
+        except Exception as err:
+            logger.warning(f"starting a warm kernel failed: {err}")
+            self._starting -= 1
+            await self._release_slot()
+            return
+
+        async with self._condition:
+            self._starting -= 1
+            self._warm.append(kernel)
+            self._condition.notify()
+
+    async def _acquire(self, chat_id: Optional[str]) -> JupyterKernel:
         while True:
-            try:
-                # wait for message
-                message = await asyncio.wait_for(ws.recv(), self.timeout)
-                message_data = json.loads(message)
-                # msg id not match, skip
-                if message_data.get("parent_header", {}).get("msg_id") != msg_id:
+            kernel = None
+            async with self._condition:
+                while True:
+                    if chat_id and chat_id in self._chats:
+                        kernel = self._chats[chat_id]
+                        self._chats.move_to_end(chat_id)
+                        break
+                    if self._warm:
+                        kernel = self._warm.pop(0)
+                        break
+                    if self._count < self.max_kernels:
+                        self._count += 1
+                        break
+
+                    # Kernels being started will show up in the warm pool
+                    if self._starting:
+                        await self._condition.wait()
+                        continue
+
+                    # Make room by evicting the least recently used idle chat kernel
+                    victim = next(
+                        (k for k in self._chats.values() if not k.lock.locked()), None
+                    )
+                    if victim is not None:
+                        del self._chats[victim.chat_id]
+                        # The new kernel takes over the evicted kernel's slot
+                        victim.discarded = True
+                        self._spawn(self._delete_kernel(victim))
+                        break
+
+                    await self._condition.wait()
+
+            if kernel is None:
+                try:
+                    kernel = await self._start_kernel()
+                except BaseException:
+                    # Also when cancelled, or the slot would be lost for good
+                    await self._release_slot()
+                    raise
+            elif not kernel.lock.locked():
+                try:
+                    healthy = await self._is_healthy(kernel)
+                except BaseException:
+                    if kernel.chat_id is None:
+                        # Taken from the warm pool, put it back for the others
+                        self._warm.append(kernel)
+                    raise
+                if not healthy:
+                    logger.warning(f"kernel {kernel.id} is unhealthy, replacing it")
+                    await self._discard(kernel)
                     continue
-                # check message type
-                msg_type = message_data.get("msg_type")
-                match msg_type:
-                    case "stream":
-                        if message_data["content"]["name"] == "stdout":
-                            stdout += message_data["content"]["text"]
-                        elif message_data["content"]["name"] == "stderr":
-                            stderr += message_data["content"]["text"]
-                    case "execute_result" | "display_data":
-                        data = message_data["content"]["data"]
-                        if "image/png" in data:
-                            result.append(f"data:image/png;base64,{data['image/png']}")
-                        elif "text/plain" in data:
-                            result.append(data["text/plain"])
-                    case "error":
-                        stderr += "\n".join(message_data["content"]["traceback"])
-                    case "status":
-                        if message_data["content"]["execution_state"] == "idle":
-                            break
-
-            except asyncio.TimeoutError:
-                stderr += "\nExecution timed out."
-                break
-        self.result.stdout = stdout.strip()
-        self.result.stderr = stderr.strip()
-        self.result.result = "\n".join(result).strip() if result else ""
+
+            self._replenish()
+
+            if chat_id and kernel.chat_id is None:
+                if chat_id in self._chats:
+                    # Another execution of this chat got a kernel first
+                    self._warm.append(kernel)
+                    continue
+                kernel.chat_id = chat_id
+                self._chats[chat_id] = kernel
+            return kernel
+
+    async def execute(
+        self, code: str, timeout: int = 60, chat_id: Optional[str] = None
+    ) -> ResultModel:
+        self._start_reaper()
+
+        kernel = await self._acquire(chat_id)
+        try:
+            async with kernel.lock:
+                session = await self._get_session()
+                websocket_url, ws_headers = get_ws_connection(
+                    self.base_url,
+                    kernel.id,
+                    session,
+                    self.params,
+                    use_cookies=bool(self.password and not self.token),
+                )
+                async with websockets.connect(
+                    websocket_url, additional_headers=ws_headers
+                ) as ws:
+                    result, timed_out = await execute_in_kernel(ws, code, timeout)
+                kernel.last_used = time.monotonic()
+
+                if timed_out and chat_id:
+                    # Keep the chat's variables, but stop the runaway code
+                    await self._interrupt_kernel(kernel)
+        except BaseException:
+            # Also when cancelled, the kernel may still be running the code.
+            # Shielded so a second cancellation does not leak its slot.
+            await asyncio.shield(self._spawn(self._discard(kernel)))
+            raise
+        finally:
+            # An idle chat kernel can now be evicted by waiting executions
+            async with self._condition:
+                self._condition.notify()
+
+        if not chat_id:
+            self._spawn(self._discard(kernel))
+        return result
+
+    def _start_reaper(self):
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap())
+
+    async def _reap(self):
+        interval = max(min(self.idle_timeout / 2, 60), 1)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                now = time.monotonic()
+                for kernel in list(self._chats.values()):
+                    if (
+                        not kernel.lock.locked()
+                        and now - kernel.last_used > self.idle_timeout
+                    ):
+                        logger.debug(f"reaping idle kernel {kernel.id}")
+                        await self._discard(kernel)
+
+                for kernel in list(self._warm):
+                    if not await self._is_healthy(kernel) and kernel in self._warm:
+                        self._warm.remove(kernel)
+                        await self._discard(kernel)
+
+                self._replenish()
+            except Exception as err:
+                logger.exception("reaping kernels failed, %s", err)
+
+    async def close(self):
+        if self._reaper is not None:
+            self._reaper.cancel()
+        for kernel in self._warm + list(self._chats.values()):
+            await self._delete_kernel(kernel)
+        self._warm.clear()
+        self._chats.clear()
+        if self.session is not None:
+            await self.session.close()
+
+
+_kernel_pools: dict[tuple[str, str, str], JupyterKernelPool] = {}
+
+
+def get_kernel_pool(
+    base_url: str, token: str = "", password: str = ""
+) -> JupyterKernelPool:
+    key = (base_url, token or "", password or "")
+    pool = _kernel_pools.get(key)
+    if pool is None:
+        pool = JupyterKernelPool(
+            base_url,
+            token or "",
+            password or "",
+            size=CODE_INTERPRETER_JUPYTER_POOL_SIZE,
+            max_kernels=CODE_INTERPRETER_JUPYTER_MAX_KERNELS,
+            idle_timeout=CODE_INTERPRETER_JUPYTER_KERNEL_IDLE_TIMEOUT,
+        )
+        _kernel_pools[key] = pool
+    return pool
+
+
+async def close_kernel_pools():
+    for key, pool in list(_kernel_pools.items()):
+        try:
+            await pool.close()
+        except Exception as err:
+            logger.warning(f"closing kernel pool for {key[0]} failed: {err}")
+        finally:
+            _kernel_pools.pop(key, None)
 
 
 async def execute_code_jupyter(
-    base_url: str, code: str, token: str = "", password: str = "", timeout: int = 60
+    base_url: str,
+    code: str,
+    token: str = "",
+    password: str = "",
+    timeout: int = 60,
+    chat_id: Optional[str] = None,
 ) -> dict:
+    if not CODE_INTERPRETER_JUPYTER_KERNEL_PER_CHAT:
+        chat_id = None
+
+    if CODE_INTERPRETER_JUPYTER_POOL_SIZE > 0 or chat_id:
+        try:
+            pool = get_kernel_pool(base_url, token, password)
+            result = await pool.execute(code, timeout, chat_id=chat_id)
+        except Exception as err:
+            logger.exception("execute code failed, %s", err)
+            result = ResultModel(stderr=f"Error: {err}")
+        return result.model_dump()
+
     async with JupyterCodeExecuter(
         base_url, code, token, password, timeout
     ) as executor:
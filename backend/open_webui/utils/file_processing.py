@@ -0,0 +1,396 @@
+import asyncio
+import itertools
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from fastapi import FastAPI, Request
+
+from open_webui.config import (
+    FILE_PROCESSING_QUEUE,
+    FILE_PROCESSING_QUEUE_WORKERS,
+    FILE_PROCESSING_QUEUE_MAX_SIZE,
+    FILE_PROCESSING_PRIORITIES,
+    FILE_PROCESSING_DEFAULT_PRIORITY,
+)
+from open_webui.env import SRC_LOG_LEVELS
+from open_webui.models.files import Files
+from open_webui.models.users import Users
+from open_webui.routers.audio import transcribe
+from open_webui.routers.retrieval import ProcessFileForm, process_file
+from open_webui.socket.main import get_event_emitter
+from open_webui.storage.provider import Storage
+from open_webui.utils.redis import get_redis_client
+from open_webui.utils.reindex import get_background_request
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
+
+
+def should_process_file(request: Request, content_type: Optional[str]) -> bool:
+    """Whether an uploaded file of this content type is extracted and embedded."""
+    if not content_type:
+        return True
+    if content_type.startswith("audio/") or content_type in {"video/webm"}:
+        return True
+    return (not content_type.startswith(("image/", "video/"))) or (
+        request.app.state.config.CONTENT_EXTRACTION_ENGINE == "external"
+    )
+
+
+def process_uploaded_file(request: Request, file_id: str, user) -> None:
+    """Transcribe or extract an uploaded file, then embed its content."""
+    file = Files.get_file_by_id(id=file_id)
+    content_type = (file.meta or {}).get("content_type")
+
+    if content_type and (
+        content_type.startswith("audio/") or content_type in {"video/webm"}
+    ):
+        file_path = Storage.get_file(file.path)
+        result = transcribe(request, file_path, (file.meta or {}).get("data", {}))
+
+        process_file(
+            request,
+            ProcessFileForm(file_id=file_id, content=result.get("text", "")),
+            user=user,
+        )
+    else:
+        if not content_type:
+            log.info(
+                f"File type {content_type} is not provided, but trying to process anyway"
+            )
+        process_file(request, ProcessFileForm(file_id=file_id), user=user)
+
+
+def get_priority(priority: Optional[str]) -> int:
+    """Resolve a priority name from FILE_PROCESSING_PRIORITIES, or a number."""
+    if priority is None:
+        return FILE_PROCESSING_DEFAULT_PRIORITY
+    if priority in FILE_PROCESSING_PRIORITIES:
+        return int(FILE_PROCESSING_PRIORITIES[priority])
+    return int(priority)
+
+
+class FileProcessingQueue(ABC):
+    """
+    Background extraction and embedding of uploaded files.
+
+    Jobs run by priority (lower first), then in submission order, on
+    `workers` concurrent workers per process. The file's `data.status` is
+    "processing" until the job ends as "completed" or "failed", and each
+    transition is pushed to the uploader's sockets as a `file:status` event.
+
+    A job leaves the queue only once it ran to the end. Files a restart or
+    crash left "processing" without a job are requeued on startup.
+    Subclasses provide the queue storage.
+    """
+
+    # Seconds between the startup scan for files left "processing" and the
+    # check that they still have no job, so concurrent uploads are not requeued
+    RECOVER_DELAY = 10
+
+    def __init__(self, workers: int = 2, max_size: int = 0):
+        self.workers = workers
+        self.max_size = max_size
+
+        self._tasks: list[asyncio.Task] = []
+
+    @abstractmethod
+    def _put(self, job: dict, priority: int) -> None:
+        """Queue a job, callable from any thread."""
+        pass
+
+    @abstractmethod
+    async def _get(self) -> Optional[dict]:
+        """Next job, or None if there was none for a while."""
+        pass
+
+    @abstractmethod
+    async def _ack(self, job: dict) -> None:
+        """Remove a job that ran to the end."""
+        pass
+
+    @abstractmethod
+    async def _get_queued_file_ids(self) -> set[str]:
+        """Ids of the files with a job, queued or running."""
+        pass
+
+    @abstractmethod
+    def size(self) -> int:
+        """Number of queued jobs."""
+        pass
+
+    def is_full(self) -> bool:
+        return self.max_size > 0 and self.size() >= self.max_size
+
+    def submit(self, file_id: str, user_id: str, priority: int) -> None:
+        """Queue a stored file for processing, callable from any thread."""
+        Files.update_file_data_by_id(file_id, {"status": "processing"})
+        self._put(self._new_job(file_id, user_id), priority)
+
+    @staticmethod
+    def _new_job(file_id: str, user_id: str) -> dict:
+        return {
+            "file_id": file_id,
+            "user_id": user_id,
+            "queued_at": time.time(),
+            "attempts": 0,
+        }
+
+    def start(self, app: FastAPI) -> None:
+        self._tasks = [
+            asyncio.create_task(self._worker(app)) for _ in range(self.workers)
+        ]
+        self._tasks.append(asyncio.create_task(self._recover()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _recover(self):
+        """Requeue the files left "processing" without a job."""
+        try:
+            files = await asyncio.to_thread(Files.get_files_by_status, "processing")
+            if not files:
+                return
+
+            await asyncio.sleep(self.RECOVER_DELAY)
+            queued = await self._get_queued_file_ids()
+            for file in files:
+                if file.id in queued:
+                    continue
+                file = await asyncio.to_thread(Files.get_file_by_id, file.id)
+                if file is None or (file.data or {}).get("status") != "processing":
+                    continue
+
+                log.info(f"Requeueing file {file.id}, its processing was interrupted")
+                await asyncio.to_thread(
+                    self._put,
+                    self._new_job(file.id, file.user_id),
+                    FILE_PROCESSING_DEFAULT_PRIORITY,
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.exception(f"Failed to requeue interrupted file processing: {e}")
+
+    async def _worker(self, app: FastAPI):
+        request = get_background_request(app)
+        while True:
+            try:
+                job = await self._get()
+                if job is not None:
+                    await self._process(request, job)
+                    # Not on cancellation, the job is taken up again instead
+                    await self._ack(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.exception(f"File processing worker error: {e}")
+                await asyncio.sleep(1)
+
+    async def _process(self, request: Request, job: dict):
+        file_id = job["file_id"]
+        emit = get_event_emitter({"user_id": job["user_id"]}, update_db=False)
+
+        log.debug(
+            f"Processing file {file_id} after {time.time() - job['queued_at']:.1f}s in queue"
+        )
+        await emit(
+            {"type": "file:status", "data": {"id": file_id, "status": "processing"}}
+        )
+
+        data = {"status": "completed", "error": None}
+        try:
+            user = Users.get_user_by_id(job["user_id"])
+            await asyncio.to_thread(process_uploaded_file, request, file_id, user)
+        except Exception as e:
+            log.exception(f"Error processing file {file_id}: {e}")
+            data = {
+                "status": "failed",
+                "error": str(e.detail) if hasattr(e, "detail") else str(e),
+            }
+
+        Files.update_file_data_by_id(file_id, data)
+        await emit({"type": "file:status", "data": {"id": file_id, **data}})
+
+
+class MemoryFileProcessingQueue(FileProcessingQueue):
+    """
+    Per-process queue. Jobs still queued on restart are recovered from the
+    files' status, so a single worker process should use it.
+    """
+
+    def __init__(self, workers: int = 2, max_size: int = 0):
+        super().__init__(workers, max_size)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._counter = itertools.count()
+        self._file_ids: set[str] = set()
+
+    def start(self, app: FastAPI) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.PriorityQueue()
+        super().start(app)
+
+    def _put(self, job: dict, priority: int) -> None:
+        if self._loop is None:
+            raise RuntimeError("File processing queue is not running")
+        self._file_ids.add(job["file_id"])
+        # Uploads are handled in the threadpool, the queue lives on the event loop
+        self._loop.call_soon_threadsafe(
+            self._queue.put_nowait, (priority, next(self._counter), job)
+        )
+
+    async def _get(self) -> Optional[dict]:
+        _, _, job = await self._queue.get()
+        return job
+
+    async def _ack(self, job: dict) -> None:
+        self._file_ids.discard(job["file_id"])
+
+    async def _get_queued_file_ids(self) -> set[str]:
+        return set(self._file_ids)
+
+    def size(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+
+class RedisFileProcessingQueue(FileProcessingQueue):
+    """
+    Queue in a Redis sorted set shared between replicas.
+
+    Any replica may run a job, whichever replica it was uploaded to. A job
+    is moved to a sorted set of leased jobs while it runs, scored by the
+    lease expiry, and its worker renews the lease until the job ends. Jobs
+    whose lease expired, because their replica died, are requeued by the
+    other replicas, at most `MAX_ATTEMPTS` times before the file is failed.
+    """
+
+    KEY = "open-webui:file-processing:queue"
+    LEASED_KEY = "open-webui:file-processing:leased"
+
+    # Seconds a job stays leased without being renewed
+    LEASE_TIMEOUT = 60
+    MAX_ATTEMPTS = 3
+
+    # Moves the first queued job to the leased jobs, atomically
+    LEASE_SCRIPT = """
+local job = redis.call("ZRANGE", KEYS[1], 0, 0)[1]
+if not job then
+    return nil
+end
+redis.call("ZREM", KEYS[1], job)
+redis.call("ZADD", KEYS[2], ARGV[1], job)
+return job
+"""
+
+    def __init__(self, redis, workers: int = 2, max_size: int = 0):
+        super().__init__(workers, max_size)
+        self.redis = redis
+        self._async_redis = None
+        self._lease = None
+
+    def start(self, app: FastAPI) -> None:
+        self._async_redis = get_redis_client(async_mode=True)
+        self._lease = self._async_redis.register_script(self.LEASE_SCRIPT)
+        super().start(app)
+
+    def _put(self, job: dict, priority: int) -> None:
+        # Orders by priority, then by submission time within a priority
+        job = {**job, "score": priority * 1e10 + job["queued_at"]}
+        self.redis.zadd(self.KEY, {json.dumps(job): job["score"]})
+
+    async def _get(self) -> Optional[dict]:
+        member = await self._lease(
+            keys=[self.KEY, self.LEASED_KEY],
+            args=[time.time() + self.LEASE_TIMEOUT],
+        )
+        if member is None:
+            await self._requeue_expired()
+            await asyncio.sleep(1)
+            return None
+        return json.loads(member)
+
+    async def _ack(self, job: dict) -> None:
+        await self._async_redis.zrem(self.LEASED_KEY, json.dumps(job))
+
+    async def _process(self, request: Request, job: dict):
+        renew = asyncio.create_task(self._renew(job))
+        try:
+            await super()._process(request, job)
+        finally:
+            renew.cancel()
+
+    async def _renew(self, job: dict):
+        member = json.dumps(job)
+        while True:
+            await asyncio.sleep(self.LEASE_TIMEOUT / 3)
+            try:
+                await self._async_redis.zadd(
+                    self.LEASED_KEY,
+                    {member: time.time() + self.LEASE_TIMEOUT},
+                    xx=True,
+                )
+            except Exception as e:
+                log.warning(f"Failed to renew the lease of {job['file_id']}: {e}")
+
+    async def _requeue_expired(self):
+        for member in await self._async_redis.zrangebyscore(
+            self.LEASED_KEY, "-inf", time.time()
+        ):
+            # Only the replica that removes the job requeues it
+            if not await self._async_redis.zrem(self.LEASED_KEY, member):
+                continue
+
+            job = json.loads(member)
+            job["attempts"] += 1
+            if job["attempts"] >= self.MAX_ATTEMPTS:
+                log.error(f"Giving up on file {job['file_id']}, its worker died")
+                await self._fail(job, "File processing was interrupted")
+                continue
+
+            log.warning(f"Requeueing file {job['file_id']}, its worker died")
+            await self._async_redis.zadd(self.KEY, {json.dumps(job): job["score"]})
+
+    async def _fail(self, job: dict, error: str):
+        data = {"status": "failed", "error": error}
+        await asyncio.to_thread(Files.update_file_data_by_id, job["file_id"], data)
+        emit = get_event_emitter({"user_id": job["user_id"]}, update_db=False)
+        await emit({"type": "file:status", "data": {"id": job["file_id"], **data}})
+
+    async def _get_queued_file_ids(self) -> set[str]:
+        members = await self._async_redis.zrange(
+            self.KEY, 0, -1
+        ) + await self._async_redis.zrange(self.LEASED_KEY, 0, -1)
+        return {json.loads(member)["file_id"] for member in members}
+
+    def size(self) -> int:
+        return self.redis.zcard(self.KEY)
+
+
+def get_file_processing_queue(store: str) -> Optional[FileProcessingQueue]:
+    match store:
+        case "memory":
+            return MemoryFileProcessingQueue(
+                workers=FILE_PROCESSING_QUEUE_WORKERS,
+                max_size=FILE_PROCESSING_QUEUE_MAX_SIZE,
+            )
+        case "redis":
+            return RedisFileProcessingQueue(
+                get_redis_client(),
+                workers=FILE_PROCESSING_QUEUE_WORKERS,
+                max_size=FILE_PROCESSING_QUEUE_MAX_SIZE,
+            )
+        case "":
+            return None
+        case _:
+            raise ValueError(f"Unsupported file processing queue: {store}")
+
+
+FILE_PROCESSING_JOBS = get_file_processing_queue(FILE_PROCESSING_QUEUE)
@@ -0,0 +1,70 @@
+import asyncio
+import logging
+from typing import Optional
+
+import aiohttp
+
+from open_webui.env import (
+    AIOHTTP_CLIENT_TIMEOUT,
+    HTTP_CLIENT_POOL_LIMIT,
+    HTTP_CLIENT_POOL_LIMIT_PER_HOST,
+    SRC_LOG_LEVELS,
+)
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["MAIN"])
+
+
+# Shared client sessions, keyed by (name, event loop). aiohttp sessions are bound
+# to the loop they were created on, so a new session is created per loop.
+_sessions: dict[tuple[str, int], aiohttp.ClientSession] = {}
+
+
+def get_http_session(
+    name: str = "default",
+    limit: Optional[int] = None,
+    limit_per_host: Optional[int] = None,
+    timeout: Optional[int] = AIOHTTP_CLIENT_TIMEOUT,
+) -> aiohttp.ClientSession:
+    """
+    Return a pooled aiohttp session shared by every caller using the same name.
+
+    Connections are kept alive and reused across requests instead of paying
+    for a new TCP/TLS handshake on every call. Callers must not close the
+    returned session; use `close_http_sessions` on shutdown instead.
+    """
+    loop = asyncio.get_running_loop()
+    key = (name, id(loop))
+
+    session = _sessions.get(key)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=limit if limit is not None else HTTP_CLIENT_POOL_LIMIT,
+            limit_per_host=(
+                limit_per_host
+                if limit_per_host is not None
+                else HTTP_CLIENT_POOL_LIMIT_PER_HOST
+            ),
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            trust_env=True,
+        )
+        _sessions[key] = session
+
+    return session
+
+
+async def close_http_sessions():
+    for key, session in list(_sessions.items()):
+        try:
+            if not session.closed:
+                await session.close()
+        except Exception as e:
+            log.warning(f"Failed to close http session {key[0]}: {e}")
+        finally:
+            _sessions.pop(key, None)
@@ -0,0 +1,235 @@
+import asyncio
+import base64
+import logging
+import tempfile
+from typing import IO, Any, Awaitable, Optional
+
+import aiohttp
+from open_webui.env import (
+    AIOHTTP_CLIENT_SESSION_SSL,
+    IMAGE_GENERATION_MAX_CONCURRENCY,
+    SRC_LOG_LEVELS,
+)
+from open_webui.utils.http_client import get_http_session
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["IMAGES"])
+
+
+# Decoded images are kept in memory up to this size, larger ones spill to disk
+IMAGE_SPOOL_MAX_MEMORY = 4 * 1024 * 1024
+# Multiple of 4 so every base64 chunk decodes independently
+BASE64_CHUNK_SIZE = 4 * 256 * 1024
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class ImageGenerationError(Exception):
+    pass
+
+
+def get_image_session() -> aiohttp.ClientSession:
+    return get_http_session("images")
+
+
+async def request_json(
+    method: str,
+    url: str,
+    headers: Optional[dict] = None,
+    json: Optional[Any] = None,
+) -> Any:
+    """Send a request over the pooled image session and return the JSON body."""
+    session = get_image_session()
+    async with session.request(
+        method, url, headers=headers, json=json, ssl=AIOHTTP_CLIENT_SESSION_SSL
+    ) as r:
+        if r.status >= 400:
+            message = None
+            try:
+                res = await r.json(content_type=None)
+                error = res.get("error") if isinstance(res, dict) else None
+                if isinstance(error, dict):
+                    message = error.get("message")
+                elif error:
+                    message = str(error)
+            except Exception:
+                pass
+            raise ImageGenerationError(message or f"{r.status}, {r.reason}: {url}")
+
+        return await r.json(content_type=None)
+
+
+async def gather_with_concurrency(
+    coros: list[Awaitable], limit: int = IMAGE_GENERATION_MAX_CONCURRENCY
+) -> list:
+    """asyncio.gather with at most `limit` coroutines in flight, order preserved."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros))
+
+
+def split_count(n: int, batch_size: int) -> list[int]:
+    """Split `n` images into request sizes of at most `batch_size`."""
+    n = max(n, 1)
+    return [min(batch_size, n - i) for i in range(0, n, batch_size)]
+
+
+def decode_b64_to_file(b64_str: str) -> tuple[Optional[IO[bytes]], Optional[str]]:
+    """
+    Decode a (data URI or raw) base64 image into a spooled temporary file.
+
+    The payload is decoded in chunks so the decoded image is never held in
+    memory in full alongside the encoded string.
+    """
+    try:
+        if "," in b64_str:
+            header, encoded = b64_str.split(",", 1)
+            mime_type = header.split(";")[0].lstrip("data:")
+        else:
+            mime_type = "image/png"
+            encoded = b64_str
+
+        encoded = encoded.strip()
+        if any(c in encoded for c in "\r\n\t "):
+            encoded = "".join(encoded.split())
+
+        file = tempfile.SpooledTemporaryFile(max_size=IMAGE_SPOOL_MAX_MEMORY)
+        for idx in range(0, len(encoded), BASE64_CHUNK_SIZE):
+            file.write(base64.b64decode(encoded[idx : idx + BASE64_CHUNK_SIZE]))
+        file.seek(0)
+        return file, mime_type
+    except Exception as e:
+        log.exception(f"Error loading image data: {e}")
+        return None, None
+
+
+async def download_image_to_file(
+    url: str, headers: Optional[dict] = None
+) -> tuple[Optional[IO[bytes]], Optional[str]]:
+    """Stream an image URL into a spooled temporary file."""
+    try:
+        session = get_image_session()
+        async with session.get(
+            url, headers=headers, ssl=AIOHTTP_CLIENT_SESSION_SSL
+        ) as r:
+            r.raise_for_status()
+
+            content_type = r.headers.get("content-type", "")
+            if content_type.split("/")[0] != "image":
+                log.error("Url does not point to an image.")
+                return None, None
+
+            file = tempfile.SpooledTemporaryFile(max_size=IMAGE_SPOOL_MAX_MEMORY)
+            async for chunk in r.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                file.write(chunk)
+            file.seek(0)
+            return file, content_type
+    except Exception as e:
+        log.exception(f"Error saving image: {e}")
+        return None, None
+
+
+####################
+# OpenAI
+####################
+
+
+def openai_supports_batch(model: str) -> bool:
+    # dall-e-3 only accepts n=1, every other image model accepts n>1
+    return not model.startswith("dall-e-3")
+
+
+async def openai_generate_images(base_url: str, headers: dict, data: dict) -> list:
+    """
+    Generate images with the OpenAI images API.
+
+    When the model cannot produce several images in one call, `n` is fanned out
+    into concurrent single-image requests.
+    """
+    url = f"{base_url}/images/generations"
+
+    if data.get("n", 1) > 1 and not openai_supports_batch(data["model"]):
+        counts = split_count(data["n"], 1)
+    else:
+        counts = [data.get("n", 1)]
+
+    responses = await gather_with_concurrency(
+        [
+            request_json("POST", url, headers=headers, json={**data, "n": count})
+            for count in counts
+        ]
+    )
+    return [image for res in responses for image in res.get("data", [])]
+
+
+####################
+# Gemini
+####################
+
+GEMINI_MAX_SAMPLE_COUNT = 4
+
+
+async def gemini_generate_images(
+    base_url: str, api_key: str, model: str, data: dict
+) -> list:
+    url = f"{base_url}/models/{model}:predict"
+    headers = {"Content-Type": "application/json", "x-goog-api-key": api_key}
+
+    counts = split_count(
+        data["parameters"].get("sampleCount", 1), GEMINI_MAX_SAMPLE_COUNT
+    )
+    responses = await gather_with_concurrency(
+        [
+            request_json(
+                "POST",
+                url,
+                headers=headers,
+                json={
+                    **data,
+                    "parameters": {**data["parameters"], "sampleCount": count},
+                },
+            )
+            for count in counts
+        ]
+    )
+    return [image for res in responses for image in res.get("predictions", [])]
+
+
+####################
+# Automatic1111
+####################
+
+
+async def automatic1111_get_options(base_url: str, api_auth: str) -> dict:
+    return await request_json(
+        "GET", f"{base_url}/sdapi/v1/options", headers={"authorization": api_auth}
+    )
+
+
+async def automatic1111_set_options(base_url: str, api_auth: str, options: dict):
+    return await request_json(
+        "POST",
+        f"{base_url}/sdapi/v1/options",
+        headers={"authorization": api_auth},
+        json=options,
+    )
+
+
+async def automatic1111_get_models(base_url: str, api_auth: str) -> list:
+    return await request_json(
+        "GET", f"{base_url}/sdapi/v1/sd-models", headers={"authorization": api_auth}
+    )
+
+
+async def automatic1111_generate_images(
+    base_url: str, api_auth: str, data: dict
+) -> dict:
+    return await request_json(
+        "POST",
+        f"{base_url}/sdapi/v1/txt2img",
+        headers={"authorization": api_auth},
+        json=data,
+    )
@@ -1,13 +1,12 @@
-import asyncio
 import json
 import logging
 import random
 import urllib.parse
-import urllib.request
 from typing import Optional
 
-import websocket  # NOTE: websocket-client (https://github.com/websocket-client/websocket-client)
-from open_webui.env import SRC_LOG_LEVELS
+import aiohttp
+from open_webui.env import AIOHTTP_CLIENT_SESSION_SSL, SRC_LOG_LEVELS
+from open_webui.utils.images.clients import get_image_session, request_json
 from pydantic import BaseModel
 
 log = logging.getLogger(__name__)
@@ -16,36 +15,23 @@ log.setLevel(SRC_LOG_LEVELS["COMFYUI"])
 default_headers = {"User-Agent": "Mozilla/5.0"}
 
 
-def queue_prompt(prompt, client_id, base_url, api_key):
+def get_headers(api_key):
+    return {**default_headers, "Authorization": f"Bearer {api_key}"}
+
+
+async def queue_prompt(prompt, client_id, base_url, api_key):
     log.info("queue_prompt")
     p = {"prompt": prompt, "client_id": client_id}
-    data = json.dumps(p).encode("utf-8")
-    log.debug(f"queue_prompt data: {data}")
+    log.debug(f"queue_prompt data: {p}")
     try:
-        req = urllib.request.Request(
-            f"{base_url}/prompt",
-            data=data,
-            headers={**default_headers, "Authorization": f"Bearer {api_key}"},
+        return await request_json(
+            "POST", f"{base_url}/prompt", headers=get_headers(api_key), json=p
         )
-        response = urllib.request.urlopen(req).read()
-        return json.loads(response)
     except Exception as e:
         log.exception(f"Error while queuing prompt: {e}")
         raise e
 
 
-def get_image(filename, subfolder, folder_type, base_url, api_key):
-    log.info("get_image")
-    data = {"filename": filename, "subfolder": subfolder, "type": folder_type}
-    url_values = urllib.parse.urlencode(data)
-    req = urllib.request.Request(
-        f"{base_url}/view?{url_values}",
-        headers={**default_headers, "Authorization": f"Bearer {api_key}"},
-    )
-    with urllib.request.urlopen(req) as response:
-        return response.read()
-
-
 def get_image_url(filename, subfolder, folder_type, base_url):
     log.info("get_image")
     data = {"filename": filename, "subfolder": subfolder, "type": folder_type}
@@ -53,41 +39,72 @@ def get_image_url(filename, subfolder, folder_type, base_url):
     return f"{base_url}/view?{url_values}"
 
 
-def get_history(prompt_id, base_url, api_key):
+async def get_history(prompt_id, base_url, api_key):
     log.info("get_history")
+    return await request_json(
+        "GET", f"{base_url}/history/{prompt_id}", headers=get_headers(api_key)
+    )
+
 
-    req = urllib.request.Request(
-        f"{base_url}/history/{prompt_id}",
-        headers={**default_headers, "Authorization": f"Bearer {api_key}"},
+async def get_object_info(base_url, api_key):
+    return await request_json(
+        "GET", f"{base_url}/object_info", headers=get_headers(api_key)
     )
-    with urllib.request.urlopen(req) as response:
-        return json.loads(response.read())
 
 
-def get_images(ws, prompt, client_id, base_url, api_key):
-    prompt_id = queue_prompt(prompt, client_id, base_url, api_key)["prompt_id"]
+async def emit_progress(event_emitter, description, done=False):
+    if event_emitter:
+        try:
+            await event_emitter(
+                {
+                    "type": "status",
+                    "data": {"description": description, "done": done},
+                }
+            )
+        except Exception as e:
+            log.debug(f"Failed to emit ComfyUI progress: {e}")
+
+
+async def get_images(ws, prompt, client_id, base_url, api_key, event_emitter=None):
+    prompt_id = (await queue_prompt(prompt, client_id, base_url, api_key))["prompt_id"]
     output_images = []
-    while True:
-        out = ws.recv()
-        if isinstance(out, str):
-            message = json.loads(out)
-            if message["type"] == "executing":
-                data = message["data"]
-                if data["node"] is None and data["prompt_id"] == prompt_id:
-                    break  # Execution is done
-        else:
+    last_percent = None
+
+    async for msg in ws:
+        if msg.type != aiohttp.WSMsgType.TEXT:
+            if msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                raise Exception("ComfyUI WebSocket connection closed unexpectedly")
             continue  # previews are binary data
 
-    history = get_history(prompt_id, base_url, api_key)[prompt_id]
-    for o in history["outputs"]:
-        for node_id in history["outputs"]:
-            node_output = history["outputs"][node_id]
-            if "images" in node_output:
-                for image in node_output["images"]:
-                    url = get_image_url(
-                        image["filename"], image["subfolder"], image["type"], base_url
+        message = json.loads(msg.data)
+        data = message.get("data", {})
+
+        if data.get("prompt_id") not in (None, prompt_id):
+            continue
+
+        if message["type"] == "progress":
+            if data.get("max"):
+                percent = int(data["value"] / data["max"] * 100)
+                if percent != last_percent:
+                    last_percent = percent
+                    await emit_progress(
+                        event_emitter, f"Generating an image ({percent}%)"
                     )
-                    output_images.append({"url": url})
+        elif message["type"] == "execution_error":
+            raise Exception(data.get("exception_message", "ComfyUI execution failed"))
+        elif message["type"] == "executing":
+            if data["node"] is None and data["prompt_id"] == prompt_id:
+                break  # Execution is done
+
+    history = (await get_history(prompt_id, base_url, api_key))[prompt_id]
+    for node_id in history["outputs"]:
+        node_output = history["outputs"][node_id]
+        if "images" in node_output:
+            for image in node_output["images"]:
+                url = get_image_url(
+                    image["filename"], image["subfolder"], image["type"], base_url
+                )
+                output_images.append({"url": url})
     return {"data": output_images}
 
 
@@ -117,7 +134,12 @@ class ComfyUIGenerateImageForm(BaseModel):
 
 
 async def comfyui_generate_image(
-    model: str, payload: ComfyUIGenerateImageForm, client_id, base_url, api_key
+    model: str,
+    payload: ComfyUIGenerateImageForm,
+    client_id,
+    base_url,
+    api_key,
+    event_emitter=None,
 ):
     ws_url = base_url.replace("http://", "ws://").replace("https://", "wss://")
     workflow = json.loads(payload.workflow.workflow)
@@ -170,9 +192,12 @@ async def comfyui_generate_image(
                 workflow[node_id]["inputs"][node.key] = node.value
 
     try:
-        ws = websocket.WebSocket()
-        headers = {"Authorization": f"Bearer {api_key}"}
-        ws.connect(f"{ws_url}/ws?clientId={client_id}", header=headers)
+        session = get_image_session()
+        ws = await session.ws_connect(
+            f"{ws_url}/ws?clientId={client_id}",
+            headers={"Authorization": f"Bearer {api_key}"},
+            ssl=AIOHTTP_CLIENT_SESSION_SSL,
+        )
         log.info("WebSocket connection established.")
     except Exception as e:
         log.exception(f"Failed to connect to WebSocket server: {e}")
@@ -181,13 +206,13 @@ async def comfyui_generate_image(
     try:
         log.info("Sending workflow to WebSocket server.")
         log.info(f"Workflow: {workflow}")
-        images = await asyncio.to_thread(
-            get_images, ws, workflow, client_id, base_url, api_key
+        images = await get_images(
+            ws, workflow, client_id, base_url, api_key, event_emitter
         )
     except Exception as e:
         log.exception(f"Error while receiving images: {e}")
         images = None
-
-    ws.close()
+    finally:
+        await ws.close()
 
     return images
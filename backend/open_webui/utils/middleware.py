@@ -39,7 +39,7 @@ from open_webui.routers.tasks import (
 from open_webui.routers.retrieval import process_web_search, SearchForm
 from open_webui.routers.images import (
     load_b64_image_data,
-    image_generations,
+    generate_images,
     GenerateImageForm,
     upload_image,
 )
@@ -75,7 +75,7 @@ from open_webui.utils.misc import (
     prepend_to_first_user_message_content,
     convert_logit_bias_input_to_json,
 )
-from open_webui.utils.tools import get_tools
+from open_webui.utils.tools import execute_tool_call, gather_tool_calls, get_tools
 from open_webui.utils.plugin import load_function_module_by_id
 from open_webui.utils.filter import (
     get_sorted_filter_ids,
@@ -189,6 +189,7 @@ async def chat_completion_tools_handler(
         }
 
     event_caller = extra_params["__event_call__"]
+    event_emitter = extra_params.get("__event_emitter__")
     metadata = extra_params["__metadata__"]
 
     task_model_id = get_task_model_id(
@@ -232,14 +233,13 @@ async def chat_completion_tools_handler(
 
             result = json.loads(content)
 
-            async def tool_call_handler(tool_call):
-                nonlocal skip_files
-
+            async def tool_call_executor(tool_call):
+                """并发执行阶段：只调用工具，不修改 body 和 sources"""
                 log.debug(f"{tool_call=}")
 
                 tool_function_name = tool_call.get("name", None)
                 if tool_function_name not in tools:
-                    return body, {}
+                    return None
 
                 tool_function_params = tool_call.get("parameters", {})
 
@@ -256,26 +256,42 @@ async def chat_completion_tools_handler(
                         if k in allowed_params
                     }
 
-                    if tool.get("direct", False):
-                        tool_result = await event_caller(
-                            {
-                                "type": "execute:tool",
-                                "data": {
-                                    "id": str(uuid4()),
-                                    "name": tool_function_name,
-                                    "params": tool_function_params,
-                                    "server": tool.get("server", {}),
-                                    "session_id": metadata.get("session_id", None),
-                                },
-                            }
-                        )
-                    else:
-                        tool_function = tool["callable"]
-                        tool_result = await tool_function(**tool_function_params)
-
+                    tool_result = await execute_tool_call(
+                        tool,
+                        tool_function_name,
+                        tool_function_params,
+                        event_caller=event_caller,
+                        metadata=metadata,
+                    )
                 except Exception as e:
                     tool_result = str(e)
 
+                return tool_function_name, tool_function_params, tool_result
+
+            async def tool_call_status_handler(executed):
+                if executed is None or not event_emitter:
+                    return
+
+                await event_emitter(
+                    {
+                        "type": "status",
+                        "data": {
+                            "action": "tool_call",
+                            "description": f"Executed {executed[0]}",
+                            "done": True,
+                        },
+                    }
+                )
+
+            def tool_call_handler(executed):
+                """按原顺序将工具结果写入 body 和 sources"""
+                nonlocal skip_files
+
+                if executed is None:
+                    return
+
+                tool_function_name, tool_function_params, tool_result = executed
+
                 tool_result_files = []
                 if isinstance(tool_result, list):
                     for item in tool_result:
@@ -329,11 +345,14 @@ async def chat_completion_tools_handler(
                         skip_files = True
 
             # check if "tool_calls" in result
-            if result.get("tool_calls"):
-                for tool_call in result.get("tool_calls"):
-                    await tool_call_handler(tool_call)
-            else:
-                await tool_call_handler(result)
+            # 相互独立的工具调用并发执行，结果按原顺序写回
+            executed_tool_calls = await gather_tool_calls(
+                result.get("tool_calls") or [result],
+                tool_call_executor,
+                on_result=tool_call_status_handler,
+            )
+            for executed in executed_tool_calls:
+                tool_call_handler(executed)
 
         except Exception as e:
             log.debug(f"Error: {e}")
@@ -598,10 +617,11 @@ async def chat_image_generation_handler(
     system_message_content = ""
 
     try:
-        images = await image_generations(
+        images = await generate_images(
             request=request,
             form_data=GenerateImageForm(**{"prompt": prompt}),
             user=user,
+            event_emitter=__event_emitter__,
         )
 
         await __event_emitter__(
@@ -2100,8 +2120,9 @@ async def process_chat_response(
 
                     tools = metadata.get("tools", {})
 
-                    results = []
-                    for tool_call in response_tool_calls:
+                    completed_results = []
+
+                    async def process_tool_call(tool_call):
                         tool_call_id = tool_call.get("id", "")
                         tool_name = tool_call.get("function", {}).get("name", "")
 
@@ -2142,28 +2163,13 @@ async def process_chat_response(
                                     if k in allowed_params
                                 }
 
-                                if tool.get("direct", False):
-                                    tool_result = await event_caller(
-                                        {
-                                            "type": "execute:tool",
-                                            "data": {
-                                                "id": str(uuid4()),
-                                                "name": tool_name,
-                                                "params": tool_function_params,
-                                                "server": tool.get("server", {}),
-                                                "session_id": metadata.get(
-                                                    "session_id", None
-                                                ),
-                                            },
-                                        }
-                                    )
-
-                                else:
-                                    tool_function = tool["callable"]
-                                    tool_result = await tool_function(
-                                        **tool_function_params
-                                    )
-
+                                tool_result = await execute_tool_call(
+                                    tool,
+                                    tool_name,
+                                    tool_function_params,
+                                    event_caller=event_caller,
+                                    metadata=metadata,
+                                )
                             except Exception as e:
                                 tool_result = str(e)
 
@@ -2180,18 +2186,37 @@ async def process_chat_response(
                         ):
                             tool_result = json.dumps(tool_result, indent=2)
 
-                        results.append(
+                        return {
+                            "tool_call_id": tool_call_id,
+                            "content": tool_result,
+                            **(
+                                {"files": tool_result_files}
+                                if tool_result_files
+                                else {}
+                            ),
+                        }
+
+                    async def emit_tool_call_result(result):
+                        # 每个工具调用完成后立即推送，前端按 tool_call_id 匹配结果
+                        completed_results.append(result)
+                        content_blocks[-1]["results"] = completed_results
+
+                        await event_emitter(
                             {
-                                "tool_call_id": tool_call_id,
-                                "content": tool_result,
-                                **(
-                                    {"files": tool_result_files}
-                                    if tool_result_files
-                                    else {}
-                                ),
+                                "type": "chat:completion",
+                                "data": {
+                                    "content": serialize_content_blocks(content_blocks),
+                                },
                             }
                         )
 
+                    # 相互独立的工具调用并发执行，结果保持原有顺序
+                    results = await gather_tool_calls(
+                        response_tool_calls,
+                        process_tool_call,
+                        on_result=emit_tool_call_result,
+                    )
+
                     content_blocks[-1]["results"] = results
 
                     content_blocks.append(
@@ -2294,6 +2319,7 @@ async def process_chat_response(
                                             else None
                                         ),
                                         request.app.state.config.CODE_INTERPRETER_JUPYTER_TIMEOUT,
+                                        chat_id=metadata.get("chat_id"),
                                     )
                                 else:
                                     output = {
@@ -1,3 +1,4 @@
+import base64
 import hashlib
 import re
 import time
@@ -478,3 +479,20 @@ def convert_logit_bias_input_to_json(user_input):
         bias = 100 if bias > 100 else -100 if bias < -100 else bias
         logit_bias_json[token] = bias
     return json.dumps(logit_bias_json)
+
+
+def encode_cursor(timestamp: int, id: str) -> str:
+    """Encode a (timestamp, id) keyset position as an opaque pagination cursor."""
+    return base64.urlsafe_b64encode(json.dumps([timestamp, id]).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[tuple[int, str]]:
+    """Decode a cursor produced by `encode_cursor`, raising ValueError if invalid."""
+    if not cursor:
+        return None
+
+    try:
+        timestamp, id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return int(timestamp), str(id)
+    except Exception:
+        raise ValueError("Invalid cursor")
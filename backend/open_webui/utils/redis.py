@@ -2,6 +2,8 @@ import socketio  # 导入Socket.IO库，用于实时通信
 from urllib.parse import urlparse  # 导入URL解析工具，用于解析Redis连接URL
 from typing import Optional  # 导入Optional类型，表示可选值
 
+from open_webui.env import REDIS_URL, REDIS_SENTINEL_HOSTS, REDIS_SENTINEL_PORT
+
 
 def parse_redis_service_url(redis_url):
     """
@@ -102,6 +104,30 @@ def get_redis_connection(
             return None
 
 
+def get_redis_client(async_mode=False, decode_responses=True):
+    """
+    获取按环境配置创建的Redis连接
+
+    使用REDIS_URL及哨兵配置（REDIS_SENTINEL_HOSTS、REDIS_SENTINEL_PORT）创建连接，
+    供缓存和队列等共享Redis的模块使用。
+
+    Args:
+        async_mode: 是否使用异步模式，默认为False
+        decode_responses: 是否将响应解码为字符串，默认为True
+
+    Returns:
+        Redis连接对象，如果未配置REDIS_URL则返回None
+    """
+    return get_redis_connection(
+        redis_url=REDIS_URL,
+        redis_sentinels=get_sentinels_from_env(
+            REDIS_SENTINEL_HOSTS, REDIS_SENTINEL_PORT
+        ),
+        async_mode=async_mode,
+        decode_responses=decode_responses,
+    )
+
+
 def get_sentinels_from_env(sentinel_hosts_env, sentinel_port_env):
     """
     从环境变量中获取Redis哨兵配置
@@ -0,0 +1,397 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Optional
+
+from fastapi import FastAPI, Request
+
+from open_webui.config import CACHE_DIR
+from open_webui.env import KNOWLEDGE_REINDEX_MAX_WORKERS, SRC_LOG_LEVELS
+from open_webui.models.files import Files
+from open_webui.models.knowledge import Knowledges
+from open_webui.models.users import Users
+from open_webui.retrieval.vector.factory import VECTOR_DB_CLIENT
+from open_webui.retrieval.vector.main import VectorDBBase
+from open_webui.routers.retrieval import ProcessFileForm, process_file
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
+
+
+REINDEX_STATE_PATH = CACHE_DIR / "reindex" / "state.json"
+
+# A running job saves its checkpoint at least this often; a "running" state
+# whose heartbeat is older than this was interrupted and can be resumed.
+REINDEX_HEARTBEAT_INTERVAL = 15
+
+
+def get_shadow_collection_name(knowledge_id: str) -> str:
+    return f"{knowledge_id}-reindex"
+
+
+def supports_collection_swap() -> bool:
+    return (
+        type(VECTOR_DB_CLIENT).rename_collection is not VectorDBBase.rename_collection
+    )
+
+
+def supports_collection_copy() -> bool:
+    return type(VECTOR_DB_CLIENT).copy is not VectorDBBase.copy or (
+        type(VECTOR_DB_CLIENT).get_items is not VectorDBBase.get_items
+    )
+
+
+def get_background_request(app: FastAPI) -> Request:
+    """Build a minimal request so request-bound helpers can run outside a handler."""
+    return Request(
+        scope={
+            "type": "http",
+            "app": app,
+            "method": "POST",
+            "path": "/api/v1/knowledge/reindex",
+            "headers": [],
+            "query_string": b"",
+        }
+    )
+
+
+class KnowledgeReindexJob:
+    """
+    Background, resumable reindex of every knowledge base.
+
+    Each knowledge base is rebuilt file by file into a shadow collection by a
+    bounded pool of workers and swapped in with `rename_collection` once
+    complete, so searches keep hitting the old vectors until the new ones are
+    ready. Vector backends that cannot swap atomically get the live collection
+    dropped and refilled with a `copy` of the shadow, and those that cannot
+    read vectors back have it dropped and rebuilt directly. The live
+    collection is recreated either way, so a new embedding model may change
+    the vector dimension. Progress is checkpointed to disk after every file,
+    so an interrupted job continues where it stopped instead of starting over.
+
+    File edits to a knowledge base are refused while it is being rebuilt, the
+    swap or the rebuild would otherwise lose or undo them.
+    """
+
+    def __init__(self, path=REINDEX_STATE_PATH):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.state: Optional[dict] = self._load()
+
+    def _load(self) -> Optional[dict]:
+        if not self.path.is_file():
+            return None
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except Exception as e:
+            log.warning(f"Failed to read reindex checkpoint: {e}")
+            return None
+
+    async def _save(self):
+        # Serialised on the event loop, the only writer of the state, and
+        # written to disk off it
+        self.state["updated_at"] = int(time.time())
+        await asyncio.to_thread(self._write, json.dumps(self.state))
+
+    def _write(self, data: str):
+        with self._lock:
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def is_interrupted(self) -> bool:
+        return (
+            not self.is_running()
+            and self.state is not None
+            and self.state.get("status") == "running"
+            and time.time() - self.state.get("updated_at", 0)
+            > REINDEX_HEARTBEAT_INTERVAL * 2
+        )
+
+    def is_reindexing(self, knowledge_id: str) -> bool:
+        """Whether the knowledge base is being rebuilt, by this or another worker."""
+        state = self.state if self.is_running() else (self._load() or self.state)
+        if state is None or state.get("status") != "running":
+            return False
+        return any(
+            kb["id"] == knowledge_id and kb["status"] == "running"
+            for kb in state.get("knowledge_bases", [])
+        )
+
+    def get_status(self) -> dict:
+        if not self.is_running():
+            self.state = self._load() or self.state
+
+        if self.state is None:
+            return {"status": "idle"}
+
+        with self._lock:
+            knowledge_bases = self.state.get("knowledge_bases", [])
+            total = sum(len(kb["file_ids"]) for kb in knowledge_bases)
+            processed = sum(len(kb["done"]) for kb in knowledge_bases)
+            failed = sum(len(kb["failed"]) for kb in knowledge_bases)
+
+            return {
+                "id": self.state["id"],
+                "status": (
+                    "interrupted" if self.is_interrupted() else self.state["status"]
+                ),
+                "started_at": self.state["started_at"],
+                "updated_at": self.state.get("updated_at"),
+                "completed_at": self.state.get("completed_at"),
+                "swap": self.state.get("swap", False),
+                "total_files": total,
+                "processed_files": processed,
+                "failed_files": failed,
+                "knowledge_bases": [
+                    {
+                        "id": kb["id"],
+                        "status": kb["status"],
+                        "total": len(kb["file_ids"]),
+                        "processed": len(kb["done"]),
+                        "failed": kb["failed"],
+                    }
+                    for kb in knowledge_bases
+                ],
+                "deleted_knowledge_bases": self.state.get(
+                    "deleted_knowledge_bases", []
+                ),
+                "error": self.state.get("error"),
+            }
+
+    def start(self, app: FastAPI, user_id: str) -> bool:
+        """Start a new job, or resume an interrupted one. False if already running."""
+        if self.is_running():
+            return False
+
+        # Pick up progress checkpointed by another worker process
+        self.state = self._load() or self.state
+
+        if self.state is not None and self.state.get("status") == "running":
+            if not self.is_interrupted():
+                # Still heartbeating, owned by another worker
+                return False
+            log.info(f"Resuming reindex job {self.state['id']}")
+        else:
+            self.state = self._create_state(user_id)
+
+        self._task = asyncio.create_task(self._run(app))
+        return True
+
+    def resume(self, app: FastAPI) -> bool:
+        """Resume a job that was interrupted by a restart."""
+        if not self.is_interrupted():
+            return False
+        return self.start(app, self.state["user_id"])
+
+    def _create_state(self, user_id: str) -> dict:
+        knowledge_bases = []
+        deleted_knowledge_bases = []
+
+        for knowledge_base in Knowledges.get_knowledge_bases():
+            # -- Robust error handling for missing or invalid data
+            if not knowledge_base.data or not isinstance(knowledge_base.data, dict):
+                log.warning(
+                    f"Knowledge base {knowledge_base.id} has no data or invalid data ({knowledge_base.data!r}). Deleting."
+                )
+                try:
+                    Knowledges.delete_knowledge_by_id(id=knowledge_base.id)
+                    deleted_knowledge_bases.append(knowledge_base.id)
+                except Exception as e:
+                    log.error(
+                        f"Failed to delete invalid knowledge base {knowledge_base.id}: {e}"
+                    )
+                continue
+
+            knowledge_bases.append(
+                {
+                    "id": knowledge_base.id,
+                    "status": "pending",
+                    "file_ids": knowledge_base.data.get("file_ids", []),
+                    "done": [],
+                    "failed": [],
+                }
+            )
+
+        return {
+            "id": str(uuid.uuid4()),
+            "status": "running",
+            "user_id": user_id,
+            "swap": supports_collection_swap(),
+            "started_at": int(time.time()),
+            "knowledge_bases": knowledge_bases,
+            "deleted_knowledge_bases": deleted_knowledge_bases,
+        }
+
+    async def _run(self, app: FastAPI):
+        request = get_background_request(app)
+        user = Users.get_user_by_id(self.state["user_id"])
+
+        log.info(
+            f"Starting reindexing for {len(self.state['knowledge_bases'])} knowledge bases"
+        )
+
+        await self._save()
+        heartbeat = asyncio.create_task(self._heartbeat())
+        try:
+            for kb_state in self.state["knowledge_bases"]:
+                if kb_state["status"] in ["completed", "failed", "skipped"]:
+                    continue
+                await self._reindex_knowledge_base(request, user, kb_state)
+
+            self.state["status"] = "completed"
+            self.state["completed_at"] = int(time.time())
+            log.info(
+                f"Reindexing completed. Deleted {len(self.state['deleted_knowledge_bases'])} invalid knowledge bases: {self.state['deleted_knowledge_bases']}"
+            )
+        except asyncio.CancelledError:
+            # Leave the job marked as running so it is resumed on next start
+            log.info(f"Reindex job {self.state['id']} cancelled")
+            raise
+        except Exception as e:
+            log.exception(f"Reindex job {self.state['id']} failed: {e}")
+            self.state["status"] = "failed"
+            self.state["error"] = str(e)
+        finally:
+            heartbeat.cancel()
+            await asyncio.shield(self._save())
+
+    async def _heartbeat(self):
+        while True:
+            await asyncio.sleep(REINDEX_HEARTBEAT_INTERVAL)
+            await self._save()
+
+    async def _reindex_knowledge_base(self, request: Request, user, kb_state: dict):
+        knowledge_id = kb_state["id"]
+        swap = self.state["swap"]
+        shadow = swap or supports_collection_copy()
+        collection_name = (
+            get_shadow_collection_name(knowledge_id) if shadow else knowledge_id
+        )
+
+        knowledge = Knowledges.get_knowledge_by_id(id=knowledge_id)
+        if knowledge is None:
+            kb_state["status"] = "skipped"
+            await self._save()
+            return
+
+        if kb_state["status"] == "pending":
+            # Drop a shadow left behind by a previous, unrelated run, or the
+            # live collection when rebuilding it directly: its vectors may not
+            # match the dimension of the current embedding model.
+            if VECTOR_DB_CLIENT.has_collection(collection_name=collection_name):
+                VECTOR_DB_CLIENT.delete_collection(collection_name=collection_name)
+            # Files may have been edited since the job started, edits are
+            # refused from here on until the knowledge base is done
+            kb_state["file_ids"] = (knowledge.data or {}).get("file_ids", [])
+            kb_state["status"] = "running"
+            await self._save()
+
+        finished = set(kb_state["done"]) | {f["file_id"] for f in kb_state["failed"]}
+        files = Files.get_files_by_ids(
+            [file_id for file_id in kb_state["file_ids"] if file_id not in finished]
+        )
+
+        semaphore = asyncio.Semaphore(KNOWLEDGE_REINDEX_MAX_WORKERS)
+
+        async def reindex_file(file):
+            async with semaphore:
+                try:
+                    await asyncio.to_thread(
+                        self._reindex_file,
+                        request,
+                        user,
+                        knowledge_id,
+                        collection_name,
+                        file,
+                    )
+                    kb_state["done"].append(file.id)
+                except Exception as e:
+                    log.error(
+                        f"Error processing file {file.filename} (ID: {file.id}): {str(e)}"
+                    )
+                    kb_state["failed"].append({"file_id": file.id, "error": str(e)})
+                await self._save()
+
+        # Concurrent inserts into a collection that does not exist yet race on
+        # creating it in some backends, so files go one by one until it exists.
+        while files and not VECTOR_DB_CLIENT.has_collection(
+            collection_name=collection_name
+        ):
+            await reindex_file(files.pop(0))
+
+        await asyncio.gather(*[reindex_file(file) for file in files])
+
+        if shadow:
+            if VECTOR_DB_CLIENT.has_collection(collection_name=collection_name):
+                await asyncio.to_thread(
+                    self._replace_collection, collection_name, knowledge_id, swap
+                )
+            elif not kb_state["file_ids"]:
+                # Empty knowledge base, nothing to swap in
+                if VECTOR_DB_CLIENT.has_collection(collection_name=knowledge_id):
+                    VECTOR_DB_CLIENT.delete_collection(collection_name=knowledge_id)
+            else:
+                # Every file failed, keep serving the previous vectors
+                kb_state["status"] = "failed"
+                await self._save()
+                return
+
+        if kb_state["failed"]:
+            log.warning(
+                f"Failed to process {len(kb_state['failed'])} files in knowledge base {knowledge_id}"
+            )
+            for failed in kb_state["failed"]:
+                log.warning(f"File ID: {failed['file_id']}, Error: {failed['error']}")
+
+        kb_state["status"] = "completed"
+        await self._save()
+
+    def _replace_collection(self, collection_name: str, knowledge_id: str, swap):
+        if swap:
+            VECTOR_DB_CLIENT.rename_collection(collection_name, knowledge_id)
+            return
+
+        # Dropped first so the copy recreates it with the new vector dimension,
+        # searches find nothing until the copy is done.
+        if VECTOR_DB_CLIENT.has_collection(collection_name=knowledge_id):
+            VECTOR_DB_CLIENT.delete_collection(collection_name=knowledge_id)
+        if not VECTOR_DB_CLIENT.copy(collection_name, knowledge_id):
+            raise RuntimeError(
+                f"Failed to copy {collection_name} into {knowledge_id}, the shadow collection is kept"
+            )
+        VECTOR_DB_CLIENT.delete_collection(collection_name=collection_name)
+
+    def _reindex_file(
+        self, request: Request, user, knowledge_id: str, collection_name: str, file
+    ):
+        # A resumed job may have written part of this file already
+        if VECTOR_DB_CLIENT.has_collection(collection_name=collection_name):
+            VECTOR_DB_CLIENT.delete(
+                collection_name=collection_name, filter={"file_id": file.id}
+            )
+
+        process_file(
+            request,
+            ProcessFileForm(file_id=file.id, collection_name=collection_name),
+            user=user,
+        )
+
+        # process_file records the collection it wrote to; point the file back
+        # at the live collection the shadow is about to replace.
+        Files.update_file_metadata_by_id(file.id, {"collection_name": knowledge_id})
+
+
+KNOWLEDGE_REINDEX_JOB = KnowledgeReindexJob()
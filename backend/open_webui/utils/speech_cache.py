@@ -0,0 +1,180 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from open_webui.config import CACHE_DIR
+from open_webui.env import (
+    SPEECH_CACHE_MAX_SIZE_MB,
+    SPEECH_CACHE_TTL,
+    SRC_LOG_LEVELS,
+)
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["AUDIO"])
+
+
+SPEECH_CACHE_DIR = CACHE_DIR / "audio" / "speech"
+
+
+class SpeechCache:
+    """
+    Size and TTL bounded cache for synthesised speech clips.
+
+    Clips are stored as `<key>.mp3` files, with their voice metadata in a
+    `<key>.json` file next to them. The directory is the only state: a hit
+    refreshes the clip's modification time, and eviction scans the directory
+    and drops the least recently used clips. Workers sharing the directory
+    therefore share one bound.
+    """
+
+    # Temporary files left behind by a crashed write are removed after this
+    PART_FILE_TTL = 3600
+
+    def __init__(self, directory: Path, max_size: int = 0, ttl: int = 0):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self.max_size = max_size
+        self.ttl = ttl
+
+        # Per-process counters
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_path(self, key: str) -> Path:
+        return self.directory / f"{key}.mp3"
+
+    def get_metadata_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _count(self, counter: str, n: int = 1):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + n)
+
+    def _remove(self, key: str):
+        for path in (self.get_path(key), self.get_metadata_path(key)):
+            try:
+                path.unlink(missing_ok=True)
+            except Exception as e:
+                log.warning(f"Failed to remove cached speech file {path}: {e}")
+
+    def _scan(self) -> list[tuple[str, int, float]]:
+        """Clips on disk as (key, size, last access), least recently used first."""
+        clips = []
+        now = time.time()
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                try:
+                    if entry.name.endswith(".mp3"):
+                        stat = entry.stat()
+                        clips.append((entry.name[:-4], stat.st_size, stat.st_mtime))
+                    elif entry.name.endswith(".part"):
+                        if now - entry.stat().st_mtime > self.PART_FILE_TTL:
+                            os.unlink(entry.path)
+                except FileNotFoundError:
+                    # Removed by another worker meanwhile
+                    continue
+        return sorted(clips, key=lambda clip: clip[2])
+
+    def _is_expired(self, last_accessed: float, now: float) -> bool:
+        return self.ttl > 0 and now - last_accessed > self.ttl
+
+    def _evict(self, keep: Optional[str] = None):
+        now = time.time()
+        clips = self._scan()
+        size = sum(clip_size for _, clip_size, _ in clips)
+
+        evicted = 0
+        for key, clip_size, last_accessed in clips:
+            if key == keep:
+                continue
+            if self._is_expired(last_accessed, now) or (
+                self.max_size > 0 and size > self.max_size
+            ):
+                self._remove(key)
+                size -= clip_size
+                evicted += 1
+        if evicted:
+            self._count("evictions", evicted)
+
+    def get(self, key: str) -> Optional[Path]:
+        """Return the cached clip for `key`, refreshing its LRU position."""
+        path = self.get_path(key)
+        try:
+            if self._is_expired(path.stat().st_mtime, time.time()):
+                self._remove(key)
+                raise FileNotFoundError(path)
+            os.utime(path)
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+
+        self._count("hits")
+        return path
+
+    def put(self, key: str, data: bytes, metadata: Optional[dict] = None) -> Path:
+        """Store `data` under `key` and evict older clips to honour the bounds."""
+        path = self.get_path(key)
+
+        # Unique temporary names, concurrent writes of a key must not share one
+        for target, content in (
+            (self.get_metadata_path(key), json.dumps(metadata or {}).encode("utf-8")),
+            (path, data),
+        ):
+            with tempfile.NamedTemporaryFile(
+                dir=self.directory, suffix=".part", delete=False
+            ) as f:
+                f.write(content)
+            os.replace(f.name, target)
+
+        self._evict(keep=key)
+        return path
+
+    def clear(self):
+        for key, _, _ in self._scan():
+            self._remove(key)
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def get_stats(self) -> dict:
+        clips = self._scan()
+
+        voices = {}
+        for key, _, _ in clips:
+            try:
+                with open(self.get_metadata_path(key), "r") as f:
+                    voice = json.load(f).get("voice")
+            except Exception:
+                voice = None
+            voice = voice or "default"
+            voices[voice] = voices.get(voice, 0) + 1
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(clips),
+                "size": sum(size for _, size, _ in clips),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "voices": voices,
+            }
+
+
+SPEECH_CACHE = SpeechCache(
+    SPEECH_CACHE_DIR,
+    max_size=SPEECH_CACHE_MAX_SIZE_MB * 1024 * 1024,
+    ttl=SPEECH_CACHE_TTL,
+)
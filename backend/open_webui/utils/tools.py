@@ -2,6 +2,8 @@ import inspect
 import logging
 import re
 import inspect
+import threading
+import time
 import aiohttp
 import asyncio
 import yaml
@@ -33,16 +35,20 @@ from langchain_core.utils.function_calling import (
 )
 
 
-from open_webui.models.tools import Tools
+from open_webui.models.tools import ToolModel, Tools
 from open_webui.models.users import UserModel
 from open_webui.utils.plugin import load_tool_module_by_id
 from open_webui.env import (
     SRC_LOG_LEVELS,
     AIOHTTP_CLIENT_TIMEOUT_TOOL_SERVER_DATA,
     AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL,
+    TOOL_CALL_MAX_CONCURRENCY,
+    TOOL_CALL_TIMEOUT,
+    TOOL_REGISTRY_CACHE_TTL,
 )
 
 import copy
+from uuid import uuid4
 
 # 设置日志记录器
 log = logging.getLogger(__name__)
@@ -75,14 +81,165 @@ def get_async_tool_function_and_apply_extra_params(
         update_wrapper(partial_func, function)
         return partial_func
     else:
-        # 将同步函数转换为协程函数
+        # 将同步函数转换为协程函数，在线程中运行以免阻塞事件循环
         async def new_function(*args, **kwargs):
-            return partial_func(*args, **kwargs)
+            return await asyncio.to_thread(partial_func, *args, **kwargs)
 
         update_wrapper(new_function, function)
         return new_function
 
 
+def normalize_tool_spec(spec: dict, function: Callable) -> dict:
+    """
+    返回适用于 OpenAI API 的工具规格副本，不修改原规格
+
+    修复参数类型、移除内部保留参数（如 __id__, __user__），
+    并使用函数文档字符串的首段作为描述。
+    """
+    spec = copy.deepcopy(spec)
+    properties = spec.get("parameters", {}).get("properties", {})
+
+    # 修复OpenAI API类型问题
+    for val in properties.values():
+        if val.get("type") == "str":
+            val["type"] = "string"
+
+    # 移除内部保留参数
+    spec.setdefault("parameters", {})["properties"] = {
+        key: val for key, val in properties.items() if not key.startswith("__")
+    }
+
+    # 处理函数描述
+    if function.__doc__ and function.__doc__.strip() != "":
+        spec["description"] = re.split(":(param|return)", function.__doc__, 1)[0]
+    else:
+        spec["description"] = spec["name"]
+
+    return spec
+
+
+class ToolRegistry:
+    """
+    已编译的本地工具缓存，使构建每个请求的工具字典只需一次查找
+
+    每个工具按版本（updated_at，更新控制阀时也会更新）和已加载的模块编译一次：
+    规格在编译时规范化，控制阀在编译时校验。用户控制阀按用户及其取值校验一次。
+    缓存的工具最多每 ttl 秒与数据库核对一次版本，
+    通过本进程进行的更新会调用 invalidate 立即失效。
+    """
+
+    def __init__(self, ttl: int = 10):
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._tools: dict[str, dict] = {}
+        self._user_valves: dict[tuple[str, str], tuple[int, dict, BaseModel]] = {}
+
+    def invalidate(self, tool_id: str) -> None:
+        with self._lock:
+            self._tools.pop(tool_id, None)
+            for key in [key for key in self._user_valves if key[0] == tool_id]:
+                del self._user_valves[key]
+
+    def get_tool(self, request: Request, tool_id: str) -> Optional[dict]:
+        """
+        获取已编译的工具，工具不存在时返回 None
+
+        返回的字典包含 module、valves、functions（函数名、规格、函数）和 metadata，
+        调用方不应修改其中的内容。
+        """
+        module = request.app.state.TOOLS.get(tool_id, None)
+        entry = self._tools.get(tool_id)
+
+        if entry is not None and entry["module"] is module:
+            if time.time() - entry["checked_at"] <= self.ttl:
+                return entry
+
+        tool = Tools.get_tool_by_id(tool_id)
+        if tool is None:
+            with self._lock:
+                self._tools.pop(tool_id, None)
+            return None
+
+        if (
+            entry is not None
+            and entry["module"] is module
+            and entry["version"] == tool.updated_at
+        ):
+            entry["checked_at"] = time.time()
+            return entry
+
+        if module is None:
+            # 如果模块未加载，则加载工具模块
+            module, _ = load_tool_module_by_id(tool_id)
+            request.app.state.TOOLS[tool_id] = module
+
+        entry = self._compile(tool, module)
+        with self._lock:
+            self._tools[tool_id] = entry
+        return entry
+
+    def _compile(self, tool: ToolModel, module) -> dict:
+        # 设置工具的控制阀
+        valves = None
+        if hasattr(module, "valves") and hasattr(module, "Valves"):
+            valves = module.Valves(**(Tools.get_tool_valves_by_id(tool.id) or {}))
+            module.valves = valves
+
+        functions = []
+        for spec in tool.specs:
+            function = getattr(module, spec["name"])
+            functions.append(
+                (spec["name"], normalize_tool_spec(spec, function), function)
+            )
+
+        return {
+            "version": tool.updated_at,
+            "checked_at": time.time(),
+            "module": module,
+            "valves": valves,
+            "functions": functions,
+            "metadata": {
+                "file_handler": hasattr(module, "file_handler") and module.file_handler,
+                "citation": hasattr(module, "citation") and module.citation,
+                # 工具可通过模块级 timeout 属性覆盖默认的调用超时（秒）
+                "timeout": getattr(module, "timeout", TOOL_CALL_TIMEOUT),
+            },
+        }
+
+    def get_user_valves(self, entry: dict, tool_id: str, user: UserModel):
+        """
+        获取用户对该工具的控制阀，工具未定义 UserValves 时返回 None
+
+        用户设置随请求中的用户对象一同加载，无需再查询数据库。
+        """
+        module = entry["module"]
+        if not hasattr(module, "UserValves"):
+            return None
+
+        settings = getattr(user, "settings", None)
+        if settings is not None:
+            settings = settings.model_dump()
+            values = settings.get("tools", {}).get("valves", {}).get(tool_id, {})
+        else:
+            values = Tools.get_user_valves_by_id_and_user_id(tool_id, user.id) or {}
+
+        key = (tool_id, user.id)
+        cached = self._user_valves.get(key)
+        if cached is not None and cached[0] == entry["version"] and cached[1] == values:
+            valves = cached[2]
+        else:
+            valves = module.UserValves(**values)
+            with self._lock:
+                self._user_valves[key] = (entry["version"], values, valves)
+
+        # 每个请求使用独立副本，避免工具修改影响其他请求
+        return valves.model_copy()
+
+
+TOOL_REGISTRY = ToolRegistry(TOOL_REGISTRY_CACHE_TTL)
+
+
 def get_tools(
     request: Request, tool_ids: list[str], user: UserModel, extra_params: dict
 ) -> dict[str, dict]:
@@ -91,6 +248,7 @@ def get_tools(
     
     根据提供的工具ID列表，获取对应的工具函数和规格，用于AI函数调用。
     支持两种类型的工具：本地工具和远程工具服务器工具。
+    本地工具的规格和控制阀由 TOOL_REGISTRY 缓存，返回的规格在请求间共享，不应修改。
     
     参数:
         request: FastAPI请求对象
@@ -104,8 +262,8 @@ def get_tools(
     tools_dict = {}
 
     for tool_id in tool_ids:
-        # 尝试从数据库获取工具
-        tool = Tools.get_tool_by_id(tool_id)
+        # 尝试从缓存或数据库获取工具
+        tool = TOOL_REGISTRY.get_tool(request, tool_id)
         if tool is None:
             # 如果是远程工具服务器工具
             if tool_id.startswith("server:"):
@@ -174,62 +332,25 @@ def get_tools(
             else:
                 continue
         else:
-            # 处理本地工具
-            module = request.app.state.TOOLS.get(tool_id, None)
-            if module is None:
-                # 如果模块未加载，则加载工具模块
-                module, _ = load_tool_module_by_id(tool_id)
-                request.app.state.TOOLS[tool_id] = module
-
-            # 添加工具ID到额外参数中
-            extra_params["__id__"] = tool_id
-
-            # 设置工具的控制阀
-            if hasattr(module, "valves") and hasattr(module, "Valves"):
-                valves = Tools.get_tool_valves_by_id(tool_id) or {}
-                module.valves = module.Valves(**valves)
-            if hasattr(module, "UserValves"):
-                extra_params["__user__"]["valves"] = module.UserValves(  # type: ignore
-                    **Tools.get_user_valves_by_id_and_user_id(tool_id, user.id)
-                )
+            # 处理本地工具，添加工具ID和用户控制阀到额外参数中
+            params = {**extra_params, "__id__": tool_id}
 
-            for spec in tool.specs:
-                # 修复OpenAI API类型问题
-                for val in spec.get("parameters", {}).get("properties", {}).values():
-                    if val.get("type") == "str":
-                        val["type"] = "string"
-
-                # 移除内部保留参数（如 __id__, __user__）
-                spec["parameters"]["properties"] = {
-                    key: val
-                    for key, val in spec["parameters"]["properties"].items()
-                    if not key.startswith("__")
-                }
+            user_valves = TOOL_REGISTRY.get_user_valves(tool, tool_id, user)
+            if user_valves is not None:
+                params["__user__"] = {**extra_params["__user__"], "valves": user_valves}
 
+            for function_name, spec, tool_function in tool["functions"]:
                 # 获取函数并应用额外参数
-                function_name = spec["name"]
-                tool_function = getattr(module, function_name)
                 callable = get_async_tool_function_and_apply_extra_params(
-                    tool_function, extra_params
+                    tool_function, params
                 )
 
-                # 处理函数描述
-                if callable.__doc__ and callable.__doc__.strip() != "":
-                    s = re.split(":(param|return)", callable.__doc__, 1)
-                    spec["description"] = s[0]
-                else:
-                    spec["description"] = function_name
-
                 tool_dict = {
                     "tool_id": tool_id,
                     "callable": callable,
                     "spec": spec,
                     # 其他信息
-                    "metadata": {
-                        "file_handler": hasattr(module, "file_handler")
-                        and module.file_handler,
-                        "citation": hasattr(module, "citation") and module.citation,
-                    },
+                    "metadata": tool["metadata"],
                 }
 
                 # 处理函数名冲突
@@ -244,6 +365,92 @@ def get_tools(
     return tools_dict
 
 
+async def execute_tool_call(
+    tool: dict,
+    tool_name: str,
+    tool_function_params: dict,
+    event_caller: Optional[Callable] = None,
+    metadata: Optional[dict] = None,
+) -> Any:
+    """
+    执行单个工具调用
+
+    直连工具通过 event_caller 交由客户端执行，其余工具直接调用其 callable。
+    调用受工具自身的 timeout（未设置时为 TOOL_CALL_TIMEOUT）限制，
+    超时或出错时返回错误信息字符串而不是抛出异常，以免影响同批次的其他调用。
+
+    参数:
+        tool: get_tools 返回的工具字典
+        tool_name: 工具函数名
+        tool_function_params: 已按规格过滤的调用参数
+        event_caller: 事件调用函数，用于直连工具
+        metadata: 请求元数据
+
+    返回:
+        工具调用结果
+    """
+    timeout = tool.get("metadata", {}).get("timeout", TOOL_CALL_TIMEOUT)
+
+    try:
+        if tool.get("direct", False):
+            coroutine = event_caller(
+                {
+                    "type": "execute:tool",
+                    "data": {
+                        "id": str(uuid4()),
+                        "name": tool_name,
+                        "params": tool_function_params,
+                        "server": tool.get("server", {}),
+                        "session_id": (metadata or {}).get("session_id", None),
+                    },
+                }
+            )
+        else:
+            coroutine = tool["callable"](**tool_function_params)
+
+        if timeout:
+            return await asyncio.wait_for(coroutine, timeout=timeout)
+        return await coroutine
+    except asyncio.TimeoutError:
+        log.warning(f"Tool {tool_name} timed out after {timeout} seconds")
+        return f"Tool {tool_name} timed out after {timeout} seconds"
+    except Exception as e:
+        return str(e)
+
+
+async def gather_tool_calls(
+    tool_calls: list,
+    handler: Callable[[Any], Awaitable[Any]],
+    on_result: Optional[Callable[[Any], Awaitable[None]]] = None,
+    limit: int = TOOL_CALL_MAX_CONCURRENCY,
+) -> list:
+    """
+    并发执行一批工具调用，最多同时运行 limit 个
+
+    返回结果与 tool_calls 顺序一致；每个调用完成时立即以其结果调用 on_result，
+    便于逐个推送状态事件。
+
+    参数:
+        tool_calls: 工具调用列表
+        handler: 处理单个工具调用的协程函数
+        on_result: 可选，单个调用完成时的回调
+        limit: 最大并发数
+
+    返回:
+        按原顺序排列的结果列表
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(tool_call):
+        async with semaphore:
+            result = await handler(tool_call)
+        if on_result:
+            await on_result(result)
+        return result
+
+    return await asyncio.gather(*[run(tool_call) for tool_call in tool_calls])
+
+
 def parse_description(docstring: str | None) -> str:
     """
     解析函数的文档字符串以提取描述信息